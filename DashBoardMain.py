@@ -6,6 +6,8 @@ from PyQt6.QtCore import Qt
 from DashBoard_Ui.frame_top import FrameTop
 from DashBoard_Ui.frame_left import FrameLeft
 from DashBoard_Ui.frame_center import FrameCenter
+from db_manager import close_read_pool
+from ui_scheduler import get_scheduler
 
 
 class MainWindow(QMainWindow):
@@ -55,6 +57,8 @@ class MainWindow(QMainWindow):
 
 if __name__ == "__main__":
     app = QApplication(sys.argv)
+    app.aboutToQuit.connect(close_read_pool)
+    app.aboutToQuit.connect(get_scheduler().print_report)
     window = MainWindow()
     window.showMaximized()
     sys.exit(app.exec())
@@ -0,0 +1,101 @@
+# DashBoard_Ui/data_loader.py
+from PyQt6.QtCore import QObject, QRunnable, QThreadPool, pyqtSignal
+
+
+class _LoadSignals(QObject):
+    finished = pyqtSignal(str, int, object)     # key, generation, result
+    failed = pyqtSignal(str, int, str)          # key, generation, message
+
+
+class _LoadTask(QRunnable):
+    def __init__(self, key, generation, func, is_stale, signals):
+        super().__init__()
+        self.key = key
+        self.generation = generation
+        self.func = func
+        self.is_stale = is_stale
+        self.signals = signals
+
+    def run(self):
+        # 시작 전에 이미 새 요청이 들어왔으면 실행하지 않음
+        if self.is_stale():
+            return
+
+        try:
+            result = self.func(self.is_stale)
+        except Exception as e:
+            if not self.is_stale():
+                self.signals.failed.emit(self.key, self.generation, str(e))
+            return
+
+        self.signals.finished.emit(self.key, self.generation, result)
+
+
+# ----------------------------------------------------------------------
+# 백그라운드 데이터 로더
+# ----------------------------------------------------------------------
+class DataLoader(QObject):
+    """
+    키(예: parent 이름)별로 조회 작업을 QThreadPool 에서 실행한다.
+    요청마다 세대 번호를 올리고, 최신 세대가 아닌 결과는 버린다.
+
+    func(is_stale) 는 워커 스레드에서 실행되므로 위젯에 접근하면 안 된다.
+    오래 걸리는 쿼리는 is_stale() 로 중단 여부를 확인할 수 있다.
+    """
+
+    loaded = pyqtSignal(str, object)
+    failed = pyqtSignal(str, str)
+
+    def __init__(self, max_threads: int = 2, parent=None):
+        super().__init__(parent)
+
+        self.pool = QThreadPool(self)
+        self.pool.setMaxThreadCount(max_threads)
+
+        self._generation = {}
+        self._pending = set()
+        self.dropped = 0
+
+        self._signals = _LoadSignals()
+        self._signals.finished.connect(self._on_finished)
+        self._signals.failed.connect(self._on_failed)
+
+    # ---------------------------------------------------------
+    def submit(self, key: str, func) -> int:
+        gen = self._generation.get(key, 0) + 1
+        self._generation[key] = gen
+        self._pending.add(key)
+
+        def is_stale(key=key, gen=gen):
+            return self._generation.get(key) != gen
+
+        self.pool.start(_LoadTask(key, gen, func, is_stale, self._signals))
+        return gen
+
+    def cancel(self, key: str):
+        """진행 중인 요청 결과를 버리고, 쿼리는 is_stale() 로 중단"""
+        if key in self._generation:
+            self._generation[key] += 1
+        self._pending.discard(key)
+
+    def cancel_all(self):
+        for key in list(self._generation):
+            self.cancel(key)
+        self.pool.clear()
+
+    def pending(self, key: str) -> bool:
+        return key in self._pending
+
+    # ---------------------------------------------------------
+    def _on_finished(self, key, gen, result):
+        if self._generation.get(key) != gen:
+            self.dropped += 1
+            return
+        self._pending.discard(key)
+        self.loaded.emit(key, result)
+
+    def _on_failed(self, key, gen, message):
+        if self._generation.get(key) != gen:
+            return
+        self._pending.discard(key)
+        self.failed.emit(key, message)
@@ -1,6 +1,7 @@
 from PyQt6.QtWidgets import (
     QFrame, QVBoxLayout, QHBoxLayout, QLabel, QPushButton,
-    QWidget, QDateTimeEdit, QDialog, QSizePolicy, QFileDialog, QGridLayout, QScrollArea
+    QWidget, QDateTimeEdit, QDialog, QSizePolicy, QFileDialog, QGridLayout, QScrollArea,
+    QComboBox
 )
 from reportlab.lib.enums import TA_RIGHT, TA_CENTER
 from reportlab.lib.pagesizes import A4
@@ -15,11 +16,17 @@ from matplotlib.backends.backend_qtagg import NavigationToolbar2QT as Navigation
 from matplotlib.figure import Figure
 import matplotlib.dates as mdates
 from matplotlib import rc
-from db_manager import get_connection
+from db_manager import ensure_datetime_index
+from vlbi_core.device_map import TABLE_MAP
+from vlbi_core.series_store import to_epoch_ms
+from vlbi_core.downsample import METHODS as DOWNSAMPLE_METHODS, DEFAULT_POINTS
+from vlbi_core.series_loader import TIME_RANGE_DELTA, load_full, load_tail, apply_tail
+from vlbi_core.report import build_item, build_report_items
+from DashBoard_Ui.data_loader import DataLoader
 from datetime import datetime, timedelta
-import numpy as np
 import matplotlib as mpl
 import os
+import time
 
 from reportlab.pdfbase import pdfmetrics
 from reportlab.pdfbase.ttfonts import TTFont
@@ -31,143 +38,11 @@ pdfmetrics.registerFont(TTFont('MalgunGothic-Bold', 'C:/Windows/Fonts/malgunbd.t
 rc("font", family="Malgun Gothic")
 mpl.rcParams['axes.unicode_minus'] = False
 
-# ----------------------------------------------------------------------
-#  DB 매핑: 좌측 메뉴 텍스트  →  테이블 / 컬럼명
-# ----------------------------------------------------------------------
-TABLE_MAP = {
-    "2GHz 수신기 상태 모니터": {
-        "table": "frontend_2ghz",
-        "columns": {
-            "Normal Temperature RF":           "NormalTemp_RF",
-            "Normal Temperature Load":         "NormalTemp_Load",
-            "LNA Monitor LHCP Vd":             "LNA_LHCP_Vd1",
-            "LNA Monitor LHCP Id":             "LNA_LHCP_Id1",
-            "LNA Monitor RHCP Vd":             "LNA_RHCP_Vd1",
-            "LNA Monitor RHCP Id":             "LNA_RHCP_Id1",
-            "Cryogenic Temperature Cold":      "Cryo_ColdPla",
-            "Cryogenic Temperature Shild Box": "Cryo_ShieldBox",
-            "Pressure Sensor CH1":             "Pressure",
-            "RF out Power RHCP":               "RF_RHCP",
-            "RF out Power LHCP":               "RF_LHCP",
-        }
-    },
-    "8GHz 수신기 상태 모니터": {
-        "table": "frontend_8ghz",
-        "columns": {
-            "Normal Temperature RF":           "NormalTemp_RF",
-            "Normal Temperature Load":         "NormalTemp_Load",
-            "LNA Monitor LHCP Vg1":            "LNA_LHCP_Vg1",
-            "LNA Monitor LHCP Vg2":            "LNA_LHCP_Vg2",
-            "LNA Monitor RHCP Vd":             "LNA_RHCP_Vd1",
-            "LNA Monitor RHCP Id":             "LNA_RHCP_Id1",
-            # ★ 오타 수정: NA_RHCP_Vg1/Vg2 → LNA_RHCP_Vg1/Vg2
-            "LNA Monitor RHCP Vg1":            "LNA_RHCP_Vg1",
-            "LNA Monitor RHCP Vg2":            "LNA_RHCP_Vg2",
-            "LNA Monitor LHCP Vd":             "LNA_LHCP_Vd1",
-            "LNA Monitor LHCP Id":             "LNA_LHCP_Id1",
-            "Cryogenic Temperature Cold":      "Cryo_ColdPla",
-            "Cryogenic Temperature Shild Box": "Cryo_ShieldBox",
-            "Pressure Sensor CH1":             "Pressure",
-            "RF out Power RHCP":               "RF_RHCP",
-            "RF out Power LHCP":               "RF_LHCP",
-        }
-    },
-    "22GHz 수신기 상태 모니터": {
-        "table": "frontend_22ghz",
-        "columns": {
-            "Normal Temperature RF":           "NormalTemp_RF",
-            "Normal Temperature LO":           "NormalTemp_Load",
-            "LNA Monitor LHCP Vg1":            "LNA_LHCP_Vg1",
-            "LNA Monitor LHCP Vg2":            "LNA_LHCP_Vg2",
-            "LNA Monitor RHCP Vd":             "LNA_RHCP_Vd1",
-            "LNA Monitor RHCP Id":             "LNA_RHCP_Id1",
-            # ★ 오타 수정
-            "LNA Monitor RHCP Vg1":            "LNA_RHCP_Vg1",
-            "LNA Monitor RHCP Vg2":            "LNA_RHCP_Vg2",
-            "LNA Monitor LHCP Vd":             "LNA_LHCP_Vd1",
-            "LNA Monitor LHCP Id":             "LNA_LHCP_Id1",
-            "Cryogenic Temperature Cold":      "Cryo_ColdPla",
-            "Cryogenic Temperature Shild Box": "Cryo_ShieldBox",
-            "Pressure Sensor CH1":             "Pressure",
-            "RF out Power RF":                 "RF_RHCP",
-            "RF out Power LO":                 "RF_Low",
-        }
-    },
-    "43GHz 수신기 상태 모니터": {
-        "table": "frontend_43ghz",
-        "columns": {
-            "Normal Temperature RF":           "NormalTemp_RF",
-            "Normal Temperature LO":           "NormalTemp_Load",
-            "LNA Monitor LHCP Vg1":            "LNA_LHCP_Vg1",
-            "LNA Monitor LHCP Vg2":            "LNA_LHCP_Vg2",
-            "LNA Monitor RHCP Vd":             "LNA_RHCP_Vd1",
-            "LNA Monitor RHCP Id":             "LNA_RHCP_Id1",
-            # ★ 오타 수정
-            "LNA Monitor RHCP Vg1":            "LNA_RHCP_Vg1",
-            "LNA Monitor RHCP Vg2":            "LNA_RHCP_Vg2",
-            "LNA Monitor LHCP Vd":             "LNA_LHCP_Vd1",
-            "LNA Monitor LHCP Id":             "LNA_LHCP_Id1",
-            "Cryogenic Temperature Cold":      "Cryo_ColdPla",
-            "Cryogenic Temperature Shild Box": "Cryo_ShieldBox",
-            "Pressure Sensor CH1":             "Pressure",
-            "RF out Power RHCP":               "RF_RHCP",
-            "RF out Power LHCP":               "RF_LHCP",
-            "RF out Power LO":                 "RF_Low",
-        }
-    },
-    "S/X 다운 컨버터": {
-        "table": "SXDown",
-        "columns": {
-            "S":  "SLEVEL",
-            "X1": "X1LEVEL",
-            "X2": "X2LEVEL",
-        }
-    },
-    "K 다운 컨버터": {
-        "table": "KDown",
-        "columns": {
-            "K1": "K1LEVEL",
-            "K2": "K2LEVEL",
-            "K3": "K3LEVEL",
-            "K4": "K4LEVEL",
-        }
-    },
-    "Q 다운 컨버터": {
-        "table": "QDown",
-        "columns": {
-            "Q1": "Q1LEVEL",
-            "Q2": "Q2LEVEL",
-            "Q3": "Q3LEVEL",
-            "Q4": "Q4LEVEL",
-        }
-    },
-    # Video Converter 1: 실제 테이블 없음 → 그래프 없음 처리용
-    "Video Converter 1": {
-        "table": None,
-        "columns": {}
-    },
-    # Video Converter 2: FrameLeft에서 CH9~CH16 사용
-    "Video Converter 2": {
-        "table": "VideoConverter2",
-        "columns": {
-            "CH9":  "CH9LEVEL",
-            "CH10": "CH10LEVEL",
-            "CH11": "CH11LEVEL",
-            "CH12": "CH12LEVEL",
-            "CH13": "CH13LEVEL",
-            "CH14": "CH14LEVEL",
-            "CH15": "CH15LEVEL",
-            "CH16": "CH16LEVEL",
-        }
-    },
-    # IF Selector: CH1~CH16
-    "IF Selector": {
-        "table": "IFselector",
-        "columns": {
-            **{f"CH{i}": f"CH{i}LEVEL" for i in range(1, 17)}
-        }
-    },
-}
+# PDF 그래프 (7inch × 120dpi) 폭 기준 포인트 수
+PDF_PLOT_POINTS = 840
+
+# 이보다 오래 걸린 그래프 갱신은 로그 출력 (ms)
+SLOW_REDRAW_MS = 200
 
 
 # ----------------------------------------------------------------------
@@ -218,6 +93,91 @@ class CustomRangeDialog(QDialog):
         )
 
 
+# ----------------------------------------------------------------------
+# 그래프 카드 (그래프 + 하단 통계). Figure/axes 는 카드 수명 동안 유지
+# ----------------------------------------------------------------------
+class GraphCard(QFrame):
+    def __init__(self, title: str, parent=None):
+        super().__init__(parent)
+
+        self.setStyleSheet(
+            """
+            QFrame {
+                background-color:#020617;
+                border:1px solid #1E293B;
+                border-radius:10px;
+            }
+            """
+        )
+        self.setSizePolicy(
+            QSizePolicy.Policy.Expanding, QSizePolicy.Policy.Expanding
+        )
+
+        self.setMinimumHeight(300)
+
+        v = QVBoxLayout(self)
+        v.setContentsMargins(10, 8, 10, 8)
+        v.setSpacing(4)
+
+        self.fig = Figure(facecolor="#020617")
+        self.canvas = FigureCanvas(self.fig)
+        self.canvas.setSizePolicy(
+            QSizePolicy.Policy.Expanding, QSizePolicy.Policy.Expanding
+        )
+
+        self.ax = self.fig.add_subplot(111)
+        self.ax.set_facecolor("#020617")
+        for spine in self.ax.spines.values():
+            spine.set_color("#1E293B")
+
+        self.ax.grid(True, color="#1E293B", linestyle="--", linewidth=0.5)
+        self.ax.tick_params(axis="x", colors="white")
+        self.ax.tick_params(axis="y", colors="white")
+        self.ax.set_title(title, color="white", fontsize=10, pad=6)
+
+        # 첫 데이터가 들어올 때 생성 (datetime 축 단위 설정)
+        self.line = None
+
+        self.loading_label = QLabel("불러오는 중...")
+        self.loading_label.setAlignment(Qt.AlignmentFlag.AlignRight)
+        self.loading_label.setStyleSheet("color:#F59E0B; font-size:9pt; border:none;")
+        self.loading_label.setVisible(False)
+
+        v.addWidget(self.loading_label)
+        v.addWidget(self.canvas, stretch=1)
+
+        self.summary_label = QLabel()
+        self.summary_label.setAlignment(Qt.AlignmentFlag.AlignCenter)
+        self.summary_label.setStyleSheet("color:#38BDF8; font-size:10pt; font-weight:bold;")
+
+        v.addWidget(self.summary_label)
+
+        # 마지막으로 그린 데이터 식별자 / 그리기 시간(ms)
+        self.signature = None
+        self.last_draw_ms = 0.0
+
+    def set_loading(self, loading: bool):
+        if self.loading_label.isVisible() != loading:
+            self.loading_label.setVisible(loading)
+
+    def set_data(self, xs, ys, stats, signature):
+        if self.line is None:
+            self.line, = self.ax.plot(xs, ys, linewidth=1.0)
+        else:
+            self.line.set_data(xs, ys)
+            self.ax.relim()
+            self.ax.autoscale_view()
+        self.fig.autofmt_xdate()
+
+        mean_v, max_v, min_v = stats
+        self.summary_label.setText(f"평균: {mean_v:,.2f}    최대: {max_v:,.2f}    최소: {min_v:,.2f}")
+
+        t0 = time.perf_counter()
+        self.canvas.draw()
+        self.last_draw_ms = (time.perf_counter() - t0) * 1000
+        self.signature = signature
+
+
 # ----------------------------------------------------------------------
 #  메인 센터 프레임 (반응형 2×2 카드 + 각 카드 하단 통계)
 # ----------------------------------------------------------------------
@@ -233,7 +193,15 @@ class FrameCenter(QFrame):
         self.selected_children: dict[str, list[str]] = {}
         self.raw: dict[str, dict] = {}
 
+        # (parent, child) → GraphCard, 화면 배치 순서
+        self.cards: dict[tuple, GraphCard] = {}
+        self.card_order: list[tuple] = []
+        self.redraw_stats = {"cards": 0, "redrawn": 0, "elapsed_ms": 0.0}
+
         self.time_range = "24시간"
+
+        # 긴 구간은 분/시/일 집계 테이블에서 조회
+        self.use_rollups = True
         self.custom_start = None
         self.custom_end = None
 
@@ -296,6 +264,25 @@ class FrameCenter(QFrame):
 
         self.time_buttons["24시간"].setChecked(True)
 
+        # 다운샘플링 방식 선택
+        self.sampling_method = "minmax"
+        self.sampling_combo = QComboBox()
+        self.sampling_combo.setFixedHeight(30)
+        self.sampling_combo.setFixedWidth(100)
+        self.sampling_combo.setStyleSheet("""
+            QComboBox {
+                background-color:#1E293B;
+                color:white;
+                border-radius:8px;
+                padding:4px 10px;
+                font-size:10pt;
+            }
+        """)
+        for label, method in DOWNSAMPLE_METHODS.items():
+            self.sampling_combo.addItem(label, method)
+        self.sampling_combo.currentIndexChanged.connect(self._on_sampling_changed)
+        top_layout.addWidget(self.sampling_combo)
+
         self.refresh_btn = QPushButton("새로고침")
         self.refresh_btn.setFixedHeight(30)
         self.refresh_btn.setFixedWidth(90)
@@ -348,8 +335,22 @@ class FrameCenter(QFrame):
         scroll.setWidget(self.cards_container)
         self.main_layout.addWidget(scroll, stretch=1)
 
+        # DB 조회는 백그라운드 스레드에서 (parent 별 최신 요청만 반영)
+        self.loader = DataLoader(parent=self)
+        self.loader.loaded.connect(self._on_data_loaded)
+        self.loader.failed.connect(self._on_data_failed)
+
+        self.loader.pool.start(self.ensure_indexes)
         QTimer.singleShot(50, self.update_graphs)
 
+    # ------------------------------------------------------------------
+    # datetime 인덱스 확인/생성 (구간 조회용)
+    # ------------------------------------------------------------------
+    def ensure_indexes(self):
+        for info in TABLE_MAP.values():
+            if info["table"]:
+                ensure_datetime_index(info["table"])
+
     # ------------------------------------------------------------------
     # 시간 범위 처리
     # ------------------------------------------------------------------
@@ -369,77 +370,35 @@ class FrameCenter(QFrame):
             else:
                 self.time_range = name
 
-            self.update_graphs()
+            # 구간이 바뀌면 해당 구간만 다시 조회
+            self.refresh_all_data()
 
         return handler
 
-    def _get_time_window(self):
+    def _get_time_window(self, parent_name):
 
         # 기간설정이면 이 범위
         if self.time_range == "기간설정" and self.custom_start and self.custom_end:
             return self.custom_start, self.custom_end
 
-        # 전체 raw 데이터 범위
-        all_times = []
-        for parent, raw in self.raw.items():
-            all_times.extend(raw["times"])
-
-        if not all_times:
-            now = datetime.now()
-            return now - timedelta(days=1), now
-
-        return min(all_times), max(all_times)
-
-    def _apply_interval_sampling(self, xs, ys):
-        if self.time_range == "기간설정":
-            return xs, ys
-
-        if self.time_range == "1시간":
-            interval = timedelta(hours=1)
-        elif self.time_range == "6시간":
-            interval = timedelta(hours=6)
-        elif self.time_range == "24시간":
-            interval = timedelta(days=1)
-        elif self.time_range == "7일":
-            interval = timedelta(days=7)
-        else:
-            return xs, ys
-
-        sampled_x = []
-        sampled_y = []
-
-        # -------- 버킷 기준 수정 (핵심!!) --------
-        start_time = xs[0].replace(minute=0, second=0, microsecond=0)
-
-        if self.time_range == "24시간":
-            start_time = start_time.replace(hour=0)
-
-        elif self.time_range == "7일":
-            start_time = start_time - timedelta(days=start_time.weekday())
-            start_time = start_time.replace(hour=0)
+        # 마지막으로 조회한 구간
+        raw = self.raw.get(parent_name)
+        if raw and raw.get("window"):
+            return raw["window"]
 
-        # ---------------------------------------
+        now = datetime.now()
+        return now - TIME_RANGE_DELTA.get(self.time_range, timedelta(days=1)), now
 
-        end_time = xs[-1]
-
-        bucket_start = start_time
-        bucket_end = bucket_start + interval
-
-        idx = 0
-        n = len(xs)
-
-        while bucket_start <= end_time:
-            while idx < n and xs[idx] < bucket_start:
-                idx += 1
-
-            if idx < n and xs[idx] < bucket_end:
-                sampled_x.append(xs[idx])
-                sampled_y.append(ys[idx])
-
-            bucket_start += interval
-            bucket_end += interval
+    def _on_sampling_changed(self, index):
+        self.sampling_method = self.sampling_combo.itemData(index)
+        self.update_graphs()
 
-        return sampled_x, sampled_y
+    def _plot_point_budget(self):
+        """카드 1장(2열 배치)의 캔버스 픽셀 폭 ≈ 그릴 포인트 수"""
+        width = self.cards_container.width() // 2 - 20
+        if width <= 0:
+            return DEFAULT_POINTS
+        return int(width * self.devicePixelRatioF())
 
     # ------------------------------------------------------------------
     #  MainWindow / FrameLeft 에서 호출되는 API
@@ -448,7 +407,7 @@ class FrameCenter(QFrame):
         if parent_name not in self.selected_children:
             self.selected_children[parent_name] = []
 
-        if parent_name not in self.raw:
+        if parent_name not in self.raw and not self.loader.pending(parent_name):
             self.reload_data(parent_name)
 
         self.update_graphs()
@@ -469,7 +428,7 @@ class FrameCenter(QFrame):
                 children.pop(0)
             children.append(child_name)
 
-        if parent_name not in self.raw:
+        if parent_name not in self.raw and not self.loader.pending(parent_name):
             self.reload_data(parent_name)
 
         self.update_graphs()
@@ -482,7 +441,8 @@ class FrameCenter(QFrame):
     # ------------------------------------------------------------------
     def refresh_all_data(self):
         for parent_name in list(self.selected_children.keys()):
-            self.reload_data(parent_name, load_only=True)
+            # 같은 프리셋 구간이면 새로 들어온 행만 추가, 아니면 전체 재조회
+            self.reload_data(parent_name, incremental=True)
         self.update_graphs()
 
     def reset_all(self):
@@ -490,13 +450,11 @@ class FrameCenter(QFrame):
         # FrameCenter 내부 선택 상태 초기화
         self.selected_children.clear()
         self.raw.clear()
+        self.loader.cancel_all()
 
-        # 카드(그래프) 레이아웃 비우기
-        while self.cards_layout.count():
-            item = self.cards_layout.takeAt(0)
-            w = item.widget()
-            if w:
-                w.deleteLater()
+        # 카드(그래프) 제거
+        self._remove_cards(list(self.cards.keys()))
+        self.card_order = []
 
         self.cards_container.update()
 
@@ -506,9 +464,26 @@ class FrameCenter(QFrame):
             self.frame_left.clear_all_selection()
 
     # ------------------------------------------------------------------
-    # DB 로딩
+    # DB 로딩 (요청은 GUI 스레드, 조회/배열 생성은 DataLoader 워커 스레드)
     # ------------------------------------------------------------------
-    def reload_data(self, parent_name, load_only: bool = False):
+    def _load_request(self):
+        """워커에 넘길 현재 화면 상태 스냅샷"""
+        custom = None
+        if self.time_range == "기간설정" and self.custom_start and self.custom_end:
+            custom = (self.custom_start, self.custom_end)
+
+        return {
+            "time_range": self.time_range,
+            "custom": custom,
+            "n_points": self._plot_point_budget(),
+            "use_rollups": self.use_rollups,
+        }
+
+    def reload_data(self, parent_name, incremental: bool = False):
+        """
+        parent 데이터 조회 요청. 결과는 _on_data_loaded 에서 반영된다.
+        incremental=True 이고 같은 프리셋 구간이면 새로 들어온 행만 조회.
+        """
         info = TABLE_MAP.get(parent_name)
         if not info:
             print(f"[FrameCenter] TABLE_MAP 에 없는 parent: {parent_name}")
@@ -519,199 +494,194 @@ class FrameCenter(QFrame):
             print(f"[FrameCenter] 테이블이 없는 parent: {parent_name}")
             return
 
-        wanted_cols = list(dict.fromkeys(info["columns"].values()))
-
-        conn = None
-        try:
-            conn = get_connection(readonly=True)
-            cur = conn.cursor()
-            cur.execute(f"SELECT * FROM {table} ORDER BY datetime ASC")
-            rows = cur.fetchall()
-
-            col_names = [desc[0] for desc in cur.description]
-            col_index = {name: idx for idx, name in enumerate(col_names)}
-
-            if "datetime" not in col_index:
-                print(f"[FrameCenter] {table} 에 datetime 컬럼이 없습니다.")
-                return
+        req = self._load_request()
+        raw = self.raw.get(parent_name)
+
+        if (incremental and raw and req["time_range"] in TIME_RANGE_DELTA
+                and raw["range"] == req["time_range"] and raw["latest"] is not None):
+            latest, select_sql = raw["latest"], raw["select_sql"]
+            delta = TIME_RANGE_DELTA[req["time_range"]]
+            self.loader.submit(
+                parent_name,
+                lambda is_stale: load_tail(table, select_sql, latest, delta, is_stale),
+            )
+        else:
+            self.loader.submit(
+                parent_name,
+                lambda is_stale: load_full(info, req, is_stale),
+            )
 
-            dt_idx = col_index["datetime"]
-        except Exception as e:
-            print(f"[FrameCenter] DB 오류: {e}")
+    def _on_data_loaded(self, parent_name, result):
+        if parent_name not in self.selected_children:
             return
-        finally:
-            if conn is not None:
-                try:
-                    conn.close()
-                except Exception:
-                    pass
 
-        times = []
-        data = {col: [] for col in wanted_cols}
-
-        for row in rows:
-            try:
-                dt = row[dt_idx]
-                if not isinstance(dt, datetime):
-                    dt = datetime.fromisoformat(str(dt))
-            except Exception:
-                continue
-            times.append(dt)
+        if result is None:
+            pass
+        elif "append" in result:
+            self._apply_tail(parent_name, result)
+        else:
+            self.raw[parent_name] = result
 
-            for col in wanted_cols:
-                idx = col_index.get(col)
-                val = row[idx] if idx is not None else None
-                data[col].append(val)
+        self.update_graphs()
 
-        self.raw[parent_name] = {"times": times, "data": data}
+    def _on_data_failed(self, parent_name, message):
+        print(f"[FrameCenter] DB 오류 ({parent_name}): {message}")
+        self.update_graphs()
 
-        if not load_only:
-            self.update_graphs()
+    def _apply_tail(self, parent_name, result):
+        """증분 조회 결과를 store 뒤에 붙인다 (GUI 스레드, 새 행 수에 비례)"""
+        apply_tail(self.raw.get(parent_name), result)
 
     # ------------------------------------------------------------------
     # 현재 선택된 parent/child 기반으로 플롯 데이터 수집
     # ------------------------------------------------------------------
-    def _collect_plot_items(self):
-        start, end = self._get_time_window()
-        plot_items = []
-
+    def _plot_sources(self):
+        """
+        선택된 (parent, child) 별 (key, store, col, window, is_rollup) — 배열 계산 없음.
+        집계 데이터는 컬럼마다 store 가 따로 있다.
+        """
         for parent, child_list in self.selected_children.items():
-            if parent not in self.raw:
+            raw = self.raw.get(parent)
+            if raw is None:
+                continue
+
+            start, end = self._get_time_window(parent)
+            if start is None or end is None:
                 continue
+            start_ms, end_ms = to_epoch_ms(start), to_epoch_ms(end)
 
             info = TABLE_MAP[parent]
-            times = self.raw[parent]["times"]
-            data = self.raw[parent]["data"]
+            rollup = raw.get("rollup")
 
-            # 기간 범위 내 인덱스 추출
-            indices = [i for i, t in enumerate(times) if start <= t <= end]
-            if not indices:
-                continue
+            if rollup is None:
+                store = raw["store"]
+
+                # 기간 범위 (이진 탐색)
+                window = store.window(start_ms, end_ms)
+                if window.start >= window.stop:
+                    continue
 
             for child in child_list:
                 col = info["columns"].get(child)
                 if not col:
                     continue
 
-                xs_raw = [times[i] for i in indices]
-                ys_raw = [data[col][i] for i in indices]
-
-                xs, ys = [], []
-                for x, y in zip(xs_raw, ys_raw):
-                    try:
-                        v = float(y)
-                        if np.isnan(v):
-                            continue
-                        xs.append(x)
-                        ys.append(v)
-                    except Exception:
-                        continue
+                if rollup is None:
+                    yield (parent, child), store, col, window, False
+                    continue
 
-                # 리샘플링 적용
-                xs, ys = self._apply_interval_sampling(xs, ys)
+                agg = rollup.get(col)
+                if agg is None:
+                    continue
+                agg_window = agg.window(start_ms, end_ms)
+                if agg_window.start < agg_window.stop:
+                    yield (parent, child), agg, col, agg_window, True
 
-                if xs:
-                    title = f"{parent} | {child}"  # ← 여기서 title 생성
-                    plot_items.append((title, xs, ys))
+    def _build_plot_item(self, key, store, col, window, n_points, is_rollup=False):
+        return build_item(key, store, col, window, n_points, self.sampling_method, is_rollup)
 
-        return plot_items
+    def _collect_plot_items(self, n_points=None):
+        if n_points is None:
+            n_points = self._plot_point_budget()
+        return build_report_items(self._plot_sources(), n_points, self.sampling_method)
 
     # ------------------------------------------------------------------
-    # 그래프 카드 하나 생성 (그래프 + 하단 통계)
+    # 전체 그래프 갱신 (QGridLayout 2×N 반응형 배치)
+    #   카드는 (parent, child) 로 재사용하고, 데이터/구간이 바뀐 카드만 다시 그림
     # ------------------------------------------------------------------
-    def _create_graph_card(self, title: str, xs, ys):
-        card = QFrame()
-        card.setStyleSheet(
-            """
-            QFrame {
-                background-color:#020617;
-                border:1px solid #1E293B;
-                border-radius:10px;
-            }
-            """
-        )
-        card.setSizePolicy(
-            QSizePolicy.Policy.Expanding, QSizePolicy.Policy.Expanding
-        )
+    def update_graphs(self):
+        t0 = time.perf_counter()
+        n_points = self._plot_point_budget()
 
-        card.setMinimumHeight(300)
+        order = []
+        redrawn = 0
 
-        v = QVBoxLayout(card)
-        v.setContentsMargins(10, 8, 10, 8)
-        v.setSpacing(4)
+        sources = {src[0]: src[1:] for src in self._plot_sources()}
 
-        fig = Figure(facecolor="#020617")
-        canvas = FigureCanvas(fig)
-        canvas.setSizePolicy(
-            QSizePolicy.Policy.Expanding, QSizePolicy.Policy.Expanding
-        )
+        for parent, child_list in self.selected_children.items():
+            loading = self.loader.pending(parent)
 
-        ax = fig.add_subplot(111)
-        ax.set_facecolor("#020617")
-        for spine in ax.spines.values():
-            spine.set_color("#1E293B")
+            for child in child_list:
+                key = (parent, child)
+                card = self.cards.get(key)
+                src = sources.get(key)
 
-        ax.grid(True, color="#1E293B", linestyle="--", linewidth=0.5)
-        ax.tick_params(axis="x", colors="white")
-        ax.tick_params(axis="y", colors="white")
+                if src is None:
+                    # 첫 조회 중이면 빈 카드에 로딩 표시
+                    if not loading:
+                        continue
+                    if card is None:
+                        card = GraphCard(f"{parent} | {child}")
+                        self.cards[key] = card
+                    card.set_loading(True)
+                    order.append(key)
+                    continue
 
-        ax.plot(xs, ys, linewidth=1.0)
-        ax.set_title(title, color="white", fontsize=10, pad=6)
-        fig.autofmt_xdate()
+                store, col, window, is_rollup = src
 
-        v.addWidget(canvas, stretch=1)
+                # 같은 store / 내용(version) / 구간 / 샘플링이면 이전 그림 그대로
+                # (증분 갱신은 같은 store 에 append + trim → 길이·구간이 같아도 내용이 다름)
+                signature = (id(store), store.version, len(store), window.start, window.stop,
+                             self.sampling_method, n_points)
 
-        arr = np.array(ys, dtype=float)
-        mean_v = float(np.mean(arr))
-        min_v = float(np.min(arr))
-        max_v = float(np.max(arr))
+                if card is None or card.signature != signature:
+                    item = self._build_plot_item(key, store, col, window, n_points, is_rollup)
+                    if item is None:
+                        continue
 
-        summary_label = QLabel(f"평균: {mean_v:,.2f}    최대: {max_v:,.2f}    최소: {min_v:,.2f}")
-        summary_label.setAlignment(Qt.AlignmentFlag.AlignCenter)
-        summary_label.setStyleSheet("color:#38BDF8; font-size:10pt; font-weight:bold;")
+                    _, title, xs, ys, stats = item
+                    if card is None:
+                        card = GraphCard(title)
+                        self.cards[key] = card
 
-        v.addWidget(summary_label)
+                    card.set_data(xs, ys, stats, signature)
+                    redrawn += 1
 
-        return card
+                card.set_loading(loading)
+                order.append(key)
 
-    # ------------------------------------------------------------------
-    # 전체 그래프 갱신 (QGridLayout 2×N 반응형 배치)
-    # ------------------------------------------------------------------
-    def update_graphs(self):
-        # 레이아웃 비우기
-        while self.cards_layout.count():
-            item = self.cards_layout.takeAt(0)
-            w = item.widget()
-            lay = item.layout()
-            if w is not None:
-                w.deleteLater()
-            if lay is not None:
-                # 중첩 레이아웃 정리
-                while lay.count():
-                    sub_item = lay.takeAt(0)
-                    if sub_item.widget():
-                        sub_item.widget().deleteLater()
-
-        plot_items = self._collect_plot_items()
-        if not plot_items:
-            self.cards_container.update()
-            return
+        # 더 이상 표시하지 않는 카드 제거
+        self._remove_cards([k for k in self.cards if k not in order])
+
+        if order != self.card_order:
+            self._layout_cards(order)
+
+        elapsed = (time.perf_counter() - t0) * 1000
+        self.redraw_stats = {"cards": len(order), "redrawn": redrawn, "elapsed_ms": elapsed}
+        if elapsed > SLOW_REDRAW_MS and order:
+            slowest = max((self.cards[k] for k in order), key=lambda c: c.last_draw_ms)
+            print(f"[FrameCenter] 그래프 갱신 {elapsed:.0f} ms "
+                  f"(카드 {len(order)}개 중 {redrawn}개 다시 그림, "
+                  f"최대 {slowest.last_draw_ms:.0f} ms)")
+
+    def _remove_cards(self, keys):
+        for key in keys:
+            card = self.cards.pop(key, None)
+            if card is None:
+                continue
+            self.cards_layout.removeWidget(card)
+            card.deleteLater()
+
+    def _layout_cards(self, order):
+        # 위치만 다시 배치 (위젯은 재사용)
+        for key in self.card_order:
+            card = self.cards.get(key)
+            if card is not None:
+                self.cards_layout.removeWidget(card)
 
         cols = 2
-        rows = (len(plot_items) + cols - 1) // cols
+        rows = (len(order) + cols - 1) // cols
 
-        for idx, (title, xs, ys) in enumerate(plot_items):
-            row = idx // cols
-            col = idx % cols
-            card = self._create_graph_card(title, xs, ys)
-            self.cards_layout.addWidget(card, row, col)
+        for idx, key in enumerate(order):
+            self.cards_layout.addWidget(self.cards[key], idx // cols, idx % cols)
 
         # 각 행/열에 동일한 stretch 부여 → 화면 높이에 맞춰 자동 분배
-        for r in range(rows):
-            self.cards_layout.setRowStretch(r, 1)
+        for r in range(self.cards_layout.rowCount()):
+            self.cards_layout.setRowStretch(r, 1 if r < rows else 0)
         for c in range(cols):
             self.cards_layout.setColumnStretch(c, 1)
 
+        self.card_order = order
         self.cards_container.update()
 
     def showEvent(self, event):
@@ -737,7 +707,7 @@ class FrameCenter(QFrame):
         if not filename:
             return
 
-        plot_items = self._collect_plot_items()
+        plot_items = self._collect_plot_items(PDF_PLOT_POINTS)
         if not plot_items:
             print("[FrameCenter] PDF 생성: 표시할 그래프가 없습니다.")
             return
@@ -767,7 +737,7 @@ class FrameCenter(QFrame):
 
         temp_files = []
 
-        for idx, (title, xs, ys) in enumerate(plot_items):
+        for idx, (key, title, xs, ys, stats) in enumerate(plot_items):
             fig = Figure(figsize=(7, 3), dpi=120, facecolor="#020617")
             ax = fig.add_subplot(111)
             ax.set_facecolor("#020617")
@@ -793,10 +763,7 @@ class FrameCenter(QFrame):
             elements.append(Image(img_path, width=16 * cm, height=7 * cm))
             elements.append(Spacer(1, 0.2 * cm))
 
-            arr = np.array(ys, dtype=float)
-            mean_v = float(np.mean(arr))
-            min_v = float(np.min(arr))
-            max_v = float(np.max(arr))
+            mean_v, max_v, min_v = stats
             summary = f"평균: {mean_v:,.2f}    최대: {max_v:,.2f}    최소: {min_v:,.2f}"
             elements.append(Paragraph(summary, center_style))
             elements.append(Spacer(1, 0.5 * cm))
@@ -813,12 +780,4 @@ class FrameCenter(QFrame):
 
     def get_current_selected_items(self):
         """현재 실제로 그래프가 그려지고 있는 (parent, child) 목록 반환"""
-        plot_items = self._collect_plot_items()
-        selected = []
-
-        for title, xs, ys in plot_items:
-            # title = "2GHz 수신기 상태 모니터 | LNA Monitor RHCP Id"
-            parent, child = title.split(" | ", 1)
-            selected.append((parent, child))
-
-        return selected
\ No newline at end of file
+        return list(self.card_order)
@@ -2,13 +2,15 @@ import sys
 import os
 from PyQt6.QtWidgets import QApplication, QMainWindow, QWidget, QVBoxLayout, QHBoxLayout
 from PyQt6.QtCore import QTimer
-from datetime import datetime, UTC
 
 from Monitering_Ui.Mframe_top import FrameTop
 from Monitering_Ui.Mframe_summary import FrameSummary
 from Monitering_Ui.Mframe_left import MFrameLeft
+from Monitering_Ui.db_watcher import get_db_watcher
 
-from db_manager import get_connection
+from db_manager import close_read_pool
+from vlbi_core.snapshot import is_link_alive
+from ui_scheduler import get_scheduler
 
 
 class MonitoringWindow(QMainWindow):
@@ -52,11 +54,21 @@ class MonitoringWindow(QMainWindow):
         QTimer.singleShot(10, lambda: self.frame_left.update_all_thresholds())
 
         # ---------------------------
-        # TIMER
+        # DB 변경 시에만 갱신 (새 commit 감지)
         # ---------------------------
-        self.timer = QTimer(self)
-        self.timer.timeout.connect(self.on_timer_tick)
-        self.timer.start(30_000)
+        # 연달아 들어온 commit 은 한 번의 tick 으로 합침.
+        # 알람음 때문에 창이 최소화돼도 멈추지 않음 (widget 없음)
+        self.last_snapshot = None
+        scheduler = get_scheduler()
+        scheduler.add("monitor.tick", self.on_timer_tick)
+
+        self.db_watcher = get_db_watcher()
+        self.db_watcher.changed.connect(lambda: scheduler.trigger("monitor.tick"))
+
+        # 새 데이터가 없어도 통신 상태(최근 60초)는 시간이 지나면 바뀌므로
+        # 마지막 스냅샷 기준으로 다시 판정 (DB 조회 없음, 화면이 보일 때만)
+        scheduler.add("monitor.comm", self.update_comm_status, 10_000,
+                      widget=self.frame_top.icon_comm)
 
         # Initial tick
         self.on_timer_tick()
@@ -64,55 +76,43 @@ class MonitoringWindow(QMainWindow):
     # ==================================================================
     # 통신 상태 체크 - (UTC DeprecationWarning 제거)
     # ==================================================================
-    def check_connection_status(self):
-        try:
-            conn = get_connection(readonly=True)
-            cur = conn.cursor()
-
-            cur.execute("""
-                SELECT Parsed_at
-                FROM _Parsing_history_
-                ORDER BY Parsed_at DESC
-                LIMIT 1
-            """)
-            row = cur.fetchone()
-            conn.close()
-
-            if not row:
-                return False
-
-            last_time_str = row[0]
-
-            # DB 값은 timezone 정보 없이 저장되어 있으므로 UTC timezone 부여
-            last_dt = datetime.fromisoformat(last_time_str).replace(tzinfo=UTC)
-
-            # 현재 시간 (UTC timezone-aware)
-            now_utc = datetime.now(UTC)
+    def check_connection_status(self, snapshot=None):
+        if snapshot is None:
+            snapshot = self.frame_left.take_snapshot(tables=[])
 
-            diff = now_utc - last_dt
-
-            # 최근 60초 안에 데이터 있으면 정상
-            return diff.total_seconds() < 60
-
-        except Exception:
+        if snapshot.error is not None:
             return False
 
+        # 최근 60초 안에 데이터 있으면 정상
+        return is_link_alive(snapshot.last_parsed)
+
     # ==================================================================
     # 주기 갱신
     # ==================================================================
     def on_timer_tick(self):
-        self.frame_left.update_all_thresholds()
-        self.frame_left.refresh_expanded()
-
-        # ---------------------------
-        # 통신 상태 아이콘 갱신
-        # ---------------------------
-        ok = self.check_connection_status()
+        # 모든 장비 테이블 최신값 + 마지막 파싱 시각을 한 번에 읽음
+        snapshot = self.frame_left.take_snapshot()
+        self.last_snapshot = snapshot
+
+        self.frame_left.update_all_thresholds(snapshot)
+        self.frame_left.refresh_expanded(snapshot)
+
+        self.update_comm_status()
+
+    # ---------------------------
+    # 통신 상태 아이콘 갱신
+    # ---------------------------
+    def update_comm_status(self):
+        if self.last_snapshot is None:
+            return
+        ok = self.check_connection_status(self.last_snapshot)
         self.frame_top.set_comm_status(ok)
 
 
 if __name__ == "__main__":
     app = QApplication(sys.argv)
+    app.aboutToQuit.connect(close_read_pool)
+    app.aboutToQuit.connect(get_scheduler().print_report)
     win = MonitoringWindow()
     QTimer.singleShot(0, win.showMaximized)
     sys.exit(app.exec())
@@ -1,8 +1,176 @@
 # Monitering_Ui/Mframe_eventlog.py
-from PyQt6.QtWidgets import QFrame, QVBoxLayout, QLabel, QScrollArea, QWidget
-from PyQt6.QtCore import Qt, QTimer
-from db_manager import get_connection
+from collections import deque
 
+from PyQt6.QtWidgets import QFrame, QVBoxLayout, QLabel, QListView, QAbstractItemView, QLineEdit
+from PyQt6.QtCore import Qt, QAbstractListModel, QModelIndex, QTimer, QThreadPool, pyqtSignal
+from PyQt6.QtGui import QColor
+
+from db_manager import fetch_log_page, search_logs, ensure_datetime_index, LOG_TABLES
+from Monitering_Ui.db_watcher import get_db_watcher
+from ui_scheduler import get_scheduler
+
+
+# 한 번에 읽는 행 수 / 메모리에 유지하는 최대 행 수
+PAGE_SIZE = 50
+MAX_ROWS = 5000
+
+# 검색어 입력 후 검색까지 대기 (타이핑 중 매 글자 검색 방지)
+SEARCH_DELAY_MS = 300
+
+KIND_COLORS = {"parsing": "#FCA5A5", "event": "#FDE68A"}
+
+
+# ======================================================
+# 로그 목록 모델 (최신순, 최대 MAX_ROWS 행)
+# ======================================================
+class EventLogModel(QAbstractListModel):
+    """
+    로그 테이블을 최신순으로 보여주는 모델.
+
+    - refresh(): 마지막으로 본 행보다 새로운 행만 맨 위에 추가
+    - 아래로 스크롤하면 fetchMore() 가 더 오래된 페이지를 읽음 (keyset)
+    - 행 수가 capacity 를 넘으면 가장 오래된 행부터 버림
+    - set_query() 로 검색어를 주면 전체 기록 검색 결과를 관련도 순으로 페이지 조회
+    """
+
+    error = pyqtSignal(str)
+
+    def __init__(self, kind: str = "parsing", page_size: int = PAGE_SIZE,
+                 capacity: int = MAX_ROWS, parent=None):
+        super().__init__(parent)
+        self.kind = kind
+        self.page_size = page_size
+        self.capacity = capacity
+
+        # 검색어 (None 이면 최신 로그 보기)
+        self.query = None
+
+        # (시간, 내용, rowid) — 0 번이 가장 최신 / 검색 중에는 (시간, 내용, kind)
+        self._rows = deque()
+        self._exhausted = False
+        self._failed = False
+
+    # ---------------------------------------------------------
+    def rowCount(self, parent=QModelIndex()):
+        return 0 if parent.isValid() else len(self._rows)
+
+    def data(self, index, role=Qt.ItemDataRole.DisplayRole):
+        if not index.isValid() or index.row() >= len(self._rows):
+            return None
+        at, text, extra = self._rows[index.row()]
+        if role == Qt.ItemDataRole.DisplayRole:
+            return f"[{at}]  {text}"
+        if role == Qt.ItemDataRole.ForegroundRole:
+            kind = extra if self.query else self.kind
+            return QColor(KIND_COLORS.get(kind, "#FCA5A5"))
+        return None
+
+    # ---------------------------------------------------------
+    def canFetchMore(self, parent=QModelIndex()):
+        if parent.isValid():
+            return False
+        return not self._exhausted and len(self._rows) < self.capacity
+
+    def fetchMore(self, parent=QModelIndex()):
+        if not self.canFetchMore(parent):
+            return
+
+        limit = min(self.page_size, self.capacity - len(self._rows))
+        try:
+            if self.query:
+                rows = search_logs(self.query, limit, offset=len(self._rows))
+            else:
+                before = None
+                if self._rows:
+                    at, _, rowid = self._rows[-1]
+                    before = (at, rowid)
+                rows = fetch_log_page(self.kind, limit, before=before)
+        except Exception as e:
+            # 실패한 페이지를 반복 요청하지 않도록 다음 refresh 까지 멈춤
+            self._exhausted = True
+            self._failed = True
+            self.error.emit(str(e))
+            return
+
+        if len(rows) < limit:
+            self._exhausted = True
+        if not rows:
+            return
+
+        first = len(self._rows)
+        self.beginInsertRows(QModelIndex(), first, first + len(rows) - 1)
+        self._rows.extend(rows)
+        self.endInsertRows()
+
+    # ---------------------------------------------------------
+    def refresh(self):
+        """새로 들어온 행을 맨 위에 추가 (처음이면 첫 페이지 로드)"""
+        # 검색 결과는 검색어를 바꿀 때만 다시 조회
+        if self.query:
+            return
+
+        if not self._rows:
+            self._exhausted = False
+            self._failed = False
+            self.fetchMore()
+            return
+
+        at, _, rowid = self._rows[0]
+        try:
+            rows = fetch_log_page(self.kind, self.page_size + 1, after=(at, rowid))
+        except Exception as e:
+            self.error.emit(str(e))
+            return
+
+        # 이전 페이지 조회가 실패했었다면 다시 스크롤로 읽을 수 있게
+        if self._failed:
+            self._failed = False
+            self._exhausted = False
+
+        # 한 페이지보다 많이 쌓였으면 중간이 비지 않도록 처음부터 다시
+        if len(rows) > self.page_size:
+            self.reset()
+            return
+
+        self._prepend(rows)
+
+    def reset(self):
+        self.beginResetModel()
+        self._rows.clear()
+        self._exhausted = False
+        self._failed = False
+        self.endResetModel()
+        self.fetchMore()
+
+    def set_query(self, query: str):
+        query = query.strip() or None
+        if query == self.query:
+            return
+        self.query = query
+        self.reset()
+
+    def _prepend(self, rows):
+        if not rows:
+            return
+
+        # 넘치는 만큼 가장 오래된 행 제거
+        overflow = len(self._rows) + len(rows) - self.capacity
+        if overflow > 0:
+            n = len(self._rows)
+            self.beginRemoveRows(QModelIndex(), n - overflow, n - 1)
+            for _ in range(overflow):
+                self._rows.pop()
+            self.endRemoveRows()
+            self._exhausted = False
+
+        self.beginInsertRows(QModelIndex(), 0, len(rows) - 1)
+        self._rows.extendleft(reversed(rows))
+        self.endInsertRows()
+
+
+# ======================================================
+# FrameEventLog
+# ======================================================
 class FrameEventLog(QFrame):
     def __init__(self, parent=None):
         super().__init__(parent)
@@ -16,75 +184,87 @@ class FrameEventLog(QFrame):
         title.setStyleSheet("color:#f97316; font-size:18pt; font-weight:bold;")
         main_layout.addWidget(title)
 
-        # Scroll Area
-        self.scroll = QScrollArea()
-        self.scroll.setWidgetResizable(True)
-        self.scroll.setStyleSheet("border:none; background-color:#0F172A;")
+        # 검색 (비우면 최신 로그로 복귀)
+        self.search_box = QLineEdit()
+        self.search_box.setPlaceholderText("로그 파일 / 이벤트 검색")
+        self.search_box.setClearButtonEnabled(True)
+        self.search_box.setStyleSheet("""
+            QLineEdit {
+                background-color:#1E293B;
+                color:white;
+                border-radius:6px;
+                padding:5px 8px;
+                font-size:11pt;
+            }
+        """)
+        main_layout.addWidget(self.search_box)
+
+        self.search_timer = QTimer(self)
+        self.search_timer.setSingleShot(True)
+        self.search_timer.setInterval(SEARCH_DELAY_MS)
+        self.search_timer.timeout.connect(self.run_search)
+        self.search_box.textChanged.connect(self.search_timer.start)
+        self.search_box.returnPressed.connect(self.run_search)
+
+        # 오류 표시 (정상일 때는 숨김)
+        self.error_label = QLabel()
+        self.error_label.setStyleSheet("color:#fecaca;")
+        self.error_label.setWordWrap(True)
+        self.error_label.hide()
+        main_layout.addWidget(self.error_label)
+
+        # 로그 목록 (보이는 행만 그림)
+        self.model = EventLogModel("parsing", parent=self)
+        self.model.error.connect(self._show_error)
 
-        self.content = QWidget()
-        self.scroll_layout = QVBoxLayout(self.content)
-        self.scroll_layout.setContentsMargins(5, 5, 5, 5)
-        self.scroll_layout.setSpacing(6)
+        self.view = QListView()
+        self.view.setModel(self.model)
+        self.view.setWordWrap(True)
+        self.view.setSelectionMode(QAbstractItemView.SelectionMode.NoSelection)
+        self.view.setVerticalScrollMode(QAbstractItemView.ScrollMode.ScrollPerPixel)
+        self.view.setStyleSheet("""
+            QListView {
+                border:none;
+                background-color:#0F172A;
+                font-size:11pt;
+            }
+            QListView::item {
+                padding:3px 5px;
+            }
+        """)
+        main_layout.addWidget(self.view, stretch=1)
 
-        self.scroll.setWidget(self.content)
-        main_layout.addWidget(self.scroll, stretch=1)
+        # 페이지 조회용 인덱스: 큰 테이블이면 CREATE INDEX 가 오래 걸리므로 워커 스레드에서
+        # (쓰기 권한 없으면 인덱스 없이 동작, 만들어지면 다음 조회부터 사용)
+        QThreadPool.globalInstance().start(self.ensure_indexes)
 
-        # Timer for auto-refresh (10 sec)
-        self.timer = QTimer(self)
-        self.timer.timeout.connect(self.reload_logs)
-        self.timer.start(10_000)
+        # 새 commit 이 있을 때만 새 행 확인 (화면에 보일 때만, 여러 commit 은 한 번으로)
+        scheduler = get_scheduler()
+        scheduler.add("eventlog", self.reload_logs, widget=self.view)
+        get_db_watcher().changed.connect(lambda: scheduler.trigger("eventlog"))
 
         # 초기에 로딩
         self.reload_logs()
 
+    @staticmethod
+    def ensure_indexes():
+        for table, time_col, _ in LOG_TABLES.values():
+            ensure_datetime_index(table, time_col)
+
     # -------------------------------------------------------------
-    #  PARSING HISTORY LOAD (LOCK FREE)
+    #  PARSING HISTORY LOAD (새 행만 추가)
     # -------------------------------------------------------------
     def reload_logs(self):
-        # 기존 위젯 제거
-        for i in reversed(range(self.scroll_layout.count())):
-            item = self.scroll_layout.itemAt(i)
-            w = item.widget()
-            if w is not None:
-                w.deleteLater()
-
-        rows = []
-        try:
-            conn = get_connection(readonly=True)
-            cur = conn.cursor()
-
-            # 컬럼: Log_name, Parsed_at
-            cur.execute("""
-                SELECT Log_name, Parsed_at
-                FROM _Parsing_history_
-                ORDER BY Parsed_at DESC
-                LIMIT 20
-            """)
+        self.error_label.hide()
+        self.model.refresh()
 
-            rows = cur.fetchall()
-
-        except Exception as e:
-            err = QLabel(f"Parsing History DB 오류: {e}")
-            err.setStyleSheet("color:#fecaca;")
-            self.scroll_layout.addWidget(err)
-            return
+    def run_search(self):
+        self.search_timer.stop()
+        self.error_label.hide()
+        self.model.set_query(self.search_box.text())
+        self.view.scrollToTop()
 
-        finally:
-            try:
-                conn.close()
-            except:
-                pass
-
-        # 출력
-        for logname, parsed_at in rows:
-            lbl = QLabel(f"[{parsed_at}]  {logname}")
-            lbl.setStyleSheet("""
-                QLabel {
-                    color:#FCA5A5;
-                    font-size:11pt;
-                }
-            """)
-            lbl.setWordWrap(True)
-            self.scroll_layout.addWidget(lbl)
-
-        self.scroll_layout.addStretch()
+    def _show_error(self, msg: str):
+        label = "검색" if self.model.query else "Parsing History DB"
+        self.error_label.setText(f"{label} 오류: {msg}")
+        self.error_label.show()
@@ -6,36 +6,100 @@ from PyQt6.QtWidgets import (
 from PyQt6.QtMultimedia import QSoundEffect
 from PyQt6.QtCore import QUrl, Qt, pyqtSignal
 from Monitering_Ui.threshold_manager import ThresholdManager
-from db_manager import get_connection
+from vlbi_core.snapshot import fetch_latest_snapshot
+from vlbi_core.device_map import DEVICE_TABLE_MAP, ROW_MERGE_COUNT
+from vlbi_core.alerts import evaluate_snapshot
+from alarm_store import AlarmEpisodeStore
 import os
 import time
 
 
+# 값 카드 스타일 (패널마다 한 번만 적용, 단계는 "level" 동적 속성으로 전환)
+VALUE_CARD_STYLE = """
+QFrame#valueCard {
+    background-color: #020617;
+    border-radius: 8px;
+    border: 2px solid #1E293B;
+}
+QFrame#valueCard[level="yellow"] {
+    background-color: #4a3f05;
+    border: 2px solid #facc15;
+}
+QFrame#valueCard[level="red"] {
+    background-color: #5c1f1f;
+    border: 2px solid #f87171;
+}
+QLabel#valueName {
+    color: #9CA3AF;
+    font-size: 12pt;
+    background: transparent;
+    border: none;
+}
+QLabel#valueText {
+    color: white;
+    font-size: 14pt;
+    font-weight: bold;
+    background: transparent;
+    border: none;
+}
+"""
+
+
+class ValueCard(QFrame):
+    """컬럼 하나의 이름/값 카드. 값이나 단계가 바뀔 때만 위젯을 건드린다."""
+
+    def __init__(self, name, parent=None):
+        super().__init__(parent)
+        self.setObjectName("valueCard")
+        self.setProperty("level", "normal")
+
+        self.level = "normal"
+        self.text = ""
+
+        hl = QHBoxLayout(self)
+        hl.setContentsMargins(10, 5, 10, 5)
+        hl.setSpacing(8)
+
+        lbl_name = QLabel(str(name))
+        lbl_name.setObjectName("valueName")
+
+        self.lbl_val = QLabel("")
+        self.lbl_val.setObjectName("valueText")
+        self.lbl_val.setAlignment(Qt.AlignmentFlag.AlignRight | Qt.AlignmentFlag.AlignVCenter)
+
+        hl.addWidget(lbl_name, 3)
+        hl.addWidget(self.lbl_val, 2)
+
+    def update_value(self, value, level=None) -> bool:
+        """변경된 게 있으면 True"""
+        changed = False
+
+        text = "" if value is None else str(value)
+        if text != self.text:
+            self.text = text
+            self.lbl_val.setText(text)
+            changed = True
+
+        level = level or "normal"
+        if level != self.level:
+            self.level = level
+            self.setProperty("level", level)
+            # 동적 속성 변경 후 스타일 재적용 (시트 재파싱 없음)
+            self.style().unpolish(self)
+            self.style().polish(self)
+            changed = True
+
+        return changed
+
+
 class MFrameLeft(QScrollArea):
 
     device_selected = pyqtSignal(str)
 
-    DEVICE_TABLE_MAP = {
-        "2GHz Receiver": "frontend_2ghz",
-        "8GHz Receiver": "frontend_8ghz",
-        "22GHz Receiver": "frontend_22ghz",
-        "43GHz Receiver": "frontend_43ghz",
-        "S/X Down Converter": "SXDownConverter",
-        "K Down Converter": "KDownConverter",
-        "Q Down Converter": "QDownConverter",
-        "Video Converter 1": None,
-        "Video Converter 2": "VideoConverter2",
-        "IF Selector": "IFselector",
-    }
+    DEVICE_TABLE_MAP = DEVICE_TABLE_MAP
 
     # 여러 줄을 합쳐야 하는 테이블에 대한 row 개수 정의
-    ROW_MERGE_COUNT = {
-        "SXDownConverter": 3,
-        "KDownConverter": 3,
-        "QDownConverter": 3,
-        "IFselector": 3,
-        "VideoConverter2": 5,
-    }
+    ROW_MERGE_COUNT = ROW_MERGE_COUNT
 
     def __init__(self, parent=None):
         super().__init__(parent)
@@ -68,6 +132,9 @@ class MFrameLeft(QScrollArea):
         # ===================================================
         self.thresholds = ThresholdManager()
 
+        # 알람 구간 조회 / 확인(ack) — 구간 기록은 alarm_daemon 이 함
+        self.episodes = AlarmEpisodeStore()
+
         # ===================================================
         # 안정 버전: QSoundEffect 절대 크래시 방지
         # ===================================================
@@ -94,17 +161,37 @@ class MFrameLeft(QScrollArea):
         self.main_layout.addWidget(btn)
 
         panel = QWidget()
+        panel.setStyleSheet(VALUE_CARD_STYLE)
         panel_layout = QVBoxLayout(panel)
         panel_layout.setContentsMargins(20, 5, 10, 5)
         panel_layout.setSpacing(6)
         panel.setVisible(False)
         self.main_layout.addWidget(panel)
 
+        # 안내 문구 (테이블 없음 / DB 오류 / 데이터 없음)
+        message = self._make_label("")
+        message.setVisible(False)
+        panel_layout.addWidget(message)
+
+        # 값 카드 Grid (컬럼 구성이 바뀔 때만 다시 만듦)
+        grid_widget = QWidget()
+        grid = QGridLayout(grid_widget)
+        grid.setHorizontalSpacing(12)
+        grid.setVerticalSpacing(12)
+        grid.setContentsMargins(10, 5, 10, 5)
+        grid_widget.setVisible(False)
+        panel_layout.addWidget(grid_widget)
+
         btn.clicked.connect(lambda checked, name=device_name: self._toggle_panel(name))
 
         self.device_widgets[device_name] = {
             "button": btn,
             "panel": panel,
+            "message": message,
+            "grid_widget": grid_widget,
+            "grid": grid,
+            "columns": (),
+            "cards": {},
         }
 
     # ---------------------------------------------------------
@@ -145,58 +232,34 @@ class MFrameLeft(QScrollArea):
         self.device_selected.emit(device_name)
 
     # ---------------------------------------------------------
-    def refresh_expanded(self):
-        for device_name, info in self.device_widgets.items():
-            if info["panel"].isVisible():
-                self._reload_panel(device_name)
+    def refresh_expanded(self, snapshot=None):
+        expanded = [name for name, info in self.device_widgets.items()
+                    if info["panel"].isVisible()]
+        if not expanded:
+            return
+
+        if snapshot is None:
+            snapshot = self.take_snapshot(
+                [self.DEVICE_TABLE_MAP.get(name) for name in expanded]
+            )
+
+        for device_name in expanded:
+            self._reload_panel(device_name, snapshot)
 
     # ---------------------------------------------------------
-    def _fetch_latest_row_with_merge(self, table: str, conn):
+    def take_snapshot(self, tables=None):
         """
-        테이블에서 가장 최신 데이터를 읽되,
-        ROW_MERGE_COUNT에 정의된 경우 여러 줄을 합쳐서 하나의 row처럼 반환한다.
-        반환값: (col_names, row_tuple 또는 None)
+        장비 테이블 최신 (병합) row 를 한 트랜잭션에서 읽는다.
+        tables 생략 시 DEVICE_TABLE_MAP 전체.
         """
-        merge_count = self.ROW_MERGE_COUNT.get(table, 1)
-        cur = conn.cursor()
-
-        # 병합 불필요: 기존 방식 그대로
-        if merge_count <= 1:
-            cur.execute(f"SELECT * FROM {table} ORDER BY datetime DESC LIMIT 1")
-            row = cur.fetchone()
-            col_names = [d[0] for d in cur.description] if row else []
-            return col_names, row
-
-        # 병합 필요한 테이블: 최근 merge_count 줄을 가져와 병합
-        cur.execute(
-            f"SELECT * FROM {table} ORDER BY datetime DESC LIMIT {merge_count}"
+        if tables is None:
+            tables = self.DEVICE_TABLE_MAP.values()
+        return fetch_latest_snapshot(
+            [t for t in tables if t], self.ROW_MERGE_COUNT
         )
-        rows = cur.fetchall()
-        if not rows:
-            return [], None
-
-        col_names = [d[0] for d in cur.description]
-
-        # 각 컬럼별로 첫 번째 non-NULL 값 선택 (최신 row부터 순서대로)
-        merged = [None] * len(col_names)
-        for row in rows:
-            for idx, val in enumerate(row):
-                if merged[idx] is None and val is not None:
-                    merged[idx] = val
-
-        # datetime 컬럼이 있다면 가장 최신 row의 값 최소 보장
-        try:
-            dt_idx = col_names.index("datetime")
-            if merged[dt_idx] is None:
-                merged[dt_idx] = rows[0][dt_idx]
-        except ValueError:
-            # datetime 컬럼이 없는 경우는 무시
-            pass
-
-        return col_names, tuple(merged)
 
     # ---------------------------------------------------------
-    def _reload_panel(self, device_name: str):
+    def _reload_panel(self, device_name: str, snapshot=None):
 
         info = self.device_widgets.get(device_name)
         if not info:
@@ -207,85 +270,35 @@ class MFrameLeft(QScrollArea):
         except Exception as e:
             print("Threshold reload error:", e)
 
-        panel = info["panel"]
-        layout = panel.layout()
-
-        self._clear_layout(layout)
-
         table = self.DEVICE_TABLE_MAP.get(device_name)
         if not table:
-            layout.addWidget(self._make_label("실시간 데이터 미구성 (테이블 없음)"))
+            self._show_panel_message(info, "실시간 데이터 미구성 (테이블 없음)")
             return
 
-        try:
-            conn = get_connection(readonly=True)
-            col_names, row = self._fetch_latest_row_with_merge(table, conn)
+        if snapshot is None:
+            snapshot = self.take_snapshot([table])
 
-            if not row:
-                layout.addWidget(self._make_label("데이터가 없습니다."))
-                return
+        try:
+            col_names, row = snapshot.get(table)
 
         except Exception as e:
-            layout.addWidget(self._make_label(f"DB 오류: {e}"))
+            self._show_panel_message(info, f"DB 오류: {e}")
             return
 
-        finally:
-            try:
-                conn.close()
-            except:
-                pass
+        if not row:
+            self._show_panel_message(info, "데이터가 없습니다.")
+            return
 
         # -------------------------
         # 임계값 검사 (상/하한)
         # -------------------------
-        upper_warnings = []
-        upper_errors = []
-        lower_warnings = []
-        lower_errors = []
-
-        level_map = {}  # ★ 필수
-
-        for col, raw_val in zip(col_names, row):
-            try:
-                val = float(raw_val)
-            except:
-                val = None
-
-            th = self.thresholds.get_threshold(table, col)
-            level = None
-
-            if th and val is not None:
-                ly = th.get("lower_yellow")
-                lr = th.get("lower_red")
-                uy = th.get("upper_yellow")
-                ur = th.get("upper_red")
-
-                # 하한 RED
-                if lr is not None and val <= lr:
-                    level = "red"
-                    lower_errors.append(f"{device_name} - {col}: {val}")
-
-                # 하한 YELLOW
-                elif ly is not None and val <= ly:
-                    level = "yellow"
-                    lower_warnings.append(f"{device_name} - {col}: {val}")
-
-                # 상한 RED
-                elif ur is not None and val >= ur:
-                    level = "red"
-                    upper_errors.append(f"{device_name} - {col}: {val}")
-
-                # 상한 YELLOW
-                elif uy is not None and val >= uy:
-                    level = "yellow"
-                    upper_warnings.append(f"{device_name} - {col}: {val}")
-
-            level_map[col] = level
+        violations = self.thresholds.engine.classify_row(table, col_names, row)
+        level_map = {v.column: v.level for v in violations}
 
         # ===================================================
         # 알람
         # ===================================================
-        all_errors = upper_errors + lower_errors
+        all_errors = [v for v in violations if v.level == "red"]
 
         if all_errors and self.sound_enabled:
             now = time.time()
@@ -295,33 +308,42 @@ class MFrameLeft(QScrollArea):
                 self.last_alarm = now
 
         # ===================================================
-        # UI 표시 (3열 Grid)
+        # UI 표시 (3열 Grid) — 값/단계가 바뀐 카드만 갱신
         # ===================================================
-        grid = QGridLayout()
-        grid.setHorizontalSpacing(12)
-        grid.setVerticalSpacing(12)
-        grid.setContentsMargins(10, 5, 10, 5)
-        layout.addLayout(grid)
-
-        row_idx, col_idx = 0, 0
+        info["message"].setVisible(False)
+        self._ensure_value_cards(info, col_names)
 
+        cards = info["cards"]
         for col, val in zip(col_names, row):
-            level = level_map.get(col)
-            card = self._make_value_card(col, val, level)
-            grid.addWidget(card, row_idx, col_idx)
+            cards[col].update_value(val, level_map.get(col))
 
-            col_idx += 1
-            if col_idx >= 3:
-                col_idx = 0
-                row_idx += 1
+        info["grid_widget"].setVisible(True)
 
     # ---------------------------------------------------------
-    def _clear_layout(self, layout):
-        while layout.count():
-            item = layout.takeAt(0)
-            w = item.widget()
-            if w:
-                w.deleteLater()
+    def _show_panel_message(self, info, text: str):
+        info["grid_widget"].setVisible(False)
+        info["message"].setText(text)
+        info["message"].setVisible(True)
+
+    def _ensure_value_cards(self, info, col_names):
+        """컬럼 구성이 처음이거나 바뀌었을 때만 카드를 다시 만든다"""
+        col_names = tuple(col_names)
+        if col_names == info["columns"]:
+            return
+
+        grid = info["grid"]
+        for card in info["cards"].values():
+            grid.removeWidget(card)
+            card.deleteLater()
+
+        cards = {}
+        for i, col in enumerate(col_names):
+            card = ValueCard(col)
+            grid.addWidget(card, i // 3, i % 3)
+            cards[col] = card
+
+        info["cards"] = cards
+        info["columns"] = col_names
 
     # ---------------------------------------------------------
     def _make_label(self, text: str):
@@ -330,110 +352,32 @@ class MFrameLeft(QScrollArea):
         lbl.setWordWrap(True)
         return lbl
 
-    # ---------------------------------------------------------
-    def _make_value_card(self, name, value, level=None):
-
-        card = QFrame()
-
-        color_border = "#1E293B"
-        color_bg = "#020617"
+    def update_all_thresholds(self, snapshot=None):
 
-        if level == "yellow":
-            color_border = "#facc15"
-            color_bg = "#4a3f05"
-
-        elif level == "red":
-            color_border = "#f87171"
-            color_bg = "#5c1f1f"
-
-        card.setStyleSheet(f"""
-            QFrame {{
-                background-color: {color_bg};
-                border-radius: 8px;
-                border: 2px solid {color_border};
-            }}
-        """)
-
-        hl = QHBoxLayout(card)
-        hl.setContentsMargins(10, 5, 10, 5)
-        hl.setSpacing(8)
-
-        lbl_name = QLabel(str(name))
-        lbl_name.setStyleSheet("color:#9CA3AF; font-size:12pt;")
+        # 설정 창에서 저장한 임계값 반영 (파일이 바뀐 경우에만 다시 읽음)
+        try:
+            self.thresholds.load()
+        except Exception as e:
+            print("Threshold reload error:", e)
 
-        lbl_val = QLabel("" if value is None else str(value))
-        lbl_val.setStyleSheet("color:white; font-size:14pt; font-weight:bold;")
-        lbl_val.setAlignment(Qt.AlignmentFlag.AlignRight | Qt.AlignmentFlag.AlignVCenter)
+        if snapshot is None:
+            snapshot = self.take_snapshot()
 
-        hl.addWidget(lbl_name, 3)
-        hl.addWidget(lbl_val, 2)
-
-        return card
-
-    def update_all_thresholds(self):
-
-        upper_warnings = []
-        upper_errors = []
-        lower_warnings = []
-        lower_errors = []
-
-        # 모든 장비 스캔
-        for device, table in self.DEVICE_TABLE_MAP.items():
-            if not table:
-                continue
-
-            try:
-                conn = get_connection(readonly=True)
-                col_names, row = self._fetch_latest_row_with_merge(table, conn)
-                if not row:
-                    continue
-            finally:
-                try:
-                    conn.close()
-                except:
-                    pass
-
-            for col, raw_val in zip(col_names, row):
-                try:
-                    val = float(raw_val)
-                except:
-                    continue
-
-                th = self.thresholds.get_threshold(table, col)
-                if not th:
-                    continue
-
-                ly = th.get("lower_yellow")
-                lr = th.get("lower_red")
-                uy = th.get("upper_yellow")
-                ur = th.get("upper_red")
-
-                # ---- 하한 경고/주의 ----
-                if lr is not None and val <= lr:
-                    lower_errors.append(f"{device} - {col}: {val}")
-                elif ly is not None and val <= ly:
-                    lower_warnings.append(f"{device} - {col}: {val}")
-
-                # ---- 상한 경고/주의 ----
-                if ur is not None and val >= ur:
-                    upper_errors.append(f"{device} - {col}: {val}")
-                elif uy is not None and val >= uy:
-                    upper_warnings.append(f"{device} - {col}: {val}")
+        # 알람 구간(alarm_episode) / Event 기록은 alarm_daemon 담당 → 여기서는 화면만
+        alerts, _ = evaluate_snapshot(
+            self.thresholds.engine, snapshot, self.DEVICE_TABLE_MAP,
+            on_error=lambda table, e: print(f"[MFrameLeft] DB 오류 ({table}): {e}"),
+        )
 
         # Summary 업데이트
         if hasattr(self, "summary") and self.summary:
-            self.summary.update_alerts(
-                upper_warnings, upper_errors,
-                lower_warnings, lower_errors
-            )
-
-        # 경고음 (상/하한 합산)
-        all_errors = upper_errors + lower_errors
+            self.summary.update_alerts(alerts)
 
         # -----------------------------
         # 통합 알람 제어 (중복 방지)
         # -----------------------------
-        if all_errors and self.sound_enabled:
+        # 경고음 (상/하한 red 합산)
+        if alerts.has_level("red") and self.sound_enabled:
             if not self.alarm_is_active:
                 self.alarm.play()
                 self.alarm_is_active = True
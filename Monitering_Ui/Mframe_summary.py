@@ -1,15 +1,17 @@
 from typing import TYPE_CHECKING
 from PyQt6.QtWidgets import (
     QFrame, QLabel, QPushButton, QHBoxLayout, QVBoxLayout, QWidget,
-    QDialog, QListWidget, QGraphicsOpacityEffect
+    QDialog, QListWidget, QListWidgetItem
 )
-from PyQt6.QtCore import Qt, QPropertyAnimation, QEasingCurve
+from PyQt6.QtCore import Qt
 
 # MonitoringWindow 타입 힌트
 if TYPE_CHECKING:
     from MoniteringMain import MonitoringWindow
 
 from Monitering_Ui.threshold_dialog import ThresholdDialog
+from Monitering_Ui.blink_clock import get_blink_clock
+from vlbi_core.alerts import AlertSet
 
 
 # ======================================================
@@ -19,13 +21,16 @@ class MiniCard(QFrame):
     def __init__(self, name, color, parent=None):
         super().__init__(parent)
 
-        # 전체 박스만 외곽선 있음
+        # 전체 박스만 외곽선 있음 (blink="true" → 깜빡임 꺼짐 단계)
         self.setStyleSheet(f"""
             QFrame {{
                 background-color: #0F172A;
                 border-radius: 10px;
                 border: 2px solid {color};
             }}
+            QFrame[blink="true"] {{
+                border: 2px solid #1E293B;
+            }}
             QLabel {{
                 background: transparent;
                 color:white;
@@ -33,6 +38,9 @@ class MiniCard(QFrame):
                 font-weight:bold;
                 border: none;
             }}
+            QFrame[blink="true"] QLabel {{
+                color:#64748B;
+            }}
         """)
 
         layout = QHBoxLayout(self)
@@ -47,25 +55,31 @@ class MiniCard(QFrame):
 
         self.setCursor(Qt.CursorShape.PointingHandCursor)
 
-        # 깜빡임 효과 그대로 유지
-        self.effect = QGraphicsOpacityEffect(self)
-        self.setGraphicsEffect(self.effect)
-
-        self.anim = QPropertyAnimation(self.effect, b"opacity")
-        self.anim.setDuration(600)
-        self.anim.setStartValue(0.3)
-        self.anim.setEndValue(1.0)
-        self.anim.setEasingCurve(QEasingCurve.Type.InOutQuad)
-        self.anim.setLoopCount(-1)
+        # 깜빡임은 앱 공용 시계가 구동 (카드별 애니메이션 없음)
+        self.count = 0
+        self.blink = False
 
     def set_count(self, c):
+        if c == self.count:
+            return
+        self.count = c
         self.label_value.setText(f"{c}")
 
         if c >= 1:
-            self.anim.start()
+            get_blink_clock().register(self)
         else:
-            self.anim.stop()
-            self.effect.setOpacity(1.0)
+            get_blink_clock().unregister(self)
+
+    def set_blink(self, on: bool):
+        if on == self.blink:
+            return
+        self.blink = on
+        self.setProperty("blink", on)
+        self.style().unpolish(self)
+        self.style().polish(self)
+        for lbl in (self.label_name, self.label_value):
+            self.style().unpolish(lbl)
+            self.style().polish(lbl)
 
 
 # ======================================================
@@ -120,11 +134,8 @@ class FrameSummary(QFrame):
 
         self.setStyleSheet("background-color:#0F172A; border-radius:10px;")
 
-        # 리스트 데이터
-        self.upper_warnings = []
-        self.upper_errors = []
-        self.lower_warnings = []
-        self.lower_errors = []
+        # 마지막 판정 결과
+        self.alerts = AlertSet()
 
         layout = QHBoxLayout(self)
         layout.setContentsMargins(20, 25, 20, 20)
@@ -168,13 +179,30 @@ class FrameSummary(QFrame):
         layout.addWidget(self.btn_setting)
 
         # --------------------- 클릭 이벤트 연결 ---------------------
-        self.card_upper.card_red.mousePressEvent = lambda e: self.show_list("Upper Critical", self.upper_errors)
-        self.card_upper.card_yellow.mousePressEvent = lambda e: self.show_list("Upper Warning", self.upper_warnings)
-        self.card_lower.card_red.mousePressEvent = lambda e: self.show_list("Lower Critical", self.lower_errors)
-        self.card_lower.card_yellow.mousePressEvent = lambda e: self.show_list("Lower Warning", self.lower_warnings)
+        self.card_upper.card_red.mousePressEvent = lambda e: self.show_list("Upper Critical", "upper", "red")
+        self.card_upper.card_yellow.mousePressEvent = lambda e: self.show_list("Upper Warning", "upper", "yellow")
+        self.card_lower.card_red.mousePressEvent = lambda e: self.show_list("Lower Critical", "lower", "red")
+        self.card_lower.card_yellow.mousePressEvent = lambda e: self.show_list("Lower Warning", "lower", "yellow")
 
     # --------------------------------------------------
-    def show_list(self, title: str, dataset: list):
+    def _open_episodes(self, side, level) -> dict:
+        """진행 중 알람 구간 {(테이블, 컬럼): episode} (기록이 없거나 조회 실패 시 빈 dict)"""
+        win: "MonitoringWindow" = self.window()
+        if not hasattr(win, "frame_left"):
+            return {}
+        try:
+            episodes = win.frame_left.episodes.open_episodes(side=side, level=level)
+        except Exception as e:
+            print(f"[FrameSummary] 알람 구간 조회 실패: {e}")
+            return {}
+        return {(ep["tbl"], ep["col"]): ep for ep in episodes}
+
+    def show_list(self, title: str, side: str, level: str):
+        alerts = self.alerts.group(side, level)
+
+        # 알람 구간이 있으면 시작 시각 / peak / 확인 여부까지 표시
+        episodes = self._open_episodes(side, level)
+
         dlg = QDialog(self)
         dlg.setWindowTitle(title)
         dlg.resize(450, 550)
@@ -199,32 +227,55 @@ class FrameSummary(QFrame):
             }
         """)
 
-        for x in dataset:
-            lst.addItem(x)
+        episode_ids = []
+        for a in alerts:
+            text = a.label
+            ep = episodes.get(a.key)
+            if ep is not None:
+                episode_ids.append(ep["id"])
+                text += (f"   (since {ep['start_at']}, peak {ep['peak']}"
+                         f"{', ACK' if ep['acked_at'] else ''})")
 
-        lst.itemClicked.connect(lambda item: self.jump_to_device(item.text()))
+            item = QListWidgetItem(text)
+            item.setData(Qt.ItemDataRole.UserRole, a.device)
+            lst.addItem(item)
+
+        lst.itemClicked.connect(
+            lambda item: self.jump_to_device(item.data(Qt.ItemDataRole.UserRole))
+        )
 
         layout = QVBoxLayout(dlg)
         layout.addWidget(lst)
 
-        dlg.exec()
+        if episode_ids:
+            btn_ack = QPushButton("모두 확인 (ACK)")
+            btn_ack.setStyleSheet("""
+                QPushButton {
+                    background-color:#1E293B;
+                    color:white;
+                    padding:10px;
+                    border-radius:8px;
+                    font-size:12pt;
+                }
+            """)
+            btn_ack.clicked.connect(lambda: self._acknowledge(episode_ids, dlg))
+            layout.addWidget(btn_ack)
 
-    def jump_to_device(self, text: str):
-        """
-        예: '22GHz Receiver - RF_LO: -97.0'
-        → 장비명 = '22GHz Receiver'
-        """
+        dlg.exec()
 
-        # -----------------------
-        # 1. 텍스트 파싱
-        # -----------------------
+    def _acknowledge(self, episode_ids, dlg):
+        win: "MonitoringWindow" = self.window()
         try:
-            device_name = text.split(" - ")[0].strip()
-        except:
-            return
+            win.frame_left.episodes.acknowledge(episode_ids)
+        except Exception as e:
+            print(f"[FrameSummary] 알람 확인 기록 실패: {e}")
+        dlg.accept()
+
+    def jump_to_device(self, device_name: str):
+        """해당 장비 패널을 펼치고 스크롤"""
 
         # -----------------------
-        # 2. Left 패널 객체 가져오기
+        # 1. Left 패널 객체 가져오기
         # -----------------------
         win: "MonitoringWindow" = self.window()
         if not hasattr(win, "frame_left"):
@@ -233,7 +284,7 @@ class FrameSummary(QFrame):
         fl = win.frame_left
 
         # -----------------------
-        # 3. 해당 장비 패널 펼치기
+        # 2. 해당 장비 패널 펼치기
         # -----------------------
         if device_name in fl.device_widgets:
             info = fl.device_widgets[device_name]
@@ -247,7 +298,7 @@ class FrameSummary(QFrame):
                 panel.setVisible(True)
 
             # -----------------------
-            # 4. 자동 스크롤
+            # 3. 자동 스크롤
             # -----------------------
             fl.ensureWidgetVisible(panel)
 
@@ -257,17 +308,15 @@ class FrameSummary(QFrame):
         # (필요하면 close() 추가)
 
     # --------------------------------------------------
-    def update_alerts(self,
-                      upper_warnings: list, upper_errors: list,
-                      lower_warnings: list, lower_errors: list):
-
-        self.upper_warnings = upper_warnings
-        self.upper_errors = upper_errors
-        self.lower_warnings = lower_warnings
-        self.lower_errors = lower_errors
+    def update_alerts(self, alerts: AlertSet):
+        # 목록(현재값)은 항상 최신으로, 카드는 알람 구성이 바뀐 경우만 갱신
+        changed = not alerts.same_state(self.alerts)
+        self.alerts = alerts
+        if not changed:
+            return
 
-        self.card_upper.update(len(upper_errors), len(upper_warnings))
-        self.card_lower.update(len(lower_errors), len(lower_warnings))
+        self.card_upper.update(alerts.count("upper", "red"), alerts.count("upper", "yellow"))
+        self.card_lower.update(alerts.count("lower", "red"), alerts.count("lower", "yellow"))
 
     # --------------------------------------------------
     def toggle_mute(self):
@@ -287,12 +336,6 @@ class FrameSummary(QFrame):
 
             fl.last_alarm = 0
             fl.update_all_thresholds()
-
-            # Summary UI도 새로 반영
-            self.update_alerts(
-                self.upper_warnings, self.upper_errors,
-                self.lower_warnings, self.lower_errors
-            )
         else:
             self.btn_mute.setText("🔇")
             fl.alarm.stop()
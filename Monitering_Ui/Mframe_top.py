@@ -1,8 +1,10 @@
 import os
 from PyQt6.QtWidgets import QLabel, QFrame, QHBoxLayout, QVBoxLayout
-from PyQt6.QtCore import Qt, QTimer, QDateTime
+from PyQt6.QtCore import Qt, QDateTime
 from PyQt6.QtGui import QPixmap
 
+from ui_scheduler import get_scheduler
+
 
 class FrameTop(QFrame):
     def __init__(self, parent=None):
@@ -57,9 +59,13 @@ class FrameTop(QFrame):
         self.time_label.setAlignment(
             Qt.AlignmentFlag.AlignRight | Qt.AlignmentFlag.AlignVCenter
         )
-        self.time_label.setStyleSheet(
-            "color:white; font-size:12pt; font-weight:bold;"
-        )
+        # 글자 크기 16pt, 줄 간격 추가(line-height) — 스타일은 한 번만 적용
+        self.time_label.setStyleSheet("""
+            color: white;
+            font-size: 16pt;
+            font-weight: bold;
+            line-height: 140%;
+        """)
 
         time_layout = QVBoxLayout()
         time_layout.addWidget(
@@ -85,10 +91,8 @@ class FrameTop(QFrame):
             alignment=Qt.AlignmentFlag.AlignRight | Qt.AlignmentFlag.AlignVCenter
         )
 
-        # Timer for clock tick
-        self.timer = QTimer(self)
-        self.timer.timeout.connect(self.update_time)
-        self.timer.start(1000)
+        # 시계 (창이 최소화/숨김이면 멈추고 다시 보일 때 즉시 갱신)
+        get_scheduler().add("monitor.clock", self.update_time, 1000, widget=self.time_label)
         self.update_time()
 
     # ==================================================================
@@ -101,14 +105,6 @@ class FrameTop(QFrame):
         kst_str = now_kst.toString("yyyy-MM-dd hh:mm:ss")
         utc_str = now_utc.toString("yyyy-MM-dd hh:mm:ss")
 
-        # 글자 크기 16pt, 줄 간격 추가(line-height)
-        self.time_label.setStyleSheet("""
-            color: white;
-            font-size: 16pt;
-            font-weight: bold;
-            line-height: 140%;
-        """)
-
         # KST / UTC 사이 한 줄 간격 추가
         self.time_label.setText(
             f"(KST) {kst_str}\n\n"
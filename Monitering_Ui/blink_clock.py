@@ -0,0 +1,96 @@
+# Monitering_Ui/blink_clock.py
+from PyQt6.QtCore import QObject, QEvent, pyqtSignal
+
+from ui_scheduler import get_scheduler
+
+
+# 깜빡임 주기 (켜짐/꺼짐 전환 간격)
+BLINK_INTERVAL_MS = 500
+
+
+class BlinkClock(QObject):
+    """
+    앱 전체에서 공유하는 알람 깜빡임 시계.
+
+    - 알람 중인 위젯이 하나라도 있을 때만 타이머 동작
+    - 위젯이 속한 창이 최소화/숨김 상태면 정지
+    - 매 전환마다 등록된 위젯의 set_blink(on) 호출 (스타일 속성만 바꿈)
+    """
+
+    toggled = pyqtSignal(bool)
+
+    def __init__(self, interval_ms: int = BLINK_INTERVAL_MS, parent=None):
+        super().__init__(parent)
+
+        self.phase = False
+        self._widgets = set()
+        self._windows = set()
+
+        # 앱 공용 스케줄러 작업 (알람 중일 때만 활성)
+        self.running = False
+        get_scheduler().add("blink", self._tick, interval_ms, enabled=False)
+
+    # ---------------------------------------------------------
+    def register(self, widget):
+        if widget in self._widgets:
+            return
+        self._widgets.add(widget)
+        widget.destroyed.connect(lambda *_, w=widget: self.unregister(w))
+
+        # 창 상태(최소화/숨김) 감시
+        win = widget.window()
+        if win not in self._windows:
+            self._windows.add(win)
+            win.installEventFilter(self)
+
+        widget.set_blink(self.phase)
+        self._update_running()
+
+    def unregister(self, widget):
+        if widget not in self._widgets:
+            return
+        self._widgets.discard(widget)
+        try:
+            widget.set_blink(False)
+        except RuntimeError:
+            # 이미 삭제된 위젯
+            pass
+        self._update_running()
+
+    # ---------------------------------------------------------
+    def _any_window_visible(self) -> bool:
+        for win in list(self._windows):
+            try:
+                if win.isVisible() and not win.isMinimized():
+                    return True
+            except RuntimeError:
+                # 이미 삭제된 창
+                self._windows.discard(win)
+        return False
+
+    def _update_running(self):
+        should_run = bool(self._widgets) and self._any_window_visible()
+        if should_run != self.running:
+            self.running = should_run
+            get_scheduler().set_enabled("blink", should_run)
+
+    def _tick(self):
+        self.phase = not self.phase
+        for w in list(self._widgets):
+            w.set_blink(self.phase)
+        self.toggled.emit(self.phase)
+
+    def eventFilter(self, obj, event):
+        if event.type() in (QEvent.Type.WindowStateChange, QEvent.Type.Show, QEvent.Type.Hide):
+            self._update_running()
+        return False
+
+
+_clock = None
+
+
+def get_blink_clock() -> BlinkClock:
+    global _clock
+    if _clock is None:
+        _clock = BlinkClock()
+    return _clock
@@ -0,0 +1,52 @@
+# Monitering_Ui/db_watcher.py
+from PyQt6.QtCore import QObject, pyqtSignal
+
+import db_manager
+from db_manager import ChangeDetector
+from ui_scheduler import get_scheduler
+
+
+# 변경 확인 주기 (파서가 쉬는 동안은 파일 stat 만 수행)
+# 한 번이 stat + PRAGMA 수준이라 쉬는 동안에도 간격을 늘리지 않음 → 첫 변경도 250ms 안에 감지
+POLL_INTERVAL_MS = 250
+
+
+class DbWatcher(QObject):
+    """
+    ChangeDetector 를 주기적으로 확인하고 새 commit 이 있을 때만 changed 를 보낸다.
+    화면 갱신(장비 상태, 이벤트 로그)은 고정 주기 대신 이 신호에 연결한다.
+    창이 최소화돼도 멈추지 않는다 (알람음).
+    """
+
+    changed = pyqtSignal()
+
+    def __init__(self, interval_ms: int = POLL_INTERVAL_MS, parent=None):
+        super().__init__(parent)
+
+        self.detector = ChangeDetector()
+
+        get_scheduler().add("db_watch", self.check, interval_ms)
+
+    def check(self):
+        # DB 경로가 바뀌면 새로 감시
+        if self.detector.db_path != db_manager.DB_PATH:
+            self.detector.close()
+            self.detector = ChangeDetector()
+
+        if self.detector.poll():
+            self.changed.emit()
+
+    def stop(self):
+        get_scheduler().remove("db_watch")
+        self.detector.close()
+
+
+_watcher = None
+
+
+def get_db_watcher() -> DbWatcher:
+    """앱 전체에서 하나의 감시자를 공유"""
+    global _watcher
+    if _watcher is None:
+        _watcher = DbWatcher()
+    return _watcher
@@ -4,78 +4,22 @@ from PyQt6.QtWidgets import (
 )
 from PyQt6.QtCore import Qt, QTimer
 from Monitering_Ui.threshold_manager import ThresholdManager
+from ui_scheduler import get_scheduler
+from vlbi_core.device_map import (
+    THRESHOLD_DEVICE_TABLE_MAP, THRESHOLD_TABLE_COLUMNS,
+    FRONTEND_COLUMNS, VIDEO2_COLUMNS, IF_COLUMNS,
+)
 import csv
 
 
 class ThresholdDialog(QDialog):
 
-    DEVICE_TABLE_MAP = {
-        "2GHz 수신기": "frontend_2ghz",
-        "8GHz 수신기": "frontend_8ghz",
-        "22GHz 수신기": "frontend_22ghz",
-        "43GHz 수신기": "frontend_43ghz",
-        "Video Converter 2": "VideoConverter2",
-        "IF Selector": "IFselector",
-        "S/X 다운컨버터": "SXDown",
-        "K 다운컨버터": "KDown",
-        "Q 다운컨버터": "QDown",
-    }
-
-    FRONTEND_COLUMNS = [
-        "RF_RHCP", "RF_LHCP", "RF_LO",
-        "Cryo_ColdPlate", "Cryo_ShieldBox",
-        "Pressure",
-        "NormalTemp_RF", "NormalTemp_Noise", "NormalTemp_Load",
-        "LNA_LHCP_Vg1", "LNA_LHCP_Vg2", "LNA_LHCP_Vg3", "LNA_LHCP_Vg4",
-        "LNA_LHCP_Vd1", "LNA_LHCP_Vd2", "LNA_LHCP_Vd3", "LNA_LHCP_Vd4",
-        "LNA_LHCP_Id1", "LNA_LHCP_Id2", "LNA_LHCP_Id3", "LNA_LHCP_Id4",
-        "LNA_RHCP_Vg1", "LNA_RHCP_Vg2", "LNA_RHCP_Vg3", "LNA_RHCP_Vg4",
-        "LNA_RHCP_Vd1", "LNA_RHCP_Vd2", "LNA_RHCP_Vd3", "LNA_RHCP_Vd4",
-        "LNA_RHCP_Id1", "LNA_RHCP_Id2", "LNA_RHCP_Id3", "LNA_RHCP_Id4",
-    ]
-
-    VIDEO2_COLUMNS = [
-        "LEVELU_ch1", "LEVELU_ch2", "LEVELU_ch3", "LEVELU_ch4",
-        "LEVELU_ch5", "LEVELU_ch6", "LEVELU_ch7", "LEVELU_ch8",
-        "LEVELL_ch1", "LEVELL_ch2", "LEVELL_ch3", "LEVELL_ch4",
-        "LEVELL_ch5", "LEVELL_ch6", "LEVELL_ch7", "LEVELL_ch8",
-        "LOCK_ch1", "LOCK_ch2", "LOCK_ch3", "LOCK_ch4",
-        "LOCK_ch5", "LOCK_ch6", "LOCK_ch7", "LOCK_ch8",
-        "ATT_ch1", "ATT_ch2", "ATT_ch3", "ATT_ch4",
-        "ATT_ch5", "ATT_ch6", "ATT_ch7", "ATT_ch8",
-        "ATT_ch5", "ATT_ch6", "ATT_ch7", "ATT_ch8",
-        "FRQALL_ch1", "FRQALL_ch2", "FRQALL_ch3", "FRQALL_ch4",
-        "FRQALL_ch5", "FRQALL_ch6", "FRQALL_ch7", "FRQALL_ch8",
-    ]
-
-    IF_COLUMNS = [
-        "OUT2IN_ch1", "OUT2IN_ch2", "OUT2IN_ch3", "OUT2IN_ch4",
-        "OUT2IN_ch5", "OUT2IN_ch6", "OUT2IN_ch7", "OUT2IN_ch8",
-        "OUT2IN_ch9", "OUT2IN_ch10", "OUT2IN_ch11", "OUT2IN_ch12",
-        "OUT2IN_ch13", "OUT2IN_ch14", "OUT2IN_ch15", "OUT2IN_ch16",
-
-        "ATT_ch1", "ATT_ch2", "ATT_ch3", "ATT_ch4",
-        "ATT_ch5", "ATT_ch6", "ATT_ch7", "ATT_ch8",
-        "ATT_ch9", "ATT_ch10", "ATT_ch11", "ATT_ch12",
-        "ATT_ch13", "ATT_ch14", "ATT_ch15", "ATT_ch16",
-
-        "LEVEL_ch1", "LEVEL_ch2", "LEVEL_ch3", "LEVEL_ch4",
-        "LEVEL_ch5", "LEVEL_ch6", "LEVEL_ch7", "LEVEL_ch8",
-        "LEVEL_ch9", "LEVEL_ch10", "LEVEL_ch11", "LEVEL_ch12",
-        "LEVEL_ch13", "LEVEL_ch14", "LEVEL_ch15", "LEVEL_ch16",
-    ]
-
-    TABLE_COLUMNS = {
-        "frontend_2ghz": FRONTEND_COLUMNS,
-        "frontend_8ghz": FRONTEND_COLUMNS,
-        "frontend_22ghz": FRONTEND_COLUMNS,
-        "frontend_43ghz": FRONTEND_COLUMNS,
-        "VideoConverter2": VIDEO2_COLUMNS,
-        "IFselector": IF_COLUMNS,
-        "SXDown": ["SLEVEL", "X1LEVEL", "X2LEVEL"],
-        "KDown": ["K1LEVEL", "K2LEVEL", "K3LEVEL", "K4LEVEL"],
-        "QDown": ["Q1LEVEL", "Q2LEVEL", "Q3LEVEL", "Q4LEVEL"],
-    }
+    # 장비 / 컬럼 정의는 vlbi_core.device_map (합성 DB 생성기와 공용)
+    DEVICE_TABLE_MAP = THRESHOLD_DEVICE_TABLE_MAP
+    FRONTEND_COLUMNS = FRONTEND_COLUMNS
+    VIDEO2_COLUMNS = VIDEO2_COLUMNS
+    IF_COLUMNS = IF_COLUMNS
+    TABLE_COLUMNS = THRESHOLD_TABLE_COLUMNS
 
     def __init__(self, parent=None):
         super().__init__(parent)
@@ -207,9 +151,17 @@ class ThresholdDialog(QDialog):
             return
 
         self.tm.set_threshold(table, col, ly, lr, uy, ur)
+        self._apply_to_monitor()
         QMessageBox.information(self, "저장 완료", "임계값이 저장되었습니다.")
         self.close()
 
+    def _apply_to_monitor(self):
+        """
+        모니터링 판정 / Summary / 알람음을 새 임계값으로 바로 다시 계산.
+        (monitor.tick 은 DB commit 이 있을 때만 돌기 때문에 직접 요청)
+        """
+        get_scheduler().trigger("monitor.tick")
+
     # ----------------------------------------------------------
     # CSV 내보내기
     # ----------------------------------------------------------
@@ -249,34 +201,27 @@ class ThresholdDialog(QDialog):
         if not path:
             return
 
-        new_data = {}
+        def to_float(x):
+            try:
+                return float(x)
+            except:
+                return None
 
         try:
             with open(path, "r", encoding="utf-8") as f:
-                reader = csv.DictReader(f)
-
-                for row in reader:
-                    table = row["table"]
-                    col = row["column"]
-
-                    if table not in new_data:
-                        new_data[table] = {}
-
-                    def to_float(x):
-                        try:
-                            return float(x)
-                        except:
-                            return None
-
-                    new_data[table][col] = {
-                        "lower_yellow": to_float(row["lower_yellow"]),
-                        "lower_red": to_float(row["lower_red"]),
-                        "upper_yellow": to_float(row["upper_yellow"]),
-                        "upper_red": to_float(row["upper_red"]),
-                    }
-
-            self.tm.thresholds = new_data
-            self.tm.save()
+                rows = [
+                    (row["table"], row["column"],
+                     to_float(row["lower_yellow"]), to_float(row["lower_red"]),
+                     to_float(row["upper_yellow"]), to_float(row["upper_red"]))
+                    for row in csv.DictReader(f)
+                ]
+
+            # 전체 교체 → 파일 쓰기는 batch 끝에서 1회
+            with self.tm.batch():
+                self.tm.clear()
+                for row in rows:
+                    self.tm.set_threshold(*row)
+            self._apply_to_monitor()
 
             QMessageBox.information(self, "완료", "CSV에서 임계값이 불러와졌습니다.")
 
@@ -1,24 +1,107 @@
 import json
 import os
+import tempfile
+from contextlib import contextmanager
+
+from vlbi_core.threshold_engine import ThresholdEngine
 
 class ThresholdManager:
     FILE_PATH = os.path.join(os.path.dirname(__file__), "thresholds.json")
 
     def __init__(self):
         self.thresholds = {}
+        # 임계값 판정은 engine 으로 (테이블별 bound 배열 캐시)
+        self.engine = ThresholdEngine()
+
+        # 마지막으로 읽은/쓴 파일의 (inode, 크기, mtime) — 바뀌었을 때만 다시 읽음
+        self._file_sig = None
+        self._batch_depth = 0
+        self._dirty = False
+
         self.load()
 
-    def load(self):
+    def _stat_signature(self):
+        try:
+            st = os.stat(self.FILE_PATH)
+        except OSError:
+            return None
+        return (st.st_ino, st.st_size, st.st_mtime_ns)
+
+    def load(self, force: bool = False) -> bool:
+        """
+        파일이 바뀐 경우에만 다시 읽는다 (stat 1회).
+        다시 읽었으면 True.
+        """
+        sig = self._stat_signature()
+        if not force and sig is not None and sig == self._file_sig:
+            return False
+
         try:
             with open(self.FILE_PATH, "r", encoding="utf-8") as f:
                 self.thresholds = json.load(f)
         except FileNotFoundError:
             self.thresholds = {}
             self.save()
+        except json.JSONDecodeError as e:
+            # 편집 중인 파일 등 → 기존 값 유지, 다음 호출에서 다시 시도
+            print(f"[ThresholdManager] thresholds.json 읽기 실패: {e}")
+            return False
+
+        self._file_sig = self._stat_signature()
+        self.engine.load(self.thresholds)
+        return True
 
     def save(self):
-        with open(self.FILE_PATH, "w", encoding="utf-8") as f:
-            json.dump(self.thresholds, f, indent=4, ensure_ascii=False)
+        self.engine.load(self.thresholds)
+
+        # batch() 안에서는 마지막에 한 번만 기록
+        if self._batch_depth:
+            self._dirty = True
+            return
+
+        # 임시 파일에 쓴 뒤 rename → 읽는 쪽이 반쯤 쓴 파일을 보지 않음
+        fd, tmp = tempfile.mkstemp(
+            prefix=".thresholds.", suffix=".tmp", dir=os.path.dirname(self.FILE_PATH)
+        )
+        try:
+            with os.fdopen(fd, "w", encoding="utf-8") as f:
+                json.dump(self.thresholds, f, indent=4, ensure_ascii=False)
+                f.flush()
+                os.fsync(f.fileno())
+            os.replace(tmp, self.FILE_PATH)
+        except Exception:
+            try:
+                os.remove(tmp)
+            except OSError:
+                pass
+            raise
+
+        self._file_sig = self._stat_signature()
+        self._dirty = False
+
+    @contextmanager
+    def batch(self):
+        """
+        여러 건 수정을 파일 쓰기 1회로 묶는다.
+
+            with tm.batch():
+                tm.set_threshold(...)
+                tm.set_threshold(...)
+        """
+        self._batch_depth += 1
+        try:
+            yield self
+        except Exception:
+            # 도중 실패 → 파일 내용으로 되돌림
+            self._batch_depth -= 1
+            if not self._batch_depth:
+                self._dirty = False
+                self.load(force=True)
+            raise
+
+        self._batch_depth -= 1
+        if not self._batch_depth and self._dirty:
+            self.save()
 
     def get_threshold(self, table, column):
         th = self.thresholds.get(table, {}).get(column)
@@ -43,3 +126,7 @@ class ThresholdManager:
             "upper_red": ur
         }
         self.save()
+
+    def clear(self):
+        self.thresholds = {}
+        self.save()
@@ -0,0 +1,156 @@
+import argparse
+import sqlite3
+import time
+
+import db_manager
+from alarm_store import AlarmEpisodeStore, DEFAULT_HYSTERESIS
+from db_manager import ChangeDetector
+from vlbi_core.alerts import evaluate_snapshot
+from vlbi_core.device_map import DEVICE_TABLE_MAP, ROW_MERGE_COUNT
+from vlbi_core.snapshot import fetch_latest_snapshot
+from Monitering_Ui.threshold_manager import ThresholdManager
+
+
+# 새 commit 확인 주기 (초)
+POLL_INTERVAL_SEC = 0.2
+
+# 새 데이터가 없어도 임계값 파일 변경 등을 반영하기 위한 최대 간격 (초)
+IDLE_EVALUATE_SEC = 30.0
+
+
+# ----------------------------------------------------------------------
+# 헤드리스 알람 판정 (Qt 없음)
+# ----------------------------------------------------------------------
+class AlarmDaemon:
+    """
+    장비 테이블 최신값을 임계값으로 판정해 alarm_episode 구간을 갱신하고,
+    구간이 시작/단계 변경/종료될 때만 Event 테이블에 기록한다.
+
+        발생/단계 변경: "[RED] S/X Down Converter - X1LEVEL: 12.0 (upper >= 10.0)"
+        해제:          "[CLEAR] S/X Down Converter - X1LEVEL: 8.0"
+    """
+
+    def __init__(self, poll_interval: float = POLL_INTERVAL_SEC,
+                 idle_evaluate: float = IDLE_EVALUATE_SEC,
+                 hysteresis: float = DEFAULT_HYSTERESIS):
+        self.poll_interval = poll_interval
+        self.idle_evaluate = idle_evaluate
+
+        self.thresholds = ThresholdManager()
+        self.detector = ChangeDetector()
+        self.episodes = AlarmEpisodeStore(hysteresis=hysteresis)
+
+        self.table_device = {t: d for d, t in DEVICE_TABLE_MAP.items() if t}
+
+        self._conn = None
+        self._last_eval = 0.0
+        self.evaluations = 0
+        self.events_written = 0
+
+    # ---------------------------------------------------------
+    def _write_conn(self):
+        if self._conn is None:
+            conn = db_manager.get_connection()
+            conn.execute("""
+                CREATE TABLE IF NOT EXISTS Event (
+                    datetime TEXT,
+                    message  TEXT
+                )
+            """)
+            conn.commit()
+            self._conn = conn
+        return self._conn
+
+    def close(self):
+        self.detector.close()
+        self.episodes.close()
+        if self._conn is not None:
+            self._conn.close()
+            self._conn = None
+
+    # ---------------------------------------------------------
+    def evaluate(self) -> list:
+        """
+        최신값 판정 → 구간 갱신 → 상태가 바뀐 항목의 (datetime, message) 목록.
+        조회에 실패한 테이블은 열린 구간을 그대로 둔다.
+        """
+        self.thresholds.load()
+        engine = self.thresholds.engine
+
+        snapshot = fetch_latest_snapshot(list(self.table_device), ROW_MERGE_COUNT)
+        if snapshot.error is not None:
+            print(f"[AlarmDaemon] DB 오류: {snapshot.error}")
+            return []
+
+        # 조회에 실패한 테이블은 items 에서 빠지므로 열린 구간이 유지됨
+        _, items = evaluate_snapshot(engine, snapshot, DEVICE_TABLE_MAP)
+
+        events = []
+        for kind, ep, at in self.episodes.update_many(items):
+            name = f"{ep['device']} - {ep['col']}: {ep['last_value']}"
+            if kind == "close":
+                events.append((at, f"[CLEAR] {name}"))
+            else:
+                op = "<=" if ep["side"] == "lower" else ">="
+                events.append((at, f"[{ep['current_level'].upper()}] {name} "
+                                   f"({ep['side']} {op} {ep['bound']})"))
+
+        self.evaluations += 1
+        return events
+
+    def write_events(self, events):
+        if not events:
+            return
+        conn = self._write_conn()
+        with conn:
+            conn.executemany("INSERT INTO Event (datetime, message) VALUES (?, ?)", events)
+        self.events_written += len(events)
+        for dt, msg in events:
+            print(f"[AlarmDaemon] {dt} {msg}")
+
+    # ---------------------------------------------------------
+    def run_once(self):
+        self._last_eval = time.monotonic()
+        self.write_events(self.evaluate())
+
+    def run(self):
+        print(f"[AlarmDaemon] 감시 시작: {db_manager.DB_PATH}")
+        try:
+            while True:
+                idle = time.monotonic() - self._last_eval >= self.idle_evaluate
+                if self.detector.poll() or idle:
+                    try:
+                        self.run_once()
+                    except sqlite3.Error as e:
+                        print(f"[AlarmDaemon] DB 오류: {e}")
+                time.sleep(self.poll_interval)
+        except KeyboardInterrupt:
+            pass
+        finally:
+            self.close()
+            db_manager.close_read_pool()
+            print(f"[AlarmDaemon] 종료 (판정 {self.evaluations}회, 이벤트 {self.events_written}건)")
+
+
+# ----------------------------------------------------------------------
+# 실행: python alarm_daemon.py [--db 경로] [--interval 초] [--once]
+# ----------------------------------------------------------------------
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="VLBI 헤드리스 알람 판정")
+    parser.add_argument("--db", help="DB 경로 (기본: db_manager.DB_PATH)")
+    parser.add_argument("--interval", type=float, default=POLL_INTERVAL_SEC,
+                        help="새 commit 확인 주기 (초)")
+    parser.add_argument("--hysteresis", type=float, default=DEFAULT_HYSTERESIS,
+                        help="해제 히스테리시스 (임계값 대비 비율, 예: 0.02)")
+    parser.add_argument("--once", action="store_true", help="한 번만 판정하고 종료")
+    args = parser.parse_args()
+
+    if args.db:
+        db_manager.set_db_path(args.db)
+
+    daemon = AlarmDaemon(poll_interval=args.interval, hysteresis=args.hysteresis)
+    if args.once:
+        daemon.run_once()
+        daemon.close()
+    else:
+        daemon.run()
@@ -0,0 +1,273 @@
+import math
+import sqlite3
+from datetime import datetime
+
+import db_manager
+
+
+# 해제 히스테리시스 (임계값 대비 비율). 0.02 → 상한 100 이면 98 미만이 되어야 해제
+DEFAULT_HYSTERESIS = 0.0
+
+LEVEL_RANK = {"yellow": 1, "red": 2}
+
+
+def _to_float(val):
+    try:
+        return float(val)
+    except (TypeError, ValueError):
+        return math.nan
+
+
+def _still_in(side: str, value: float, bound, hysteresis: float) -> bool:
+    """히스테리시스 범위를 포함해 아직 위반 중인지"""
+    if bound is None or math.isnan(value):
+        return False
+    margin = abs(bound) * hysteresis
+    if side == "upper":
+        return value >= bound - margin
+    return value <= bound + margin
+
+
+# ----------------------------------------------------------------------
+# 알람 구간(episode) 저장소
+# ----------------------------------------------------------------------
+class AlarmEpisodeStore:
+    """
+    (테이블, 컬럼) 별 알람 구간을 alarm_episode 테이블에 기록한다.
+    구간마다 시작/종료 시각, 최고 단계, 현재 단계, peak 값, 확인(ack) 시각을 가진다.
+
+    구간 갱신(update_many)은 alarm_daemon 하나만 한다 (상태 변화를 Event 로 기록,
+    히스테리시스 설정도 데몬 하나). GUI 는 조회와 사용자 확인(acknowledge)만 한다.
+    update_many() 는 열린 구간을 DB 에서 다시 읽고 같은 트랜잭션에서 갱신하므로
+    데몬이 둘 떠 있어도 열린 구간은 (테이블, 컬럼) 당 하나로 유지된다.
+    """
+
+    def __init__(self, hysteresis: float = DEFAULT_HYSTERESIS):
+        self.hysteresis = hysteresis
+        self._conn = None
+
+    # ---------------------------------------------------------
+    def _write_conn(self):
+        if self._conn is None:
+            conn = db_manager.get_connection()
+            self._ensure_schema(conn)
+            self._conn = conn
+        return self._conn
+
+    def close(self):
+        if self._conn is not None:
+            self._conn.close()
+            self._conn = None
+
+    def _ensure_schema(self, conn):
+        conn.execute("""
+            CREATE TABLE IF NOT EXISTS alarm_episode (
+                id            INTEGER PRIMARY KEY,
+                tbl           TEXT NOT NULL,
+                col           TEXT NOT NULL,
+                device        TEXT,
+                side          TEXT NOT NULL,
+                level         TEXT NOT NULL,
+                current_level TEXT NOT NULL,
+                bound         REAL,
+                start_at      TEXT NOT NULL,
+                end_at        TEXT,
+                peak          REAL,
+                last_value    REAL,
+                acked_at      TEXT
+            )
+        """)
+        # 열린 구간은 (테이블, 컬럼) 당 하나
+        conn.execute("""
+            CREATE UNIQUE INDEX IF NOT EXISTS idx_alarm_episode_open
+            ON alarm_episode(tbl, col) WHERE end_at IS NULL
+        """)
+        conn.execute("""
+            CREATE INDEX IF NOT EXISTS idx_alarm_episode_start
+            ON alarm_episode(start_at)
+        """)
+        conn.commit()
+
+    # ---------------------------------------------------------
+    def update_many(self, items) -> list:
+        """
+        items: [(table, device, col_names, row, violations), ...]
+               violations 는 ThresholdEngine.classify_row 결과
+        반환: 상태 변화 목록 [(kind, episode dict, datetime), ...]
+              kind = "open" / "level" / "close"
+        """
+        conn = self._write_conn()
+        try:
+            conn.execute("BEGIN IMMEDIATE")
+
+            open_eps = {}
+            cur = conn.execute("SELECT * FROM alarm_episode WHERE end_at IS NULL")
+            names = [d[0] for d in cur.description]
+            for r in cur.fetchall():
+                ep = dict(zip(names, r))
+                open_eps[(ep["tbl"], ep["col"])] = ep
+
+            changes = []
+            for table, device, col_names, row, violations in items:
+                if not row:
+                    continue
+                if "datetime" in col_names:
+                    dt = str(row[col_names.index("datetime")])
+                else:
+                    dt = datetime.now().isoformat(sep=" ", timespec="seconds")
+                values = dict(zip(col_names, row))
+                current = {v.column: v for v in violations}
+
+                for col in set(current) | {c for (t, c) in open_eps if t == table}:
+                    changes += self._apply(conn, open_eps, table, device, col,
+                                           current.get(col), _to_float(values.get(col)), dt)
+
+            conn.commit()
+            return changes
+        except Exception:
+            if conn.in_transaction:
+                conn.rollback()
+            # 커넥션 문제일 수 있으므로 다음 호출에서 새로 연결
+            self.close()
+            raise
+
+    def _apply(self, conn, open_eps, table, device, col, v, value, dt) -> list:
+        key = (table, col)
+        ep = open_eps.get(key)
+        h = self.hysteresis
+
+        # 진행 중 구간 없음 → 새로 시작
+        if ep is None:
+            if v is None:
+                return []
+            return [("open", self._open(conn, open_eps, table, device, v, dt), dt)]
+
+        # 반대쪽으로 넘어감 → 기존 종료 후 새 구간
+        if v is not None and v.side != ep["side"]:
+            return [("close", self._close(conn, open_eps, ep, value, dt), dt),
+                    ("open", self._open(conn, open_eps, table, device, v, dt), dt)]
+
+        if v is None:
+            # 값 없음(NULL) 이거나 히스테리시스 범위 안 → 유지
+            if math.isnan(value) or _still_in(ep["side"], value, ep["bound"], h):
+                self._touch(conn, ep, value)
+                return []
+            return [("close", self._close(conn, open_eps, ep, value, dt), dt)]
+
+        # 같은 쪽 위반 지속: 단계 상승은 즉시, 하강은 히스테리시스 적용
+        changes = []
+        new_level = v.level
+        if (LEVEL_RANK[new_level] < LEVEL_RANK[ep["current_level"]]
+                and _still_in(ep["side"], value, ep["bound"], h)):
+            new_level = ep["current_level"]
+
+        if new_level != ep["current_level"]:
+            ep["current_level"] = new_level
+            ep["bound"] = v.bound
+            if LEVEL_RANK[new_level] > LEVEL_RANK[ep["level"]]:
+                ep["level"] = new_level
+            changes.append(("level", ep, dt))
+
+        self._touch(conn, ep, value, force=bool(changes))
+        return changes
+
+    def _open(self, conn, open_eps, table, device, v, dt) -> dict:
+        ep = {
+            "tbl": table, "col": v.column, "device": device,
+            "side": v.side, "level": v.level, "current_level": v.level,
+            "bound": v.bound, "start_at": dt, "end_at": None,
+            "peak": v.value, "last_value": v.value, "acked_at": None,
+        }
+        cur = conn.execute("""
+            INSERT INTO alarm_episode
+                (tbl, col, device, side, level, current_level, bound,
+                 start_at, peak, last_value)
+            VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?)
+        """, (table, v.column, device, v.side, v.level, v.level, v.bound,
+              dt, v.value, v.value))
+        ep["id"] = cur.lastrowid
+        open_eps[(table, v.column)] = ep
+        return ep
+
+    def _touch(self, conn, ep, value, force: bool = False):
+        """마지막 값 / peak / 단계 갱신 (바뀐 게 없으면 쓰지 않음)"""
+        before = (ep["level"], ep["current_level"], ep["bound"], ep["peak"], ep["last_value"])
+
+        if not math.isnan(value):
+            ep["last_value"] = value
+            if ep["peak"] is None:
+                ep["peak"] = value
+            elif ep["side"] == "upper":
+                ep["peak"] = max(ep["peak"], value)
+            else:
+                ep["peak"] = min(ep["peak"], value)
+
+        after = (ep["level"], ep["current_level"], ep["bound"], ep["peak"], ep["last_value"])
+        if after == before and not force:
+            return
+
+        conn.execute("""
+            UPDATE alarm_episode
+            SET level = ?, current_level = ?, bound = ?, peak = ?, last_value = ?
+            WHERE id = ?
+        """, (*after, ep["id"]))
+
+    def _close(self, conn, open_eps, ep, value, dt) -> dict:
+        if not math.isnan(value):
+            ep["last_value"] = value
+        ep["end_at"] = dt
+        conn.execute(
+            "UPDATE alarm_episode SET end_at = ?, last_value = ? WHERE id = ?",
+            (dt, ep["last_value"], ep["id"])
+        )
+        del open_eps[(ep["tbl"], ep["col"])]
+        return ep
+
+    # ---------------------------------------------------------
+    def acknowledge(self, episode_ids) -> int:
+        now = datetime.now().isoformat(sep=" ", timespec="seconds")
+        params = [(now, i) for i in episode_ids]
+        if not params:
+            return 0
+
+        conn = self._write_conn()
+        with conn:
+            cur = conn.executemany(
+                "UPDATE alarm_episode SET acked_at = ? WHERE id = ? AND acked_at IS NULL",
+                params
+            )
+        return cur.rowcount
+
+    # ---------------------------------------------------------
+    # 조회 (읽기 전용 풀)
+    # ---------------------------------------------------------
+    @staticmethod
+    def _select(sql, params=()) -> list:
+        try:
+            with db_manager.read_connection() as conn:
+                cur = conn.execute(sql, params)
+                names = [d[0] for d in cur.description]
+                return [dict(zip(names, r)) for r in cur.fetchall()]
+        except sqlite3.OperationalError as e:
+            # 아직 alarm_episode 테이블이 없는 DB
+            if "no such table" in str(e):
+                return []
+            raise
+
+    def open_episodes(self, side: str = None, level: str = None) -> list:
+        """진행 중 구간 (side / current_level 로 필터)"""
+        sql = "SELECT * FROM alarm_episode WHERE end_at IS NULL"
+        params = []
+        if side:
+            sql += " AND side = ?"
+            params.append(side)
+        if level:
+            sql += " AND current_level = ?"
+            params.append(level)
+        return self._select(sql + " ORDER BY start_at", params)
+
+    def recent_episodes(self, limit: int = 50) -> list:
+        """최근 시작된 구간 (종료된 것 포함)"""
+        return self._select(
+            "SELECT * FROM alarm_episode ORDER BY start_at DESC LIMIT ?", (limit,)
+        )
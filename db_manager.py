@@ -1,10 +1,71 @@
 import sqlite3
 import os
+import threading
+import time
+from contextlib import contextmanager
 
-DB_PATH = r"C:\Work\VLBI\VLBIGUI\VLBI_TEST.db"
+# DB 경로: 환경변수 VLBI_DB_PATH 또는 set_db_path() 로 변경
+DB_PATH = os.environ.get("VLBI_DB_PATH", r"C:\Work\VLBI\VLBIGUI\VLBI_TEST.db")
+
+# DB_PATH 가 이 값이면 같은 프로세스의 모든 커넥션이 공유하는 메모리 DB (테스트 / 부하 측정용)
+MEMORY_DB = ":memory:"
+MEMORY_URI = "file:vlbi_memdb?mode=memory&cache=shared"
+
+# 읽기 전용 커넥션 풀 설정
+READ_POOL_SIZE = 4
+READ_POOL_HEALTH_CHECK_SEC = 60.0
+
+
+def is_memory_db(path: str = None) -> bool:
+    return (path or DB_PATH) == MEMORY_DB
+
+
+# 마지막 커넥션이 닫혀도 메모리 DB 가 사라지지 않도록 잡아두는 커넥션
+_memory_holder = None
+_memory_lock = threading.Lock()
+
+
+def _connect_memory():
+    global _memory_holder
+    with _memory_lock:
+        if _memory_holder is None:
+            _memory_holder = sqlite3.connect(MEMORY_URI, uri=True, check_same_thread=False)
+    return sqlite3.connect(MEMORY_URI, uri=True, timeout=5.0, check_same_thread=False)
+
+
+def _release_memory_db():
+    global _memory_holder
+    with _memory_lock:
+        if _memory_holder is not None:
+            _memory_holder.close()
+            _memory_holder = None
+
+
+def set_db_path(path: str):
+    """
+    DB 경로 변경. 읽기 풀과 스키마 캐시를 비운다.
+    ":memory:" 에서 다른 경로로 바꾸면 메모리 DB 는 (다른 커넥션이 모두 닫히면) 사라진다.
+    """
+    global DB_PATH
+    if path == DB_PATH:
+        return
+    close_read_pool()
+    _table_columns_cache.clear()
+    _indexed_tables.clear()
+    if is_memory_db():
+        _release_memory_db()
+    DB_PATH = path
 
 
 def get_connection(readonly: bool = False):
+    if is_memory_db():
+        conn = _connect_memory()
+        if readonly:
+            conn.execute("PRAGMA query_only=1;")
+            # 공유 캐시는 테이블 단위 잠금 → 읽기 커넥션이 쓰기를 막지 않도록
+            conn.execute("PRAGMA read_uncommitted=1;")
+        return conn
+
     if readonly:
         # 읽기 전용 → PRAGMA 절대 건드리면 안 됨
         conn = sqlite3.connect(
@@ -28,20 +89,430 @@ def get_connection(readonly: bool = False):
     return conn
 
 
+# ----------------------------------------------------------------------
+# 읽기 전용 커넥션 풀
+# ----------------------------------------------------------------------
+class ReadOnlyPool:
+    """
+    오래 유지되는 읽기 전용 커넥션 풀.
+    매 쿼리마다 connect/close 하지 않고 커넥션을 재사용한다.
+
+        with read_connection() as conn:
+            conn.execute(...)
+    """
+
+    def __init__(self, size: int = READ_POOL_SIZE,
+                 health_check_sec: float = READ_POOL_HEALTH_CHECK_SEC):
+        self.size = size
+        self.health_check_sec = health_check_sec
+
+        self._cond = threading.Condition()
+        self._idle = []          # [(conn, last_used), ...]
+        self._in_use = 0
+        self._closed = False
+
+        self._stats = {
+            "opened": 0,
+            "reused": 0,
+            "discarded": 0,
+            "waits": 0,
+            "wait_time": 0.0,
+        }
+
+    # ---------------------------------------------------------
+    def _open(self):
+        conn = get_connection(readonly=True)
+        with self._cond:
+            self._stats["opened"] += 1
+        return conn
+
+    def _is_healthy(self, conn) -> bool:
+        try:
+            conn.execute("SELECT 1").fetchone()
+            return True
+        except sqlite3.Error:
+            return False
+
+    def _discard(self, conn):
+        self._stats["discarded"] += 1
+        try:
+            conn.close()
+        except Exception:
+            pass
+
+    # ---------------------------------------------------------
+    def acquire(self, timeout: float = 10.0):
+        start = time.perf_counter()
+        waited = False
+
+        with self._cond:
+            if self._closed:
+                raise sqlite3.ProgrammingError("connection pool is closed")
+
+            while not self._idle and self._in_use >= self.size:
+                waited = True
+                remain = timeout - (time.perf_counter() - start)
+                if remain <= 0:
+                    raise TimeoutError("read connection pool exhausted")
+                self._cond.wait(remain)
+
+            if waited:
+                self._stats["waits"] += 1
+                self._stats["wait_time"] += time.perf_counter() - start
+
+            self._in_use += 1
+            entry = self._idle.pop() if self._idle else None
+
+        try:
+            if entry is not None:
+                conn, last_used = entry
+                # 오래 쉬던 커넥션만 health check
+                if (time.monotonic() - last_used < self.health_check_sec
+                        or self._is_healthy(conn)):
+                    with self._cond:
+                        self._stats["reused"] += 1
+                    return conn
+                with self._cond:
+                    self._discard(conn)
+
+            conn = self._open()
+            return conn
+
+        except Exception:
+            with self._cond:
+                self._in_use -= 1
+                self._cond.notify()
+            raise
+
+    def release(self, conn, broken: bool = False):
+        # 열린 읽기 트랜잭션이 남아 있으면 WAL checkpoint 를 막으므로 정리
+        if not broken:
+            try:
+                if conn.in_transaction:
+                    conn.rollback()
+            except sqlite3.Error:
+                broken = True
+
+        with self._cond:
+            self._in_use -= 1
+            if broken or self._closed or len(self._idle) >= self.size:
+                self._discard(conn)
+            else:
+                self._idle.append((conn, time.monotonic()))
+            self._cond.notify()
+
+    @contextmanager
+    def connection(self, cancel=None):
+        """
+        cancel: 호출 시 True 를 반환하면 실행 중인 쿼리를 중단하는 함수
+                (sqlite3.OperationalError "interrupted" 발생)
+        """
+        conn = self.acquire()
+        broken = False
+        if cancel is not None:
+            conn.set_progress_handler(lambda: 1 if cancel() else 0, 10_000)
+        try:
+            yield conn
+        except sqlite3.DatabaseError as e:
+            # "no such table", "database is locked" 같은 일반 오류는 커넥션 재사용
+            msg = str(e)
+            broken = (not isinstance(e, sqlite3.OperationalError)
+                      or "disk I/O" in msg or "malformed" in msg)
+            raise
+        finally:
+            if cancel is not None:
+                conn.set_progress_handler(None, 0)
+            self.release(conn, broken=broken)
+
+    # ---------------------------------------------------------
+    def stats(self) -> dict:
+        with self._cond:
+            s = dict(self._stats)
+            s["idle"] = len(self._idle)
+            s["in_use"] = self._in_use
+        return s
+
+    def close(self):
+        with self._cond:
+            self._closed = True
+            while self._idle:
+                conn, _ = self._idle.pop()
+                try:
+                    conn.close()
+                except Exception:
+                    pass
+            self._cond.notify_all()
+
+
+_read_pool = None
+_read_pool_lock = threading.Lock()
+
+
+def get_read_pool() -> ReadOnlyPool:
+    global _read_pool
+    with _read_pool_lock:
+        if _read_pool is None:
+            _read_pool = ReadOnlyPool()
+        return _read_pool
+
+
+def read_connection(cancel=None):
+    """풀에서 읽기 전용 커넥션을 빌려오는 context manager"""
+    return get_read_pool().connection(cancel)
+
+
+def read_pool_stats() -> dict:
+    return get_read_pool().stats()
+
+
+def close_read_pool():
+    global _read_pool
+    with _read_pool_lock:
+        if _read_pool is not None:
+            _read_pool.close()
+            _read_pool = None
+
+
+# ----------------------------------------------------------------------
+# DB 변경 감지 (새 commit 이 있을 때만 화면 갱신)
+# ----------------------------------------------------------------------
+class ChangeDetector:
+    """
+    다른 커넥션(파서)이 commit 했는지 값싸게 확인한다.
+
+    1) DB / -wal 파일 크기·mtime 이 그대로면 DB 를 읽지 않고 "변경 없음"
+    2) 바뀌었으면 전용 커넥션의 PRAGMA data_version 으로 실제 commit 여부 확인
+
+    초당 여러 번 poll() 해도 파서가 쉬는 동안에는 stat 호출만 일어난다.
+    """
+
+    def __init__(self, db_path: str = None):
+        self.db_path = db_path or DB_PATH
+        self._conn = None
+        self._file_sig = None
+        self._data_version = None
+        self._started = False
+        self.polls = 0
+        self.changes = 0
+
+    def _stat_signature(self):
+        if is_memory_db(self.db_path):
+            # 파일이 없으므로 매번 data_version 으로 확인
+            return None
+        sig = []
+        for path in (self.db_path, self.db_path + "-wal"):
+            try:
+                st = os.stat(path)
+                sig.append((st.st_size, st.st_mtime_ns))
+            except OSError:
+                sig.append(None)
+        return tuple(sig)
+
+    def _read_data_version(self):
+        if self._conn is None:
+            uri = MEMORY_URI if is_memory_db(self.db_path) else f"file:{self.db_path}?mode=ro"
+            self._conn = sqlite3.connect(
+                uri, uri=True,
+                timeout=1.0, check_same_thread=False
+            )
+        return self._conn.execute("PRAGMA data_version").fetchone()[0]
+
+    def poll(self) -> bool:
+        """마지막 poll() 이후 새 commit 이 있으면 True (첫 호출은 항상 True)"""
+        self.polls += 1
+
+        sig = self._stat_signature()
+        if self._started and sig is not None and sig == self._file_sig:
+            return False
+        self._started = True
+        self._file_sig = sig
+
+        try:
+            version = self._read_data_version()
+        except sqlite3.Error:
+            # DB 를 열 수 없으면 파일 변화만으로 판단
+            self.close()
+            self.changes += 1
+            return True
+
+        if version == self._data_version:
+            return False
+
+        self._data_version = version
+        self.changes += 1
+        return True
+
+    def close(self):
+        if self._conn is not None:
+            try:
+                self._conn.close()
+            except Exception:
+                pass
+            self._conn = None
+
+
+# ----------------------------------------------------------------------
+# 스키마 조회 / 인덱스
+# ----------------------------------------------------------------------
+_table_columns_cache = {}
+_indexed_tables = set()
+
+
+def quote_ident(name: str) -> str:
+    return '"' + str(name).replace('"', '""') + '"'
+
+
+def get_table_columns(table: str, refresh: bool = False, conn=None) -> list:
+    """
+    테이블 컬럼 목록 (PRAGMA table_info 결과 캐시)
+    conn 을 주면 그 커넥션으로 조회 (풀에서 또 빌리지 않음)
+    """
+    if not refresh and table in _table_columns_cache:
+        return _table_columns_cache[table]
+
+    if conn is not None:
+        rows = conn.execute(f"PRAGMA table_info({quote_ident(table)})").fetchall()
+    else:
+        with read_connection() as conn:
+            rows = conn.execute(f"PRAGMA table_info({quote_ident(table)})").fetchall()
+
+    cols = [r[1] for r in rows]
+    if cols:
+        _table_columns_cache[table] = cols
+    return cols
+
+
+def has_datetime_index(table: str, conn, column: str = "datetime") -> bool:
+    for idx in conn.execute(f"PRAGMA index_list({quote_ident(table)})").fetchall():
+        info = conn.execute(f"PRAGMA index_info({quote_ident(idx[1])})").fetchall()
+        # 첫 번째 키가 시간 컬럼인 인덱스면 범위 검색에 사용 가능
+        if info and sorted(info)[0][2] == column:
+            return True
+    return False
+
+
+def ensure_datetime_index(table: str, column: str = "datetime") -> bool:
+    """
+    시간 컬럼(기본 datetime) 인덱스가 있는지 확인하고 없으면 생성한다.
+    DB 쓰기 권한이 없으면 False 반환 (조회는 인덱스 없이 계속 동작).
+    """
+    key = (table, column)
+    if key in _indexed_tables:
+        return True
+
+    try:
+        if column not in get_table_columns(table):
+            return False
+        with read_connection() as conn:
+            if has_datetime_index(table, conn, column):
+                _indexed_tables.add(key)
+                return True
+    except Exception as e:
+        print(f"[db_manager] 인덱스 확인 실패 ({table}): {e}")
+        return False
+
+    conn = None
+    try:
+        conn = get_connection()
+        conn.execute(
+            f"CREATE INDEX IF NOT EXISTS {quote_ident(f'idx_{table}_{column}')} "
+            f"ON {quote_ident(table)}({quote_ident(column)})"
+        )
+        conn.commit()
+        _indexed_tables.add(key)
+        return True
+    except Exception as e:
+        print(f"[db_manager] 인덱스 생성 실패 ({table}): {e}")
+        return False
+    finally:
+        if conn is not None:
+            conn.close()
+
+
+# ----------------------------------------------------------------------
+# 로그 테이블 페이지 조회 (keyset pagination)
+# ----------------------------------------------------------------------
+# 커서 = (시간, rowid). 같은 시각의 행이 여러 개여도 빠지거나 겹치지 않도록 rowid 로 구분
+LOG_TABLES = {
+    "parsing": ("_Parsing_history_", "Parsed_at", "Log_name"),
+    "event": ("Event", "datetime", "message"),
+}
+
+
+def fetch_log_page(kind: str, limit: int = 100, before=None, after=None, conn=None) -> list:
+    """
+    로그 테이블을 최신순으로 limit 개 조회 → [(시간, 내용, rowid), ...]
+
+        before=(시간, rowid): 그보다 오래된 행 (위로 스크롤 시 다음 페이지)
+        after=(시간, rowid):  그보다 새로운 행 (새로 들어온 로그)
+    실패하면 예외를 그대로 올린다.
+    """
+    table, time_col, text_col = LOG_TABLES[kind]
+
+    where, params = [], []
+    if before is not None:
+        where.append(f"({quote_ident(time_col)}, rowid) < (?, ?)")
+        params += list(before)
+    if after is not None:
+        where.append(f"({quote_ident(time_col)}, rowid) > (?, ?)")
+        params += list(after)
+
+    sql = (
+        f"SELECT {quote_ident(time_col)}, {quote_ident(text_col)}, rowid "
+        f"FROM {quote_ident(table)} "
+        + (f"WHERE {' AND '.join(where)} " if where else "")
+        + f"ORDER BY {quote_ident(time_col)} DESC, rowid DESC LIMIT ?"
+    )
+    params.append(int(limit))
+
+    if conn is not None:
+        return conn.execute(sql, params).fetchall()
+    with read_connection() as conn:
+        return conn.execute(sql, params).fetchall()
+
+
 def fetch_event_logs(limit=10):
-    conn = get_connection(readonly=True)  # 🔥 이렇게
-    cursor = conn.cursor()
+    """Event 테이블 최신순 → [(datetime, message), ...] (오류 시 빈 목록)"""
     try:
-        cursor.execute(f"""
-            SELECT datetime, message
-            FROM Event
-            ORDER BY datetime DESC
-            LIMIT {limit}
-        """)
-        rows = cursor.fetchall()
+        rows = [(at, text) for at, text, _ in fetch_log_page("event", limit)]
     except Exception as e:
         print("DB 오류:", e)
         rows = []
-    finally:
-        conn.close()
     return rows
+
+
+def search_logs(query: str, limit: int = 50, offset: int = 0, kinds=None) -> list:
+    """
+    _Parsing_history_ / Event 전체에서 검색 → [(시간, 내용, kind), ...]
+    log_search 인덱스가 설치돼 있으면 FTS5 관련도 순, 없으면 LIKE 로 최신순.
+    실패하면 예외를 그대로 올린다.
+    """
+    from log_search import installed_kinds, search
+
+    kinds = list(kinds or LOG_TABLES)
+    if not query.strip():
+        return []
+
+    with read_connection() as conn:
+        indexed = set(installed_kinds(conn))
+        if indexed.issuperset(kinds):
+            return search(conn, query, limit, offset, kinds)
+
+        # 인덱스 미설치: 전체 스캔 (느림)
+        parts, params = [], []
+        pattern = "%" + query.strip().replace("\\", "\\\\").replace("%", "\\%").replace("_", "\\_") + "%"
+        for kind in kinds:
+            table, time_col, text_col = LOG_TABLES[kind]
+            if not get_table_columns(table, conn=conn):
+                continue
+            parts.append(
+                f"SELECT {quote_ident(time_col)} AS at, {quote_ident(text_col)}, ? "
+                f"FROM {quote_ident(table)} "
+                f"WHERE {quote_ident(text_col)} LIKE ? ESCAPE '\\'"
+            )
+            params += [kind, pattern]
+        if not parts:
+            return []
+
+        sql = " UNION ALL ".join(parts) + " ORDER BY at DESC LIMIT ? OFFSET ?"
+        return conn.execute(sql, params + [int(limit), int(offset)]).fetchall()
@@ -0,0 +1,178 @@
+import sys
+
+import db_manager
+from db_manager import quote_ident, LOG_TABLES
+
+
+# FTS5 테이블 / 트리거 이름 접두사
+FTS_TABLE = "log_fts"
+TRIGGER_PREFIX = "log_fts__"
+
+# 원본 rowid → FTS rowid (원본 테이블 구분용 하위 비트)
+KIND_CODE = {"parsing": 0, "event": 1}
+
+
+def trigger_name(kind: str, op: str) -> str:
+    return f"{TRIGGER_PREFIX}{kind}_{op}"
+
+
+# ----------------------------------------------------------------------
+# 전문 검색 인덱스 (선택 설치)
+# ----------------------------------------------------------------------
+def _create_table(conn):
+    conn.execute(f"""
+        CREATE VIRTUAL TABLE IF NOT EXISTS {FTS_TABLE} USING fts5(
+            text,
+            kind UNINDEXED,
+            at   UNINDEXED
+        )
+    """)
+
+
+def _trigger_sqls(kind: str) -> list:
+    """원본 INSERT / DELETE / UPDATE 를 FTS 에 반영하는 트리거 3개"""
+    table, time_col, text_col = LOG_TABLES[kind]
+    code = KIND_CODE[kind]
+    src = quote_ident(table)
+
+    insert = (f"INSERT INTO {FTS_TABLE}(rowid, text, kind, at) "
+              f"VALUES (NEW.rowid * 2 + {code}, NEW.{quote_ident(text_col)}, "
+              f"'{kind}', NEW.{quote_ident(time_col)});")
+    delete = f"DELETE FROM {FTS_TABLE} WHERE rowid = OLD.rowid * 2 + {code};"
+
+    return [
+        f"CREATE TRIGGER {quote_ident(trigger_name(kind, 'ai'))} "
+        f"AFTER INSERT ON {src} BEGIN {insert} END",
+        f"CREATE TRIGGER {quote_ident(trigger_name(kind, 'ad'))} "
+        f"AFTER DELETE ON {src} BEGIN {delete} END",
+        f"CREATE TRIGGER {quote_ident(trigger_name(kind, 'au'))} "
+        f"AFTER UPDATE ON {src} BEGIN {delete} {insert} END",
+    ]
+
+
+def _drop_triggers(conn, kind: str):
+    for op in ("ai", "ad", "au"):
+        conn.execute(f"DROP TRIGGER IF EXISTS {quote_ident(trigger_name(kind, op))}")
+
+
+def install(kinds=None) -> list:
+    """
+    log_fts 테이블과 트리거를 만들고 기존 행으로 채운다.
+    Event 테이블이 없으면 데몬과 같은 스키마로 만든다 (_Parsing_history_ 는 파서 소유라 건너뜀).
+    설치된 kind 목록 반환.
+    """
+    conn = db_manager.get_connection()
+    installed = []
+    try:
+        _create_table(conn)
+        conn.execute("""
+            CREATE TABLE IF NOT EXISTS Event (
+                datetime TEXT,
+                message  TEXT
+            )
+        """)
+
+        for kind in (kinds or LOG_TABLES):
+            table, time_col, text_col = LOG_TABLES[kind]
+            cols = db_manager.get_table_columns(table, refresh=True, conn=conn)
+            if time_col not in cols or text_col not in cols:
+                print(f"[log_search] 테이블/컬럼 없음, 건너뜀: {table}")
+                continue
+
+            _drop_triggers(conn, kind)
+            for sql in _trigger_sqls(kind):
+                conn.execute(sql)
+
+            # 초기값
+            conn.execute(f"DELETE FROM {FTS_TABLE} WHERE kind = ?", (kind,))
+            conn.execute(f"""
+                INSERT INTO {FTS_TABLE}(rowid, text, kind, at)
+                SELECT rowid * 2 + ?, {quote_ident(text_col)}, ?, {quote_ident(time_col)}
+                FROM {quote_ident(table)}
+            """, (KIND_CODE[kind], kind))
+
+            installed.append(kind)
+
+        conn.execute(f"INSERT INTO {FTS_TABLE}({FTS_TABLE}) VALUES ('optimize')")
+        conn.commit()
+    except Exception:
+        conn.rollback()
+        raise
+    finally:
+        conn.close()
+
+    return installed
+
+
+def uninstall():
+    """트리거와 log_fts 테이블 삭제"""
+    conn = db_manager.get_connection()
+    try:
+        for kind in LOG_TABLES:
+            _drop_triggers(conn, kind)
+        conn.execute(f"DROP TABLE IF EXISTS {FTS_TABLE}")
+        conn.commit()
+    finally:
+        conn.close()
+
+
+# ----------------------------------------------------------------------
+# 조회
+# ----------------------------------------------------------------------
+def installed_kinds(conn) -> list:
+    rows = conn.execute(
+        "SELECT name FROM sqlite_master "
+        "WHERE type = 'trigger' AND name LIKE ? ESCAPE '\\'",
+        (TRIGGER_PREFIX.replace("_", r"\_") + "%\\_ai",)
+    ).fetchall()
+    return [name[len(TRIGGER_PREFIX):-len("_ai")] for (name,) in rows]
+
+
+def match_expression(query: str) -> str:
+    """
+    입력 문자열 → FTS5 MATCH 식.
+    단어마다 접두어 검색, 모든 단어 포함 (예: 'x1 level' → "x1"* "level"*)
+    """
+    terms = [t.replace('"', '""') for t in query.split()]
+    return " ".join(f'"{t}"*' for t in terms if t)
+
+
+def search(conn, query: str, limit: int = 50, offset: int = 0, kinds=None) -> list:
+    """
+    관련도 순 (같으면 최신순) 검색 → [(시간, 내용, kind), ...]
+    설치되지 않았으면 sqlite3.OperationalError (no such table)
+    """
+    expr = match_expression(query)
+    if not expr:
+        return []
+
+    sql = f"SELECT at, text, kind FROM {FTS_TABLE} WHERE {FTS_TABLE} MATCH ?"
+    params = [expr]
+    if kinds:
+        sql += f" AND kind IN ({', '.join('?' * len(kinds))})"
+        params += list(kinds)
+    sql += " ORDER BY rank, at DESC LIMIT ? OFFSET ?"
+    params += [int(limit), int(offset)]
+
+    return conn.execute(sql, params).fetchall()
+
+
+# ----------------------------------------------------------------------
+# 설치: python log_search.py [DB 경로]
+#       python log_search.py --uninstall [DB 경로]
+# ----------------------------------------------------------------------
+if __name__ == "__main__":
+    args = sys.argv[1:]
+    remove = "--uninstall" in args
+    args = [a for a in args if a != "--uninstall"]
+
+    if args:
+        db_manager.set_db_path(args.pop(0))
+
+    if remove:
+        uninstall()
+        print("log_fts 제거 완료")
+        sys.exit(0)
+
+    for kind in install():
+        print(f"{LOG_TABLES[kind][0]}: 검색 인덱스 설치")
@@ -0,0 +1,228 @@
+import time
+
+from PyQt6.QtCore import QObject, QTimer, QEvent
+
+
+# 이 간격 안에 예정된 작업은 한 번 깨어날 때 같이 실행
+COALESCE_MS = 50
+
+# when_hidden 동작
+PAUSE = "pause"        # 숨겨진 동안 실행 안 함, 다시 보이면 즉시 1회 실행
+THROTTLE = "throttle"  # 숨겨진 동안 간격을 HIDDEN_SLOWDOWN 배로
+
+HIDDEN_SLOWDOWN = 10
+
+
+def _now_ms() -> float:
+    return time.monotonic() * 1000.0
+
+
+class ScheduledTask:
+    __slots__ = (
+        "name", "func", "base_interval", "interval",
+        "widget", "when_hidden", "enabled", "due", "held",
+        "runs", "skipped", "total_ms", "worst_ms",
+    )
+
+    def __init__(self, name, func, interval_ms, widget, when_hidden):
+        self.name = name
+        self.func = func
+        self.base_interval = interval_ms
+        self.interval = interval_ms
+        self.widget = widget
+        self.when_hidden = when_hidden
+        self.enabled = True
+        self.due = None       # 다음 실행 시각 (monotonic ms), None = 대기 없음
+        self.held = False     # 숨김 때문에 미뤄진 실행이 있음
+
+        self.runs = 0
+        self.skipped = 0
+        self.total_ms = 0.0
+        self.worst_ms = 0.0
+
+
+# ----------------------------------------------------------------------
+# 앱 공용 스케줄러 (QTimer 하나로 모든 주기 작업 실행)
+# ----------------------------------------------------------------------
+class UiScheduler(QObject):
+    """
+    주기 작업을 하나의 single-shot 타이머로 묶어 실행한다.
+
+    - 가까운 시각(COALESCE_MS)에 예정된 작업은 한 번에 실행
+    - widget 을 준 작업은 위젯이 숨겨지거나 창이 최소화되면 멈춤/감속
+    - interval_ms=None 인 작업은 trigger() 로 요청할 때만 1회 실행 (여러 번 요청해도 한 번)
+    - 작업별 실행 횟수 / 소요 시간을 stats() 로 확인
+    """
+
+    def __init__(self, coalesce_ms: int = COALESCE_MS, parent=None):
+        super().__init__(parent)
+        self.coalesce_ms = coalesce_ms
+        self.tasks = {}
+        self.wakeups = 0
+
+        self._windows = set()
+
+        self._timer = QTimer(self)
+        self._timer.setSingleShot(True)
+        self._timer.timeout.connect(self._run_due)
+
+    # ---------------------------------------------------------
+    # 등록 / 제어
+    # ---------------------------------------------------------
+    def add(self, name: str, func, interval_ms: int = None, widget=None,
+            when_hidden: str = PAUSE, enabled: bool = True) -> ScheduledTask:
+        """같은 이름이 있으면 교체"""
+        task = ScheduledTask(name, func, interval_ms, widget, when_hidden)
+        task.enabled = enabled
+        if interval_ms is not None:
+            task.due = _now_ms() + interval_ms
+        self.tasks[name] = task
+
+        if widget is not None:
+            # 위젯 자체가 다시 보일 때 (접힌 패널 펼침 등)
+            widget.installEventFilter(self)
+            widget.destroyed.connect(lambda *_, n=name, t=task: self._remove_if(n, t))
+
+        self._reschedule()
+        return task
+
+    def remove(self, name: str):
+        if self.tasks.pop(name, None) is not None:
+            self._reschedule()
+
+    def _remove_if(self, name, task):
+        if self.tasks.get(name) is task:
+            self.remove(name)
+
+    def trigger(self, name: str):
+        """가능한 빨리 1회 실행 (이미 요청돼 있으면 합쳐짐)"""
+        task = self.tasks.get(name)
+        if task is None:
+            return
+        task.due = _now_ms()
+        self._reschedule()
+
+    def set_enabled(self, name: str, on: bool):
+        task = self.tasks.get(name)
+        if task is None or task.enabled == on:
+            return
+        task.enabled = on
+        task.held = False
+        if on and task.base_interval is not None:
+            task.interval = task.base_interval
+            task.due = _now_ms() + task.interval
+        self._reschedule()
+
+    # ---------------------------------------------------------
+    # 실행
+    # ---------------------------------------------------------
+    def _visible(self, task) -> bool:
+        w = task.widget
+        if w is None:
+            return True
+        win = w.window()
+        if win not in self._windows:
+            # 다시 보일 때 미뤄둔 작업을 깨우기 위해 창 상태 감시
+            self._windows.add(win)
+            win.installEventFilter(self)
+            win.destroyed.connect(lambda *_, x=win: self._windows.discard(x))
+        return w.isVisible() and not win.isMinimized()
+
+    def _run_due(self):
+        self.wakeups += 1
+        now = _now_ms()
+        limit = now + self.coalesce_ms
+
+        for task in list(self.tasks.values()):
+            if not task.enabled or task.due is None or task.due > limit:
+                continue
+
+            if not self._visible(task):
+                task.skipped += 1
+                if task.when_hidden == THROTTLE and task.interval is not None:
+                    task.due = now + task.interval * HIDDEN_SLOWDOWN
+                else:
+                    task.held = True
+                    task.due = None
+                continue
+
+            self._run(task, now)
+
+        self._reschedule()
+
+    def _run(self, task, now):
+        task.held = False
+        start = time.perf_counter()
+        try:
+            task.func()
+        except Exception as e:
+            print(f"[UiScheduler] {task.name} 실패: {e}")
+        cost = (time.perf_counter() - start) * 1000.0
+
+        task.runs += 1
+        task.total_ms += cost
+        task.worst_ms = max(task.worst_ms, cost)
+
+        if task.base_interval is None:
+            task.due = None
+            return
+
+        task.due = now + task.interval
+
+    def _reschedule(self):
+        dues = [t.due for t in self.tasks.values() if t.enabled and t.due is not None]
+        try:
+            if not dues:
+                self._timer.stop()
+                return
+            self._timer.start(max(0, int(min(dues) - _now_ms())))
+        except RuntimeError:
+            # 앱 종료 중 (위젯 정리보다 타이머가 먼저 삭제됨)
+            pass
+
+    def eventFilter(self, obj, event):
+        if event.type() in (QEvent.Type.Show, QEvent.Type.WindowStateChange):
+            woke = False
+            for task in self.tasks.values():
+                if task.held and task.enabled and self._visible(task):
+                    task.held = False
+                    task.due = _now_ms()
+                    woke = True
+            if woke:
+                self._reschedule()
+        return False
+
+    # ---------------------------------------------------------
+    # 비용 보고
+    # ---------------------------------------------------------
+    def stats(self) -> list:
+        rows = []
+        for t in self.tasks.values():
+            rows.append({
+                "name": t.name,
+                "runs": t.runs,
+                "skipped": t.skipped,
+                "total_ms": round(t.total_ms, 1),
+                "avg_ms": round(t.total_ms / t.runs, 2) if t.runs else 0.0,
+                "worst_ms": round(t.worst_ms, 1),
+                "interval_ms": t.interval,
+            })
+        return sorted(rows, key=lambda r: -r["total_ms"])
+
+    def print_report(self):
+        print(f"[UiScheduler] 깨어남 {self.wakeups}회")
+        for r in self.stats():
+            print(f"[UiScheduler] {r['name']:<16} 실행 {r['runs']:>6} / 건너뜀 {r['skipped']:>6}"
+                  f"  합계 {r['total_ms']:>9.1f}ms  평균 {r['avg_ms']:>6.2f}ms"
+                  f"  최대 {r['worst_ms']:>7.1f}ms  간격 {r['interval_ms']}")
+
+
+_scheduler = None
+
+
+def get_scheduler() -> UiScheduler:
+    """앱 전체에서 하나의 스케줄러를 공유"""
+    global _scheduler
+    if _scheduler is None:
+        _scheduler = UiScheduler()
+    return _scheduler
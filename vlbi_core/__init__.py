@@ -0,0 +1,13 @@
+# Qt 없이 쓰는 데이터 / 임계값 로직 (모니터링, 대시보드, 데몬 공용)
+#
+#   device_map       장비 ↔ 테이블 / 컬럼 정의 (임계값 설정 창 포함)
+#   snapshot         장비 테이블 최신 (병합) row 스냅샷, 통신 상태
+#   latest_values    최신값 트리거 (선택 설치)
+#   threshold_engine 임계값 판정 (NumPy)
+#   alerts           알람 레코드 / 스냅샷 판정
+#   series_store     시계열 배열 저장소
+#   series_loader    대시보드 구간 / 증분 조회
+#   rollup_manager   집계 테이블 (분/시/일)
+#   downsample       화면 폭 기준 다운샘플링
+#   report           그래프 / 보고서 데이터 (통계 포함)
+#   synth_db         부하 / 규모 테스트용 합성 DB 생성
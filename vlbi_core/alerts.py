@@ -0,0 +1,113 @@
+from dataclasses import dataclass
+
+
+# ----------------------------------------------------------------------
+# 알람 한 건 (장비 컬럼 하나의 현재 위반 상태)
+# ----------------------------------------------------------------------
+@dataclass(frozen=True, slots=True)
+class Alert:
+    device: str
+    table: str
+    column: str
+    value: float
+    level: str      # "yellow" / "red"
+    side: str       # "lower" / "upper"
+    bound: float
+    timestamp: str  # 판정한 row 의 datetime
+
+    @property
+    def key(self) -> tuple:
+        return (self.table, self.column)
+
+    @property
+    def label(self) -> str:
+        return f"{self.device} - {self.column}: {self.value}"
+
+
+# ----------------------------------------------------------------------
+# 한 번의 판정 결과 전체
+# ----------------------------------------------------------------------
+class AlertSet:
+    """
+    Alert 묶음을 (side, level) / 장비 별로 색인해 둔다.
+
+        alerts = AlertSet(alert_list)
+        alerts.group("upper", "red")   → 해당 카드 목록
+        alerts.for_device("2GHz Receiver")
+        alerts.same_state(previous)    → 화면 갱신이 필요 없는지
+    """
+
+    __slots__ = ("by_key", "by_group", "by_device", "signature")
+
+    def __init__(self, alerts=()):
+        self.by_key = {}
+        self.by_group = {}
+        self.by_device = {}
+
+        for a in alerts:
+            self.by_key[a.key] = a
+            self.by_group.setdefault((a.side, a.level), []).append(a)
+            self.by_device.setdefault(a.device, []).append(a)
+
+        # 값 변화는 무시하고 어떤 컬럼이 어느 단계인지만 비교
+        self.signature = frozenset((k, a.side, a.level) for k, a in self.by_key.items())
+
+    def __len__(self):
+        return len(self.by_key)
+
+    def __iter__(self):
+        return iter(self.by_key.values())
+
+    def group(self, side: str, level: str) -> list:
+        return self.by_group.get((side, level), [])
+
+    def count(self, side: str, level: str) -> int:
+        return len(self.by_group.get((side, level), ()))
+
+    def for_device(self, device: str) -> list:
+        return self.by_device.get(device, [])
+
+    def has_level(self, level: str) -> bool:
+        return any(lv == level for (_, lv), lst in self.by_group.items() if lst)
+
+    def same_state(self, other) -> bool:
+        return other is not None and self.signature == other.signature
+
+
+# ----------------------------------------------------------------------
+# 스냅샷 전체 판정 (모니터링 tick / 데몬 공용)
+# ----------------------------------------------------------------------
+def evaluate_snapshot(engine, snapshot, device_table_map, on_error=None):
+    """
+    장비별 최신 row 를 임계값으로 판정한다.
+    반환: (AlertSet, episode_items)
+          episode_items 는 AlarmEpisodeStore.update_many 입력
+          [(table, device, col_names, row, violations), ...]
+    조회에 실패한 테이블은 on_error(table, exc) 호출 후 건너뜀.
+    """
+    alerts = []
+    episode_items = []
+
+    for device, table in device_table_map.items():
+        if not table:
+            continue
+
+        try:
+            col_names, row = snapshot.get(table)
+        except Exception as e:
+            if on_error is not None:
+                on_error(table, e)
+            continue
+
+        if not row:
+            continue
+
+        violations = engine.classify_row(table, col_names, row)
+        episode_items.append((table, device, col_names, row, violations))
+
+        ts = str(row[col_names.index("datetime")]) if "datetime" in col_names else ""
+        for v in violations:
+            alerts.append(Alert(device, table, v.column, v.value,
+                                v.level, v.side, v.bound, ts))
+
+    return AlertSet(alerts), episode_items
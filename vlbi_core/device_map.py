@@ -0,0 +1,234 @@
+# 장비 ↔ DB 테이블 정의 (Qt 없이 모니터링 / 대시보드 / 데몬 공용)
+
+DEVICE_TABLE_MAP = {
+    "2GHz Receiver": "frontend_2ghz",
+    "8GHz Receiver": "frontend_8ghz",
+    "22GHz Receiver": "frontend_22ghz",
+    "43GHz Receiver": "frontend_43ghz",
+    "S/X Down Converter": "SXDownConverter",
+    "K Down Converter": "KDownConverter",
+    "Q Down Converter": "QDownConverter",
+    "Video Converter 1": None,
+    "Video Converter 2": "VideoConverter2",
+    "IF Selector": "IFselector",
+}
+
+# 여러 줄을 합쳐야 하는 테이블에 대한 row 개수 정의
+ROW_MERGE_COUNT = {
+    "SXDownConverter": 3,
+    "KDownConverter": 3,
+    "QDownConverter": 3,
+    "IFselector": 3,
+    "VideoConverter2": 5,
+}
+
+
+# ----------------------------------------------------------------------
+#  DB 매핑: 대시보드 좌측 메뉴 텍스트  →  테이블 / 컬럼명
+# ----------------------------------------------------------------------
+TABLE_MAP = {
+    "2GHz 수신기 상태 모니터": {
+        "table": "frontend_2ghz",
+        "columns": {
+            "Normal Temperature RF":           "NormalTemp_RF",
+            "Normal Temperature Load":         "NormalTemp_Load",
+            "LNA Monitor LHCP Vd":             "LNA_LHCP_Vd1",
+            "LNA Monitor LHCP Id":             "LNA_LHCP_Id1",
+            "LNA Monitor RHCP Vd":             "LNA_RHCP_Vd1",
+            "LNA Monitor RHCP Id":             "LNA_RHCP_Id1",
+            "Cryogenic Temperature Cold":      "Cryo_ColdPla",
+            "Cryogenic Temperature Shild Box": "Cryo_ShieldBox",
+            "Pressure Sensor CH1":             "Pressure",
+            "RF out Power RHCP":               "RF_RHCP",
+            "RF out Power LHCP":               "RF_LHCP",
+        }
+    },
+    "8GHz 수신기 상태 모니터": {
+        "table": "frontend_8ghz",
+        "columns": {
+            "Normal Temperature RF":           "NormalTemp_RF",
+            "Normal Temperature Load":         "NormalTemp_Load",
+            "LNA Monitor LHCP Vg1":            "LNA_LHCP_Vg1",
+            "LNA Monitor LHCP Vg2":            "LNA_LHCP_Vg2",
+            "LNA Monitor RHCP Vd":             "LNA_RHCP_Vd1",
+            "LNA Monitor RHCP Id":             "LNA_RHCP_Id1",
+            # ★ 오타 수정: NA_RHCP_Vg1/Vg2 → LNA_RHCP_Vg1/Vg2
+            "LNA Monitor RHCP Vg1":            "LNA_RHCP_Vg1",
+            "LNA Monitor RHCP Vg2":            "LNA_RHCP_Vg2",
+            "LNA Monitor LHCP Vd":             "LNA_LHCP_Vd1",
+            "LNA Monitor LHCP Id":             "LNA_LHCP_Id1",
+            "Cryogenic Temperature Cold":      "Cryo_ColdPla",
+            "Cryogenic Temperature Shild Box": "Cryo_ShieldBox",
+            "Pressure Sensor CH1":             "Pressure",
+            "RF out Power RHCP":               "RF_RHCP",
+            "RF out Power LHCP":               "RF_LHCP",
+        }
+    },
+    "22GHz 수신기 상태 모니터": {
+        "table": "frontend_22ghz",
+        "columns": {
+            "Normal Temperature RF":           "NormalTemp_RF",
+            "Normal Temperature LO":           "NormalTemp_Load",
+            "LNA Monitor LHCP Vg1":            "LNA_LHCP_Vg1",
+            "LNA Monitor LHCP Vg2":            "LNA_LHCP_Vg2",
+            "LNA Monitor RHCP Vd":             "LNA_RHCP_Vd1",
+            "LNA Monitor RHCP Id":             "LNA_RHCP_Id1",
+            # ★ 오타 수정
+            "LNA Monitor RHCP Vg1":            "LNA_RHCP_Vg1",
+            "LNA Monitor RHCP Vg2":            "LNA_RHCP_Vg2",
+            "LNA Monitor LHCP Vd":             "LNA_LHCP_Vd1",
+            "LNA Monitor LHCP Id":             "LNA_LHCP_Id1",
+            "Cryogenic Temperature Cold":      "Cryo_ColdPla",
+            "Cryogenic Temperature Shild Box": "Cryo_ShieldBox",
+            "Pressure Sensor CH1":             "Pressure",
+            "RF out Power RF":                 "RF_RHCP",
+            "RF out Power LO":                 "RF_Low",
+        }
+    },
+    "43GHz 수신기 상태 모니터": {
+        "table": "frontend_43ghz",
+        "columns": {
+            "Normal Temperature RF":           "NormalTemp_RF",
+            "Normal Temperature LO":           "NormalTemp_Load",
+            "LNA Monitor LHCP Vg1":            "LNA_LHCP_Vg1",
+            "LNA Monitor LHCP Vg2":            "LNA_LHCP_Vg2",
+            "LNA Monitor RHCP Vd":             "LNA_RHCP_Vd1",
+            "LNA Monitor RHCP Id":             "LNA_RHCP_Id1",
+            # ★ 오타 수정
+            "LNA Monitor RHCP Vg1":            "LNA_RHCP_Vg1",
+            "LNA Monitor RHCP Vg2":            "LNA_RHCP_Vg2",
+            "LNA Monitor LHCP Vd":             "LNA_LHCP_Vd1",
+            "LNA Monitor LHCP Id":             "LNA_LHCP_Id1",
+            "Cryogenic Temperature Cold":      "Cryo_ColdPla",
+            "Cryogenic Temperature Shild Box": "Cryo_ShieldBox",
+            "Pressure Sensor CH1":             "Pressure",
+            "RF out Power RHCP":               "RF_RHCP",
+            "RF out Power LHCP":               "RF_LHCP",
+            "RF out Power LO":                 "RF_Low",
+        }
+    },
+    "S/X 다운 컨버터": {
+        "table": "SXDown",
+        "columns": {
+            "S":  "SLEVEL",
+            "X1": "X1LEVEL",
+            "X2": "X2LEVEL",
+        }
+    },
+    "K 다운 컨버터": {
+        "table": "KDown",
+        "columns": {
+            "K1": "K1LEVEL",
+            "K2": "K2LEVEL",
+            "K3": "K3LEVEL",
+            "K4": "K4LEVEL",
+        }
+    },
+    "Q 다운 컨버터": {
+        "table": "QDown",
+        "columns": {
+            "Q1": "Q1LEVEL",
+            "Q2": "Q2LEVEL",
+            "Q3": "Q3LEVEL",
+            "Q4": "Q4LEVEL",
+        }
+    },
+    # Video Converter 1: 실제 테이블 없음 → 그래프 없음 처리용
+    "Video Converter 1": {
+        "table": None,
+        "columns": {}
+    },
+    # Video Converter 2: FrameLeft에서 CH9~CH16 사용
+    "Video Converter 2": {
+        "table": "VideoConverter2",
+        "columns": {
+            "CH9":  "CH9LEVEL",
+            "CH10": "CH10LEVEL",
+            "CH11": "CH11LEVEL",
+            "CH12": "CH12LEVEL",
+            "CH13": "CH13LEVEL",
+            "CH14": "CH14LEVEL",
+            "CH15": "CH15LEVEL",
+            "CH16": "CH16LEVEL",
+        }
+    },
+    # IF Selector: CH1~CH16
+    "IF Selector": {
+        "table": "IFselector",
+        "columns": {
+            **{f"CH{i}": f"CH{i}LEVEL" for i in range(1, 17)}
+        }
+    },
+}
+
+
+# ----------------------------------------------------------------------
+#  임계값 설정 창: 장비 이름 → 테이블, 테이블 → 설정 가능한 컬럼
+# ----------------------------------------------------------------------
+THRESHOLD_DEVICE_TABLE_MAP = {
+    "2GHz 수신기": "frontend_2ghz",
+    "8GHz 수신기": "frontend_8ghz",
+    "22GHz 수신기": "frontend_22ghz",
+    "43GHz 수신기": "frontend_43ghz",
+    "Video Converter 2": "VideoConverter2",
+    "IF Selector": "IFselector",
+    "S/X 다운컨버터": "SXDown",
+    "K 다운컨버터": "KDown",
+    "Q 다운컨버터": "QDown",
+}
+
+FRONTEND_COLUMNS = [
+    "RF_RHCP", "RF_LHCP", "RF_LO",
+    "Cryo_ColdPlate", "Cryo_ShieldBox",
+    "Pressure",
+    "NormalTemp_RF", "NormalTemp_Noise", "NormalTemp_Load",
+    "LNA_LHCP_Vg1", "LNA_LHCP_Vg2", "LNA_LHCP_Vg3", "LNA_LHCP_Vg4",
+    "LNA_LHCP_Vd1", "LNA_LHCP_Vd2", "LNA_LHCP_Vd3", "LNA_LHCP_Vd4",
+    "LNA_LHCP_Id1", "LNA_LHCP_Id2", "LNA_LHCP_Id3", "LNA_LHCP_Id4",
+    "LNA_RHCP_Vg1", "LNA_RHCP_Vg2", "LNA_RHCP_Vg3", "LNA_RHCP_Vg4",
+    "LNA_RHCP_Vd1", "LNA_RHCP_Vd2", "LNA_RHCP_Vd3", "LNA_RHCP_Vd4",
+    "LNA_RHCP_Id1", "LNA_RHCP_Id2", "LNA_RHCP_Id3", "LNA_RHCP_Id4",
+]
+
+VIDEO2_COLUMNS = [
+    "LEVELU_ch1", "LEVELU_ch2", "LEVELU_ch3", "LEVELU_ch4",
+    "LEVELU_ch5", "LEVELU_ch6", "LEVELU_ch7", "LEVELU_ch8",
+    "LEVELL_ch1", "LEVELL_ch2", "LEVELL_ch3", "LEVELL_ch4",
+    "LEVELL_ch5", "LEVELL_ch6", "LEVELL_ch7", "LEVELL_ch8",
+    "LOCK_ch1", "LOCK_ch2", "LOCK_ch3", "LOCK_ch4",
+    "LOCK_ch5", "LOCK_ch6", "LOCK_ch7", "LOCK_ch8",
+    "ATT_ch1", "ATT_ch2", "ATT_ch3", "ATT_ch4",
+    "ATT_ch5", "ATT_ch6", "ATT_ch7", "ATT_ch8",
+    "ATT_ch5", "ATT_ch6", "ATT_ch7", "ATT_ch8",
+    "FRQALL_ch1", "FRQALL_ch2", "FRQALL_ch3", "FRQALL_ch4",
+    "FRQALL_ch5", "FRQALL_ch6", "FRQALL_ch7", "FRQALL_ch8",
+]
+
+IF_COLUMNS = [
+    "OUT2IN_ch1", "OUT2IN_ch2", "OUT2IN_ch3", "OUT2IN_ch4",
+    "OUT2IN_ch5", "OUT2IN_ch6", "OUT2IN_ch7", "OUT2IN_ch8",
+    "OUT2IN_ch9", "OUT2IN_ch10", "OUT2IN_ch11", "OUT2IN_ch12",
+    "OUT2IN_ch13", "OUT2IN_ch14", "OUT2IN_ch15", "OUT2IN_ch16",
+
+    "ATT_ch1", "ATT_ch2", "ATT_ch3", "ATT_ch4",
+    "ATT_ch5", "ATT_ch6", "ATT_ch7", "ATT_ch8",
+    "ATT_ch9", "ATT_ch10", "ATT_ch11", "ATT_ch12",
+    "ATT_ch13", "ATT_ch14", "ATT_ch15", "ATT_ch16",
+
+    "LEVEL_ch1", "LEVEL_ch2", "LEVEL_ch3", "LEVEL_ch4",
+    "LEVEL_ch5", "LEVEL_ch6", "LEVEL_ch7", "LEVEL_ch8",
+    "LEVEL_ch9", "LEVEL_ch10", "LEVEL_ch11", "LEVEL_ch12",
+    "LEVEL_ch13", "LEVEL_ch14", "LEVEL_ch15", "LEVEL_ch16",
+]
+
+THRESHOLD_TABLE_COLUMNS = {
+    "frontend_2ghz": FRONTEND_COLUMNS,
+    "frontend_8ghz": FRONTEND_COLUMNS,
+    "frontend_22ghz": FRONTEND_COLUMNS,
+    "frontend_43ghz": FRONTEND_COLUMNS,
+    "VideoConverter2": VIDEO2_COLUMNS,
+    "IFselector": IF_COLUMNS,
+    "SXDown": ["SLEVEL", "X1LEVEL", "X2LEVEL"],
+    "KDown": ["K1LEVEL", "K2LEVEL", "K3LEVEL", "K4LEVEL"],
+    "QDown": ["Q1LEVEL", "Q2LEVEL", "Q3LEVEL", "Q4LEVEL"],
+}
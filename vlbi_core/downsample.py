@@ -0,0 +1,119 @@
+# vlbi_core/downsample.py
+import numpy as np
+
+
+# 화면 폭을 모를 때 사용하는 기본 포인트 수
+DEFAULT_POINTS = 2000
+MAX_POINTS = 4000
+
+# 콤보박스 표시명 → 전략 키
+METHODS = {
+    "Min/Max": "minmax",
+    "LTTB": "lttb",
+    "평균": "mean",
+    "첫 값": "first",
+}
+
+
+# ----------------------------------------------------------------------
+# 버킷 분할 (시간축 균등 분할)
+# ----------------------------------------------------------------------
+def _bucket_starts(xs: np.ndarray, n_buckets: int) -> np.ndarray:
+    """시간축을 n_buckets 개 구간으로 나누고 각 버킷 첫 인덱스를 반환 (빈 버킷 제외)"""
+    span = int(xs[-1] - xs[0]) + 1
+    ids = (xs - xs[0]) * n_buckets // span
+    return np.flatnonzero(np.diff(ids, prepend=-1))
+
+
+def first(xs, ys, n_out):
+    starts = _bucket_starts(xs, n_out)
+    return xs[starts], ys[starts]
+
+
+def mean(xs, ys, n_out):
+    starts = _bucket_starts(xs, n_out)
+    counts = np.diff(np.append(starts, len(xs)))
+
+    # 시작점 기준 오프셋으로 합산 (int64 overflow 방지)
+    mx = xs[0] + np.add.reduceat(xs - xs[0], starts) // counts
+    my = np.add.reduceat(ys, starts) / counts
+    return mx, my
+
+
+def minmax(xs, ys, n_out):
+    """
+    버킷마다 최소/최대 두 점을 원래 시간 순서대로 남긴다.
+    스파이크/드롭아웃이 그대로 보인다.
+    """
+    starts = _bucket_starts(xs, max(n_out // 2, 1))
+    counts = np.diff(np.append(starts, len(xs)))
+
+    mins = np.repeat(np.minimum.reduceat(ys, starts), counts)
+    maxs = np.repeat(np.maximum.reduceat(ys, starts), counts)
+    bucket_of = np.repeat(np.arange(len(starts)), counts)
+
+    # 버킷별 첫 번째 최소/최대 위치
+    min_pos = np.flatnonzero(ys == mins)
+    min_idx = min_pos[np.flatnonzero(np.diff(bucket_of[min_pos], prepend=-1))]
+    max_pos = np.flatnonzero(ys == maxs)
+    max_idx = max_pos[np.flatnonzero(np.diff(bucket_of[max_pos], prepend=-1))]
+
+    idx = np.unique(np.concatenate([min_idx, max_idx]))
+    return xs[idx], ys[idx]
+
+
+def lttb(xs, ys, n_out):
+    """Largest-Triangle-Three-Buckets (첫/마지막 점 유지)"""
+    n = len(xs)
+    if n_out < 3:
+        return first(xs, ys, n_out)
+
+    # 넓이 계산은 float 로 (ms 정수 곱셈 overflow 방지)
+    fx = (xs - xs[0]).astype(np.float64)
+    edges = np.linspace(1, n - 1, n_out - 1).astype(np.int64)
+
+    out = np.empty(n_out, dtype=np.int64)
+    out[0] = 0
+    out[-1] = n - 1
+
+    a = 0
+    for i in range(n_out - 2):
+        lo, hi = edges[i], edges[i + 1]
+        nlo, nhi = edges[i + 1], edges[i + 2] if i + 2 < len(edges) else n
+
+        # 다음 버킷 평균점
+        cx = fx[nlo:nhi].mean()
+        cy = ys[nlo:nhi].mean()
+
+        seg_x = fx[lo:hi]
+        seg_y = ys[lo:hi]
+        area = np.abs(
+            (fx[a] - cx) * (seg_y - ys[a]) - (fx[a] - seg_x) * (cy - ys[a])
+        )
+        a = lo + int(np.argmax(area))
+        out[i + 1] = a
+
+    return xs[out], ys[out]
+
+
+_STRATEGIES = {
+    "first": first,
+    "mean": mean,
+    "minmax": minmax,
+    "lttb": lttb,
+}
+
+
+def downsample(xs, ys, n_out: int = DEFAULT_POINTS, method: str = "minmax"):
+    """
+    xs: int64 epoch ms (오름차순), ys: float 배열 (NaN 없음)
+    n_out: 목표 포인트 수 (보통 캔버스 픽셀 폭)
+    """
+    n_out = int(min(max(n_out, 2), MAX_POINTS))
+    if len(xs) <= n_out:
+        return xs, ys
+
+    func = _STRATEGIES.get(method)
+    if func is None:
+        raise ValueError(f"unknown downsample method: {method}")
+    return func(xs, ys, n_out)
@@ -0,0 +1,276 @@
+import sys
+
+import db_manager
+from db_manager import quote_ident
+
+
+# 장비 테이블별 AFTER INSERT 트리거 이름 접두사
+TRIGGER_PREFIX = "latest_values__"
+
+# 테이블별로 기억하는 최근 row datetime 개수 (병합 범위의 상한)
+# ROW_MERGE_COUNT 가 이보다 큰 테이블은 read_latest_rows 에서 빠지고 병합 쿼리로 읽는다
+WINDOW_ROWS = 8
+
+
+def trigger_name(table: str) -> str:
+    return f"{TRIGGER_PREFIX}{table}"
+
+
+# ----------------------------------------------------------------------
+# 컬럼별 최신값 테이블 (선택 설치)
+# ----------------------------------------------------------------------
+def _create_table(conn):
+    conn.execute("""
+        CREATE TABLE IF NOT EXISTS latest_values (
+            "table"   TEXT NOT NULL,
+            "column"  TEXT NOT NULL,
+            value,
+            datetime  TEXT,
+            PRIMARY KEY ("table", "column")
+        ) WITHOUT ROWID
+    """)
+    # 테이블별 최근 WINDOW_ROWS 줄의 datetime (병합 범위 계산용)
+    conn.execute("""
+        CREATE TABLE IF NOT EXISTS latest_window (
+            "table"   TEXT NOT NULL,
+            datetime  TEXT NOT NULL
+        )
+    """)
+    conn.execute("""
+        CREATE INDEX IF NOT EXISTS idx_latest_window
+        ON latest_window ("table", datetime)
+    """)
+
+
+def _trigger_sql(table: str, columns) -> str:
+    """
+    새 row 의 NULL 이 아닌 컬럼만 (값, row datetime) 으로 latest_values 에 반영.
+    늦게 들어온 과거 row 는 더 최신 값을 덮어쓰지 않는다.
+    오래된 값은 남아 있으므로 읽을 때 read_latest_rows 가 병합 범위로 거른다.
+    latest_window 에는 row datetime 을 넣고 최근 WINDOW_ROWS 줄만 남긴다.
+    """
+    name = table.replace("'", "''")
+    window = f"""
+            INSERT INTO latest_window ("table", datetime)
+            SELECT '{name}', NEW.datetime
+            WHERE NEW.datetime IS NOT NULL;
+            DELETE FROM latest_window
+            WHERE "table" = '{name}'
+              AND rowid NOT IN (
+                  SELECT rowid FROM latest_window
+                  WHERE "table" = '{name}'
+                  ORDER BY datetime DESC, rowid DESC
+                  LIMIT {WINDOW_ROWS}
+              );"""
+    upserts = "\n".join(f"""
+            INSERT INTO latest_values ("table", "column", value, datetime)
+            SELECT '{name}', '{col.replace("'", "''")}',
+                   NEW.{quote_ident(col)}, NEW.datetime
+            WHERE NEW.{quote_ident(col)} IS NOT NULL
+            ON CONFLICT ("table", "column") DO UPDATE SET
+                value = excluded.value,
+                datetime = excluded.datetime
+            WHERE latest_values.datetime IS NULL
+               OR excluded.datetime >= latest_values.datetime;"""
+        for col in columns
+    )
+    return f"""
+        CREATE TRIGGER {quote_ident(trigger_name(table))}
+        AFTER INSERT ON {quote_ident(table)}
+        BEGIN{window}{upserts}
+        END
+    """
+
+
+def install(tables) -> list:
+    """
+    latest_values 테이블과 트리거를 만들고 현재 최신값으로 채운다.
+    이미 설치된 테이블은 컬럼 변경을 반영해 트리거를 다시 만든다.
+    초기값 채우기가 풀스캔이 되지 않도록 datetime 인덱스도 만든다.
+    설치된 테이블 목록 반환.
+    """
+    tables = list(dict.fromkeys(t for t in tables if t))
+    for table in tables:
+        db_manager.ensure_datetime_index(table)
+
+    conn = db_manager.get_connection()
+    installed = []
+    try:
+        _create_table(conn)
+
+        for table in tables:
+            cols = db_manager.get_table_columns(table, refresh=True, conn=conn)
+            if "datetime" not in cols:
+                print(f"[latest_values] datetime 컬럼 없음, 건너뜀: {table}")
+                continue
+            cols = [c for c in cols if c != "datetime"]
+
+            conn.execute(f"DROP TRIGGER IF EXISTS {quote_ident(trigger_name(table))}")
+            conn.execute(_trigger_sql(table, cols))
+
+            # 초기값: 컬럼별 마지막 non-NULL 값
+            conn.execute('DELETE FROM latest_values WHERE "table" = ?', (table,))
+            conn.execute('DELETE FROM latest_window WHERE "table" = ?', (table,))
+            conn.execute(f"""
+                INSERT INTO latest_window ("table", datetime)
+                SELECT ?, datetime
+                FROM {quote_ident(table)}
+                WHERE datetime IS NOT NULL
+                ORDER BY datetime DESC
+                LIMIT {WINDOW_ROWS}
+            """, (table,))
+            for col in cols:
+                conn.execute(f"""
+                    INSERT INTO latest_values ("table", "column", value, datetime)
+                    SELECT ?, ?, {quote_ident(col)}, datetime
+                    FROM {quote_ident(table)}
+                    WHERE {quote_ident(col)} IS NOT NULL
+                    ORDER BY datetime DESC
+                    LIMIT 1
+                """, (table, col))
+
+            installed.append(table)
+
+        conn.commit()
+    except Exception:
+        conn.rollback()
+        raise
+    finally:
+        conn.close()
+
+    return installed
+
+
+def uninstall(tables=None):
+    """트리거와 latest_values / latest_window 행 제거 (tables 생략 시 전부 제거 + 테이블 삭제)"""
+    conn = db_manager.get_connection()
+    try:
+        drop_all = tables is None
+        if drop_all:
+            tables = installed_tables(conn)
+
+        for table in tables:
+            conn.execute(f"DROP TRIGGER IF EXISTS {quote_ident(trigger_name(table))}")
+
+        if drop_all:
+            conn.execute("DROP TABLE IF EXISTS latest_values")
+            conn.execute("DROP TABLE IF EXISTS latest_window")
+        else:
+            conn.executemany('DELETE FROM latest_values WHERE "table" = ?',
+                             [(t,) for t in tables])
+            conn.executemany('DELETE FROM latest_window WHERE "table" = ?',
+                             [(t,) for t in tables])
+        conn.commit()
+    finally:
+        conn.close()
+
+
+# ----------------------------------------------------------------------
+# 조회
+# ----------------------------------------------------------------------
+def installed_tables(conn) -> list:
+    rows = conn.execute(
+        "SELECT name FROM sqlite_master "
+        "WHERE type = 'trigger' AND name LIKE ? ESCAPE '\\'",
+        (TRIGGER_PREFIX.replace("_", r"\_") + "%",)
+    ).fetchall()
+    return [name[len(TRIGGER_PREFIX):] for (name,) in rows]
+
+
+def read_latest_rows(conn, tables, merge_counts=None) -> dict:
+    """
+    트리거가 설치된 테이블의 최신 (병합) row 를 읽는다.
+    fetch_latest_row_with_merge 와 같은 결과: 최근 merge_count 줄 안의 값만 사용하고,
+    그보다 오래된 값(센서 끊김 등으로 갱신이 멈춘 컬럼)은 None.
+    병합 범위는 latest_window 에서 구하므로 장비 테이블은 읽지 않는다.
+    반환: {table: (col_names, row 또는 None)} — 설치되지 않았거나
+    merge_count 가 WINDOW_ROWS 보다 큰 테이블은 빠짐
+    """
+    merge_counts = merge_counts or {}
+    wanted = {
+        t: max(int(merge_counts.get(t, 1)), 1)
+        for t in set(tables) & set(installed_tables(conn))
+    }
+    wanted = {t: k for t, k in wanted.items() if k <= WINDOW_ROWS}
+    if not wanted:
+        return {}
+
+    # 테이블별 (최신 datetime, k 번째 datetime) + 컬럼별 최신값을 한 번에
+    params = [v for item in wanted.items() for v in item]
+    rows = conn.execute(f"""
+        WITH w(tbl, k) AS (VALUES {", ".join("(?, ?)" for _ in wanted)}),
+        r AS (
+            SELECT "table", datetime,
+                   ROW_NUMBER() OVER (PARTITION BY "table"
+                                      ORDER BY datetime DESC, rowid DESC) AS rn
+            FROM latest_window
+            WHERE "table" IN (SELECT tbl FROM w)
+        ),
+        b AS (
+            SELECT w.tbl, MAX(r.datetime) AS latest,
+                   MAX(CASE WHEN r.rn = w.k THEN r.datetime END) AS oldest
+            FROM w JOIN r ON r."table" = w.tbl
+            GROUP BY w.tbl
+        )
+        SELECT b.tbl, b.latest, b.oldest, v."column", v.value, v.datetime
+        FROM b LEFT JOIN latest_values v ON v."table" = b.tbl
+    """, params).fetchall()
+
+    windows = {}
+    values = {}
+    for table, latest, oldest, col, value, dt in rows:
+        windows[table] = (latest, oldest)
+        if col is not None:
+            values.setdefault(table, {})[col] = (value, dt)
+
+    result = {}
+    for table in wanted:
+        if table not in windows:
+            # latest_window 가 비었으면 빈 테이블
+            result[table] = ([], None)
+            continue
+
+        # 줄이 merge_count 보다 적으면 oldest 는 None (전부 범위 안)
+        latest, oldest = windows[table]
+        by_col = values.get(table, {})
+        col_names = db_manager.get_table_columns(table, conn=conn)
+        row = []
+        for col in col_names:
+            if col == "datetime":
+                row.append(latest)
+                continue
+            value, dt = by_col.get(col, (None, None))
+            if dt is None or (oldest is not None and dt < oldest):
+                value = None
+            row.append(value)
+        result[table] = (col_names, tuple(row))
+
+    return result
+
+
+# ----------------------------------------------------------------------
+# 설치: python -m vlbi_core.latest_values [DB 경로] [테이블 ...]
+#       python -m vlbi_core.latest_values --uninstall [DB 경로]
+# ----------------------------------------------------------------------
+if __name__ == "__main__":
+    args = sys.argv[1:]
+    remove = "--uninstall" in args
+    args = [a for a in args if a != "--uninstall"]
+
+    if args:
+        db_manager.set_db_path(args.pop(0))
+
+    if remove:
+        uninstall()
+        print("latest_values 제거 완료")
+        sys.exit(0)
+
+    if not args:
+        with db_manager.read_connection() as conn:
+            args = [r[0] for r in conn.execute(
+                "SELECT name FROM sqlite_master WHERE type = 'table' "
+                "AND name NOT LIKE 'sqlite_%' AND name NOT IN ('latest_values', 'latest_window', 'Event', '_Parsing_history_')"
+            ).fetchall()]
+
+    for t in install(args):
+        print(f"{t}: 트리거 설치")
@@ -0,0 +1,65 @@
+import numpy as np
+
+from vlbi_core.series_store import to_datetime64
+from vlbi_core.downsample import downsample
+
+
+# ----------------------------------------------------------------------
+# 그래프 / 보고서용 시계열 한 개
+#   반환: (key, title, xs datetime64, ys, (mean, max, min)) 또는 None
+# ----------------------------------------------------------------------
+def series_item(key, store, col, window, n_points, method):
+    """원본 store 의 window 구간 → 다운샘플된 그래프 데이터 + 통계"""
+    ts, ys = store.column_window(col, window)
+    if not len(ts):
+        return None
+
+    # 통계는 다운샘플링 전 원본 구간 기준
+    stats = (float(np.mean(ys)), float(np.max(ys)), float(np.min(ys)))
+
+    # 캔버스 폭에 맞춰 다운샘플링
+    ts, ys = downsample(ts, ys, n_points, method)
+
+    title = f"{key[0]} | {key[1]}"
+    return key, title, to_datetime64(ts), ys, stats
+
+
+def rollup_item(key, agg, window, n_points, method):
+    """집계(n/sum/min/max) store 의 window 구간 → 그래프 데이터 + 통계"""
+    v = {name: arr[window] for name, arr in agg.values.items()}
+    ts = agg.times[window]
+
+    # 통계는 버킷 합계로 정확히 계산
+    total = v["n"].sum()
+    stats = (float(v["sum"].sum() / total), float(v["max"].max()), float(v["min"].min()))
+
+    if method == "minmax":
+        # 버킷마다 최소/최대 두 점
+        ts = np.repeat(ts, 2)
+        ys = np.column_stack((v["min"], v["max"])).ravel()
+    else:
+        ys = v["sum"] / v["n"]
+
+    ts, ys = downsample(ts, ys, n_points, method)
+
+    title = f"{key[0]} | {key[1]}"
+    return key, title, to_datetime64(ts), ys, stats
+
+
+def build_item(key, store, col, window, n_points, method, is_rollup=False):
+    if is_rollup:
+        return rollup_item(key, store, window, n_points, method)
+    return series_item(key, store, col, window, n_points, method)
+
+
+def build_report_items(sources, n_points, method) -> list:
+    """
+    sources: (key, store, col, window, is_rollup) 목록 (FrameCenter._plot_sources 형식)
+    반환: 데이터가 있는 항목만 build_item 결과 목록
+    """
+    items = []
+    for key, store, col, window, is_rollup in sources:
+        item = build_item(key, store, col, window, n_points, method, is_rollup)
+        if item:
+            items.append(item)
+    return items
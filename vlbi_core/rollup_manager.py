@@ -0,0 +1,349 @@
+import sqlite3
+import os
+import sys
+import threading
+
+import numpy as np
+
+import db_manager
+from db_manager import quote_ident
+
+
+# 해상도 이름 → 버킷 크기(초). 조회 시 굵은 해상도부터 검사
+RESOLUTIONS = {
+    "day": 86400,
+    "hour": 3600,
+    "minute": 60,
+}
+
+# 집계 대상 컬럼 선언 타입 (SQLite numeric affinity)
+NUMERIC_TYPES = ("INT", "REAL", "FLOA", "DOUB", "NUM", "DEC")
+
+# 한 트랜잭션에서 집계하는 원본 rowid 범위 (전체 집계 중에도 쓰기 잠금을 짧게)
+CHUNK_ROWS = 200_000
+
+# 원본이 메모리 DB 일 때 집계 DB (백그라운드 집계 커넥션과 공유)
+MEMORY_ROLLUP_URI = "file:vlbi_memdb_rollup?mode=memory&cache=shared"
+
+
+def rollup_path(db_path: str = None) -> str:
+    """원본 DB 옆 sidecar 파일 (예: VLBI_TEST_rollup.db). 메모리 DB 면 집계도 메모리에"""
+    db_path = db_path or db_manager.DB_PATH
+    if db_manager.is_memory_db(db_path):
+        return MEMORY_ROLLUP_URI
+    return os.path.splitext(db_path)[0] + "_rollup.db"
+
+
+def pick_resolution(span_sec: float, n_points: int):
+    """
+    화면 포인트 수(n_points)를 채울 수 있는 가장 굵은 해상도.
+    어떤 해상도도 모자라면 None (원본 데이터 사용).
+    """
+    for name, sec in RESOLUTIONS.items():
+        if span_sec / sec >= n_points:
+            return name
+    return None
+
+
+# ----------------------------------------------------------------------
+# 분/시/일 단위 집계 테이블 (sidecar SQLite)
+# ----------------------------------------------------------------------
+class RollupManager:
+    """
+    원본 테이블의 숫자 컬럼별로 버킷 단위 count / sum / sum of squares / min / max 를
+    저장한다. update() 는 컬럼별로 마지막으로 집계한 rowid 이후 행만 읽어서 기존 버킷에
+    합산(UPSERT)하므로 증분 갱신 비용은 새 행 수에 비례한다.
+
+    - 기준이 datetime 이 아니라 rowid 라서, 늦게 들어온 과거 시각 row 도 다음 update() 에서
+      자기 버킷에 합산된다 (n / sum / min / max 는 더하기로 합쳐지므로 버킷 재계산과 같음)
+    - 처음 집계하는 컬럼(extra_columns 로 새로 추가된 컬럼 포함)은 전체 기록을 집계
+    - 대시보드 조회 경로에서는 전체 집계를 하지 않고 start_backfill() 로 백그라운드 실행
+    """
+
+    def __init__(self, path: str = None, db_path: str = None):
+        self.db_path = db_path or db_manager.DB_PATH
+        self.path = path or rollup_path(self.db_path)
+        self._lock = threading.Lock()
+        self._conn = None
+
+        # 백그라운드 전체 집계 중인 테이블
+        self._backfilling = set()
+
+    # ---------------------------------------------------------
+    def _connect(self):
+        if self._conn is not None:
+            return self._conn
+
+        conn = sqlite3.connect(self.path, uri=True, timeout=5.0, check_same_thread=False)
+        conn.execute("PRAGMA journal_mode=WAL;")
+        conn.execute("PRAGMA busy_timeout=5000;")
+
+        # 이전 형식(테이블별 datetime watermark)은 늦은 row / 추가 컬럼을 놓치므로 다시 집계
+        if conn.execute(
+            "SELECT 1 FROM sqlite_master WHERE type = 'table' AND name = 'rollup_state'"
+        ).fetchone():
+            for res in RESOLUTIONS:
+                conn.execute(f"DROP TABLE IF EXISTS rollup_{res}")
+            conn.execute("DROP TABLE rollup_state")
+
+        # (테이블, 컬럼) 별 마지막으로 집계한 원본 rowid
+        conn.execute("""
+            CREATE TABLE IF NOT EXISTS rollup_watermark (
+                tbl   TEXT NOT NULL,
+                col   TEXT NOT NULL,
+                rowid_max INTEGER NOT NULL,
+                PRIMARY KEY (tbl, col)
+            ) WITHOUT ROWID
+        """)
+        for res in RESOLUTIONS:
+            conn.execute(f"""
+                CREATE TABLE IF NOT EXISTS rollup_{res} (
+                    tbl    TEXT NOT NULL,
+                    col    TEXT NOT NULL,
+                    bucket INTEGER NOT NULL,
+                    n      INTEGER NOT NULL,
+                    sum    REAL,
+                    sumsq  REAL,
+                    min    REAL,
+                    max    REAL,
+                    PRIMARY KEY (tbl, col, bucket)
+                ) WITHOUT ROWID
+            """)
+        conn.commit()
+
+        # 원본 DB 는 읽기 전용으로 attach
+        if db_manager.is_memory_db(self.db_path):
+            src = db_manager.MEMORY_URI
+            conn.execute("PRAGMA read_uncommitted=1;")
+        else:
+            src = "file:" + os.path.abspath(self.db_path).replace("\\", "/") + "?mode=ro"
+        conn.execute("ATTACH DATABASE ? AS src", (src,))
+
+        self._conn = conn
+        return conn
+
+    def close(self):
+        with self._lock:
+            if self._conn is not None:
+                self._conn.close()
+                self._conn = None
+
+    # ---------------------------------------------------------
+    def numeric_columns(self, table: str, extra=()) -> list:
+        """숫자형으로 선언된 컬럼 + extra 중 실제 존재하는 컬럼"""
+        conn = self._connect()
+        info = conn.execute(f"PRAGMA src.table_info({quote_ident(table)})").fetchall()
+
+        cols = []
+        for _, name, decl, *_ in info:
+            if name == "datetime":
+                continue
+            decl = (decl or "").upper()
+            if any(t in decl for t in NUMERIC_TYPES) or name in extra:
+                cols.append(name)
+        return cols
+
+    def is_built(self, table: str, columns) -> bool:
+        """columns 가 모두 한 번 이상 집계됐는지 (백그라운드 집계 중이면 False)"""
+        if table in self._backfilling:
+            return False
+        with self._lock:
+            conn = self._connect()
+            done = {r[0] for r in conn.execute(
+                "SELECT col FROM rollup_watermark WHERE tbl = ?", (table,)
+            )}
+        return set(columns) <= done
+
+    def start_backfill(self, table: str, extra_columns=()) -> bool:
+        """
+        전체 기록 집계를 백그라운드 스레드에서 실행 (이미 실행 중이면 False).
+        끝나기 전까지 is_built() 는 False.
+        """
+        with self._lock:
+            if table in self._backfilling:
+                return False
+            self._backfilling.add(table)
+
+        def run():
+            # 전용 커넥션 (조회 / 다른 테이블 갱신은 청크 사이에 계속 진행)
+            worker = RollupManager(self.path, self.db_path)
+            try:
+                worker.update(table, extra_columns)
+            except Exception as e:
+                print(f"[RollupManager] {table} 전체 집계 실패: {e}")
+            finally:
+                worker.close()
+                self._backfilling.discard(table)
+
+        threading.Thread(target=run, name=f"rollup-{table}", daemon=True).start()
+        return True
+
+    def update(self, table: str, extra_columns=()) -> int:
+        """
+        컬럼별 마지막 집계 이후 들어온 원본 행을 모든 해상도에 반영.
+        갱신된 버킷 수 반환.
+        """
+        with self._lock:
+            conn = self._connect()
+            cols = self.numeric_columns(table, extra_columns)
+            if not cols:
+                return 0
+
+            src_table = f"src.{quote_ident(table)}"
+
+            # 이번 갱신 범위를 지금의 마지막 rowid 까지로 고정 (집계 중 들어온 행은 다음 번에)
+            top = conn.execute(f"SELECT MAX(rowid) FROM {src_table}").fetchone()[0]
+            if top is None:
+                return 0
+
+            marks = dict(conn.execute(
+                "SELECT col, rowid_max FROM rollup_watermark WHERE tbl = ?", (table,)
+            ).fetchall())
+
+            touched = 0
+            while True:
+                # 같은 watermark 인 컬럼끼리 한 번에 집계 (새 컬럼은 0 부터)
+                groups = {}
+                for col in cols:
+                    mark = marks.get(col, 0)
+                    if mark < top:
+                        groups.setdefault(mark, []).append(col)
+                if not groups:
+                    return touched
+
+                # 청크마다 버킷과 watermark 를 같은 트랜잭션에서 commit (중복 합산 방지)
+                try:
+                    for mark, group in groups.items():
+                        end = min(top, mark + CHUNK_ROWS)
+                        touched += self._aggregate(conn, table, group, mark, end)
+                        for col in group:
+                            marks[col] = end
+
+                    conn.executemany("""
+                        INSERT INTO rollup_watermark (tbl, col, rowid_max) VALUES (?, ?, ?)
+                        ON CONFLICT (tbl, col) DO UPDATE SET rowid_max = excluded.rowid_max
+                    """, [(table, col, marks[col]) for group in groups.values() for col in group])
+                    conn.commit()
+                except Exception:
+                    conn.rollback()
+                    raise
+
+    def _aggregate(self, conn, table, cols, after_rowid, top_rowid) -> int:
+        """rowid (after_rowid, top_rowid] 범위 원본 행을 버킷에 합산"""
+        src_table = f"src.{quote_ident(table)}"
+        casts = ", ".join(
+            f"CAST({quote_ident(c)} AS REAL) AS v{i}" for i, c in enumerate(cols)
+        )
+        aggs = ", ".join(
+            f"COUNT(v{i}), SUM(v{i}), SUM(v{i} * v{i}), MIN(v{i}), MAX(v{i})"
+            for i in range(len(cols))
+        )
+
+        touched = 0
+        for res, sec in RESOLUTIONS.items():
+            rows = conn.execute(f"""
+                SELECT bucket, {aggs}
+                FROM (
+                    SELECT CAST(strftime('%s', datetime) AS INTEGER) / {sec} * {sec}
+                           AS bucket, {casts}
+                    FROM {src_table}
+                    WHERE rowid > ? AND rowid <= ?
+                )
+                WHERE bucket IS NOT NULL
+                GROUP BY bucket
+            """, (after_rowid, top_rowid)).fetchall()
+
+            upserts = []
+            for r in rows:
+                bucket = r[0]
+                for i, col in enumerate(cols):
+                    n, s, ss, mn, mx = r[1 + i * 5: 6 + i * 5]
+                    if n:
+                        upserts.append((table, col, bucket, n, s, ss, mn, mx))
+
+            conn.executemany(f"""
+                INSERT INTO rollup_{res} (tbl, col, bucket, n, sum, sumsq, min, max)
+                VALUES (?, ?, ?, ?, ?, ?, ?, ?)
+                ON CONFLICT (tbl, col, bucket) DO UPDATE SET
+                    n     = n + excluded.n,
+                    sum   = sum + excluded.sum,
+                    sumsq = sumsq + excluded.sumsq,
+                    min   = MIN(min, excluded.min),
+                    max   = MAX(max, excluded.max)
+            """, upserts)
+            touched += len(upserts)
+
+        return touched
+
+    # ---------------------------------------------------------
+    def fetch(self, table: str, columns, resolution: str, start_ms: int, end_ms: int) -> dict:
+        """
+        구간 내 집계 조회.
+        반환: {컬럼: {"times": int64 ms, "n", "sum", "sumsq", "min", "max": 배열}}
+        """
+        if resolution not in RESOLUTIONS:
+            raise ValueError(f"unknown rollup resolution: {resolution}")
+
+        sec = RESOLUTIONS[resolution]
+        lo = start_ms // 1000 // sec * sec
+        hi = end_ms // 1000
+
+        result = {}
+        with self._lock:
+            conn = self._connect()
+            for col in columns:
+                rows = conn.execute(f"""
+                    SELECT bucket, n, sum, sumsq, min, max
+                    FROM rollup_{resolution}
+                    WHERE tbl = ? AND col = ? AND bucket BETWEEN ? AND ?
+                    ORDER BY bucket
+                """, (table, col, lo, hi)).fetchall()
+
+                arr = np.array(rows, dtype=np.float64).reshape(-1, 6)
+                result[col] = {
+                    "times": arr[:, 0].astype(np.int64) * 1000,
+                    "n": arr[:, 1],
+                    "sum": arr[:, 2],
+                    "sumsq": arr[:, 3],
+                    "min": arr[:, 4],
+                    "max": arr[:, 5],
+                }
+        return result
+
+
+_manager = None
+_manager_lock = threading.Lock()
+
+
+def get_rollup_manager() -> RollupManager:
+    global _manager
+    with _manager_lock:
+        if _manager is None or _manager.db_path != db_manager.DB_PATH:
+            _manager = RollupManager()
+        return _manager
+
+
+# ----------------------------------------------------------------------
+# 일괄 생성: python -m vlbi_core.rollup_manager [DB 경로]
+# ----------------------------------------------------------------------
+if __name__ == "__main__":
+    from vlbi_core.device_map import TABLE_MAP
+
+    if len(sys.argv) > 1:
+        db_manager.set_db_path(sys.argv[1])
+
+    mgr = get_rollup_manager()
+    with db_manager.read_connection() as conn:
+        tables = [r[0] for r in conn.execute(
+            "SELECT name FROM sqlite_master WHERE type = 'table'"
+        ).fetchall()]
+
+    # 대시보드가 그리는 컬럼은 선언 타입이 숫자가 아니어도 집계
+    extra = {}
+    for info in TABLE_MAP.values():
+        if info["table"]:
+            extra.setdefault(info["table"], []).extend(info["columns"].values())
+
+    for t in tables:
+        if "datetime" in db_manager.get_table_columns(t):
+            print(f"{t}: {mgr.update(t, extra.get(t, ()))} buckets")
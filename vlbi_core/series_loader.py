@@ -0,0 +1,172 @@
+from datetime import datetime, timedelta
+
+from db_manager import read_connection, get_table_columns, quote_ident
+from vlbi_core.series_store import SeriesStore, to_epoch_ms
+from vlbi_core.rollup_manager import get_rollup_manager, pick_resolution
+
+
+# 시간 버튼 → 조회 구간 (최신 데이터 기준)
+TIME_RANGE_DELTA = {
+    "1시간": timedelta(hours=1),
+    "6시간": timedelta(hours=6),
+    "24시간": timedelta(days=1),
+    "7일": timedelta(days=7),
+}
+
+
+# ----------------------------------------------------------------------
+# 조회 요청
+#   req = {"time_range": 버튼 이름, "custom": (start, end) 또는 None,
+#          "n_points": 화면 포인트 수, "use_rollups": bool}
+#   is_stale: 더 새 요청이 있으면 True 를 반환하는 함수 (조회 중단용), 없으면 None
+# ----------------------------------------------------------------------
+def query_window(table, conn, req):
+    """
+    요청 시점 시간 버튼 기준 조회 구간을 (start_str, end_str, start_dt, end_dt) 로 반환.
+    프리셋 구간은 테이블의 최신 datetime 을 끝점으로 한다.
+    """
+    latest = conn.execute(
+        f"SELECT MAX(datetime) FROM {quote_ident(table)}"
+    ).fetchone()[0]
+
+    # DB 에 저장된 형식(' ' / 'T' 구분자)과 동일하게 문자열 비교
+    sep = "T" if latest and "T" in str(latest) else " "
+
+    if req["custom"]:
+        start, end = req["custom"]
+        return start.isoformat(sep=sep), end.isoformat(sep=sep), start, end
+
+    if latest is None:
+        return None
+
+    end = datetime.fromisoformat(str(latest))
+    start = end - TIME_RANGE_DELTA.get(req["time_range"], timedelta(days=1))
+    return start.isoformat(sep=sep), str(latest), start, end
+
+
+def load_full(info, req, is_stale=None):
+    """
+    구간 전체 조회 → 화면 raw 데이터 dict (실패/데이터 없음은 None)
+    info: TABLE_MAP 항목 {"table": ..., "columns": {표시명: 컬럼}}
+    """
+    table = info["table"]
+    wanted_cols = list(dict.fromkeys(info["columns"].values()))
+
+    existing = set(get_table_columns(table))
+    if "datetime" not in existing:
+        print(f"[series_loader] {table} 에 datetime 컬럼이 없습니다.")
+        return None
+
+    # 필요한 컬럼만 SELECT (테이블에 없는 컬럼은 None 으로 채움)
+    select_cols = [c for c in wanted_cols if c in existing]
+    select_sql = ", ".join(["datetime"] + [quote_ident(c) for c in select_cols])
+
+    with read_connection(cancel=is_stale) as conn:
+        window = query_window(table, conn, req)
+
+    if window is None:
+        rows = []
+        window = (None, None, None, None)
+    else:
+        # 화면 포인트 수보다 원본이 훨씬 많은 구간 → 집계 테이블
+        result = load_rollup(table, select_cols, wanted_cols, window, req)
+        if result is not None:
+            return result
+
+        with read_connection(cancel=is_stale) as conn:
+            rows = conn.execute(
+                f"SELECT {select_sql} FROM {quote_ident(table)} "
+                f"WHERE datetime >= ? AND datetime <= ? "
+                f"ORDER BY datetime ASC",
+                window[:2],
+            ).fetchall()
+
+    store = SeriesStore.from_rows(rows, select_cols)
+    for col in wanted_cols:
+        store.add_missing_column(col)
+
+    return {
+        "store": store,
+        "window": window[2:],
+        "range": req["time_range"],
+        "select_sql": select_sql,
+        # 마지막으로 읽은 datetime (증분 조회 기준)
+        "latest": str(rows[-1][0]) if rows else None,
+    }
+
+
+def load_rollup(table, select_cols, wanted_cols, window, req):
+    """
+    구간 길이와 화면 포인트 수로 해상도를 골라 집계 테이블에서 읽는다.
+    원본을 써야 하거나 집계 DB 를 쓸 수 없으면 None.
+    """
+    start, end = window[2:]
+    if not req["use_rollups"] or not select_cols:
+        return None
+
+    res = pick_resolution((end - start).total_seconds(), req["n_points"])
+    if res is None:
+        return None
+
+    try:
+        mgr = get_rollup_manager()
+        # 처음 집계하는 테이블 / 컬럼은 전체 기록을 읽어야 하므로 백그라운드로 돌리고
+        # 이번 조회는 원본으로 (python -m vlbi_core.rollup_manager 로 미리 만들어 둘 수 있음)
+        if not mgr.is_built(table, select_cols):
+            if mgr.start_backfill(table, select_cols):
+                print(f"[series_loader] {table} 집계 테이블 생성 시작 (완료 전까지 원본 조회)")
+            return None
+        mgr.update(table, extra_columns=select_cols)
+        agg = mgr.fetch(table, select_cols, res, to_epoch_ms(start), to_epoch_ms(end))
+    except Exception as e:
+        print(f"[series_loader] 집계 테이블 사용 불가, 원본 조회: {e}")
+        return None
+
+    rollup = {}
+    for col in wanted_cols:
+        if col in agg:
+            a = agg.pop(col)
+            rollup[col] = SeriesStore.from_arrays(a.pop("times"), a)
+
+    return {
+        "store": None,
+        "rollup": rollup,
+        "resolution": res,
+        "window": (start, end),
+        "range": req["time_range"],
+        # 집계는 증분 조회 대신 매번 update() + 재조회
+        "latest": None,
+    }
+
+
+def load_tail(table, select_sql, latest, delta, is_stale=None):
+    """마지막으로 읽은 datetime 이후 행만 조회"""
+    with read_connection(cancel=is_stale) as conn:
+        rows = conn.execute(
+            f"SELECT {select_sql} FROM {quote_ident(table)} "
+            f"WHERE datetime > ? ORDER BY datetime ASC",
+            (latest,),
+        ).fetchall()
+
+    if not rows:
+        return {"append": rows}
+
+    # 구간 끝을 최신 시각으로 이동
+    end = datetime.fromisoformat(str(rows[-1][0]))
+    return {"append": rows, "latest": str(rows[-1][0]), "window": (end - delta, end)}
+
+
+def apply_tail(raw, result) -> bool:
+    """증분 조회 결과를 raw["store"] 뒤에 붙인다 (새 행 수에 비례). 붙였으면 True"""
+    rows = result["append"]
+    if raw is None or raw["store"] is None or not rows:
+        return False
+
+    store = raw["store"]
+    store.append_rows(rows)
+    raw["latest"] = result["latest"]
+    raw["window"] = result["window"]
+
+    # 구간 밖으로 밀려난 앞부분 정리
+    store.trim_before(to_epoch_ms(result["window"][0]))
+    return True
@@ -0,0 +1,229 @@
+# vlbi_core/series_store.py
+import numpy as np
+
+
+# epoch 밀리초 (int64) 기준
+TIME_UNIT = "ms"
+NAT = np.iinfo(np.int64).min
+
+
+def parse_times(values) -> np.ndarray:
+    """
+    ISO 문자열 / datetime 목록 → int64 epoch ms 배열.
+    파싱 불가 값은 NAT 로 채운다.
+    """
+    if len(values) == 0:
+        return np.empty(0, dtype=np.int64)
+
+    try:
+        arr = np.array(values, dtype=f"datetime64[{TIME_UNIT}]")
+    except (ValueError, TypeError):
+        # 섞인 형식이 있으면 요소별로 파싱
+        arr = np.empty(len(values), dtype=f"datetime64[{TIME_UNIT}]")
+        for i, v in enumerate(values):
+            try:
+                arr[i] = np.datetime64(v, TIME_UNIT)
+            except (ValueError, TypeError):
+                arr[i] = np.datetime64("NaT")
+
+    return arr.astype(np.int64)
+
+
+def to_float_array(values, dtype=np.float64) -> np.ndarray:
+    """DB 값 목록 → float 배열 (None / 숫자가 아닌 값은 NaN)"""
+    arr = np.array(values, dtype=object)
+    arr[np.equal(arr, None)] = np.nan
+
+    try:
+        return arr.astype(dtype)
+    except (ValueError, TypeError):
+        out = np.empty(len(arr), dtype=dtype)
+        for i, v in enumerate(arr):
+            try:
+                out[i] = float(v)
+            except (ValueError, TypeError):
+                out[i] = np.nan
+        return out
+
+
+def to_datetime64(ms) -> np.ndarray:
+    """epoch ms → matplotlib 에서 바로 쓸 수 있는 datetime64 배열 (복사 없음)"""
+    return np.asarray(ms, dtype=np.int64).view(f"datetime64[{TIME_UNIT}]")
+
+
+def to_epoch_ms(dt) -> int:
+    return int(np.datetime64(dt, TIME_UNIT).astype(np.int64))
+
+
+def _arrays_from_rows(rows, columns, dtype):
+    """(datetime, col1, ...) 튜플 목록 → (times, {col: 배열}), 시간순 정렬"""
+    cols = list(zip(*rows))
+    times = parse_times(cols[0])
+    valid = times != NAT
+
+    times = times[valid]
+    values = {
+        col: to_float_array(cols[i], dtype)[valid]
+        for i, col in enumerate(columns, start=1)
+    }
+
+    # 정렬 보장 (ORDER BY datetime 이지만 형식이 섞인 경우 대비)
+    if len(times) > 1 and np.any(np.diff(times) < 0):
+        order = np.argsort(times, kind="stable")
+        times = times[order]
+        values = {col: arr[order] for col, arr in values.items()}
+
+    return times, values
+
+
+# ----------------------------------------------------------------------
+# 컬럼형 시계열 저장소
+# ----------------------------------------------------------------------
+class SeriesStore:
+    """
+    테이블 하나의 시계열 데이터.
+      times  : int64 epoch ms (오름차순)
+      values : {컬럼명: float 배열}, 결측값은 NaN
+
+    내부 버퍼는 용량을 두 배씩 늘려서 append 가 amortized O(1) 이다.
+    times / values 는 채워진 구간의 view.
+    version 은 내용이 바뀔 때마다 (append / trim / 컬럼 추가) 증가한다.
+    """
+
+    def __init__(self, columns, dtype=np.float64):
+        self.columns = list(columns)
+        self.dtype = dtype
+        self._n = 0
+        self.version = 0
+        self._missing = set()
+        self._times = np.empty(0, dtype=np.int64)
+        self._values = {col: np.empty(0, dtype=dtype) for col in self.columns}
+
+    @classmethod
+    def from_rows(cls, rows, columns, dtype=np.float64):
+        """
+        rows: (datetime, col1, col2, ...) 튜플 목록
+        columns: rows[1:] 에 대응하는 컬럼명
+        """
+        store = cls(columns, dtype=dtype)
+        if rows:
+            times, values = _arrays_from_rows(rows, store.columns, dtype)
+            store._times = times
+            store._values = values
+            store._n = len(times)
+        return store
+
+    @classmethod
+    def from_arrays(cls, times, values: dict, dtype=np.float64):
+        """이미 정렬된 int64 ms times + {컬럼: 배열} 로 생성"""
+        store = cls(values.keys(), dtype=dtype)
+        store._times = np.asarray(times, dtype=np.int64)
+        store._values = {col: np.asarray(arr, dtype=dtype) for col, arr in values.items()}
+        store._n = len(store._times)
+        return store
+
+    @property
+    def times(self) -> np.ndarray:
+        return self._times[:self._n]
+
+    @property
+    def values(self) -> dict:
+        return {col: arr[:self._n] for col, arr in self._values.items()}
+
+    def __len__(self):
+        return self._n
+
+    # ---------------------------------------------------------
+    def _reserve(self, size: int):
+        cap = len(self._times)
+        if size <= cap:
+            return
+
+        new_cap = max(size, cap * 2, 1024)
+        times = np.empty(new_cap, dtype=np.int64)
+        times[:self._n] = self._times[:self._n]
+        self._times = times
+
+        for col, arr in self._values.items():
+            buf = np.empty(new_cap, dtype=self.dtype)
+            buf[:self._n] = arr[:self._n]
+            self._values[col] = buf
+
+    def append_rows(self, rows) -> int:
+        """
+        마지막 시각 이후의 rows 를 뒤에 붙인다 (rows 구조는 from_rows 와 동일).
+        추가된 행 수 반환.
+        """
+        if not rows:
+            return 0
+
+        data_cols = [c for c in self.columns if c not in self._missing]
+        times, values = _arrays_from_rows(rows, data_cols, self.dtype)
+
+        # 이미 가진 시각 이전 데이터는 무시 (정렬 유지)
+        if self._n and len(times):
+            keep = times > self._times[self._n - 1]
+            if not keep.all():
+                times = times[keep]
+                values = {col: arr[keep] for col, arr in values.items()}
+
+        k = len(times)
+        if not k:
+            return 0
+
+        self._reserve(self._n + k)
+        end = self._n + k
+        self._times[self._n:end] = times
+        for col, arr in self._values.items():
+            arr[self._n:end] = values.get(col, np.nan)
+        self._n = end
+        self.version += 1
+        return k
+
+    def trim_before(self, start_ms: int):
+        """
+        start_ms 이전 데이터 제거. 앞부분이 절반 이상일 때만 실제로 당겨서
+        복사 비용을 amortized 로 유지한다.
+        """
+        k = int(np.searchsorted(self.times, start_ms, side="left"))
+        if k == 0 or k < self._n // 2:
+            return
+
+        remain = self._n - k
+        self._times[:remain] = self._times[k:self._n]
+        for arr in self._values.values():
+            arr[:remain] = arr[k:self._n]
+        self._n = remain
+        self.version += 1
+
+    # ---------------------------------------------------------
+    def window(self, start_ms: int, end_ms: int) -> slice:
+        """[start_ms, end_ms] 구간을 이진 탐색으로 찾아 slice 반환 (O(log N))"""
+        times = self.times
+        lo = int(np.searchsorted(times, start_ms, side="left"))
+        hi = int(np.searchsorted(times, end_ms, side="right"))
+        return slice(lo, hi)
+
+    def column_window(self, col, sl: slice):
+        """
+        구간 내 (times, values) 반환. NaN 이 없으면 복사 없는 view 그대로,
+        NaN 이 있으면 벡터화된 마스크로 제거한 배열을 반환한다.
+        """
+        ts = self.times[sl]
+        ys = self._values[col][:self._n][sl]
+
+        valid = ~np.isnan(ys)
+        if valid.all():
+            return ts, ys
+        return ts[valid], ys[valid]
+
+    def add_missing_column(self, col):
+        """테이블에 없는 컬럼 → 전부 NaN (append 시에도 NaN 유지)"""
+        if col not in self._values:
+            self.columns.append(col)
+            self._missing.add(col)
+            self._values[col] = np.full(len(self._times), np.nan, dtype=self.dtype)
+            self.version += 1
+
+    def nbytes(self) -> int:
+        return self._times.nbytes + sum(v.nbytes for v in self._values.values())
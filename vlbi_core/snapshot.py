@@ -0,0 +1,172 @@
+import sqlite3
+import time
+from datetime import datetime, UTC
+
+import db_manager
+from db_manager import read_connection, get_table_columns, quote_ident
+from vlbi_core.latest_values import read_latest_rows
+
+
+# 마지막 파싱이 이 시간(초) 안이면 통신 정상
+LINK_TIMEOUT_SEC = 60
+
+
+# ----------------------------------------------------------------------
+# 장비 테이블 최신값 스냅샷 (모니터링 tick 당 1회)
+# ----------------------------------------------------------------------
+# (table, merge_count) → (DB 경로, schema_version, col_names, sql)
+# DB 경로가 바뀌거나 스키마가 바뀌면 (ALTER TABLE 등) 컬럼을 다시 읽어서 새로 만듦
+_merge_sql_cache = {}
+
+
+def _latest_merge_sql(table: str, col_names, merge_count: int) -> str:
+    """
+    최근 merge_count 줄에서 컬럼별 첫 번째 non-NULL 값(최신 row부터)을 고르는 쿼리.
+    datetime 인덱스로 최근 몇 줄만 읽고, 마지막 컬럼은 읽은 row 수.
+    """
+    t = quote_ident(table)
+
+    if merge_count <= 1:
+        cols = ", ".join(quote_ident(c) for c in col_names)
+        return f"""
+            SELECT {cols}, 1
+            FROM {t}
+            ORDER BY datetime DESC
+            LIMIT 1
+        """
+
+    picks = ",\n".join(
+        f"(SELECT {quote_ident(c)} FROM r WHERE {quote_ident(c)} IS NOT NULL "
+        f"ORDER BY k LIMIT 1)"
+        for c in col_names
+    )
+    return f"""
+        WITH r AS MATERIALIZED (
+            SELECT *, ROW_NUMBER() OVER (ORDER BY datetime DESC) AS k
+            FROM (SELECT * FROM {t} ORDER BY datetime DESC LIMIT {int(merge_count)})
+        )
+        SELECT {picks},
+               (SELECT COUNT(*) FROM r)
+    """
+
+
+def schema_version(conn) -> int:
+    return conn.execute("PRAGMA schema_version").fetchone()[0]
+
+
+def fetch_latest_row_with_merge(conn, table: str, merge_count: int = 1, version: int = None):
+    """
+    테이블에서 가장 최신 데이터를 읽되,
+    merge_count > 1 이면 최근 여러 줄을 SQL 안에서 컬럼별로 합쳐 하나의 row처럼 반환한다.
+    version: 이미 읽은 PRAGMA schema_version (없으면 여기서 읽음)
+    반환값: (col_names, row_tuple 또는 None)
+    """
+    if version is None:
+        version = schema_version(conn)
+
+    key = (table, merge_count)
+    cached = _merge_sql_cache.get(key)
+    if cached is None or cached[:2] != (db_manager.DB_PATH, version):
+        col_names = get_table_columns(table, refresh=cached is not None, conn=conn)
+        if not col_names:
+            raise sqlite3.OperationalError(f"no such table: {table}")
+        cached = (db_manager.DB_PATH, version, col_names,
+                  _latest_merge_sql(table, col_names, merge_count))
+        _merge_sql_cache[key] = cached
+
+    _, _, col_names, sql = cached
+    row = conn.execute(sql).fetchone()
+
+    # 마지막 컬럼 = 읽은 row 수 (0 이면 빈 테이블)
+    if not row or not row[-1]:
+        return [], None
+    return col_names, row[:-1]
+
+
+class LatestSnapshot:
+    """
+    한 번의 읽기 트랜잭션에서 읽은 장비 테이블별 최신 (병합) row.
+    같은 tick 안의 소비자(임계값 검사, 패널, 통신 상태)는 모두 같은 시점 값을 본다.
+    """
+
+    def __init__(self):
+        self.rows = {}              # table -> (col_names, row 또는 None)
+        self.errors = {}            # table -> 오류 메시지
+        self.error = None           # 스냅샷 전체 실패 (DB 열기 실패 등)
+        self.last_parsed = None     # _Parsing_history_ 최신 Parsed_at
+        self.taken_at = time.time()
+
+    def get(self, table: str):
+        """(col_names, row) 반환. 해당 테이블 조회가 실패했으면 예외 발생"""
+        if self.error is not None:
+            raise sqlite3.OperationalError(self.error)
+        if table in self.errors:
+            raise sqlite3.OperationalError(self.errors[table])
+        return self.rows.get(table, ([], None))
+
+
+def fetch_latest_snapshot(tables, merge_counts=None) -> LatestSnapshot:
+    """
+    tables 의 최신 (병합) row 와 마지막 파싱 시각을 한 트랜잭션에서 읽는다.
+    latest_values 가 설치된 테이블은 히스토리 크기와 무관하게 그 테이블에서 읽는다
+    (병합 결과는 같음: 최근 merge_count 줄 안의 값만).
+    테이블 하나가 실패해도 나머지는 계속 읽는다.
+    """
+    merge_counts = merge_counts or {}
+    snap = LatestSnapshot()
+
+    try:
+        with read_connection() as conn:
+            # 명시적 BEGIN → 모든 SELECT 가 같은 WAL 스냅샷을 읽음
+            conn.execute("BEGIN")
+            try:
+                # latest_values 트리거가 설치된 테이블은 한 쿼리로 읽음
+                try:
+                    snap.rows.update(read_latest_rows(conn, tables, merge_counts))
+                except sqlite3.OperationalError as e:
+                    print(f"[snapshot] latest_values 조회 실패: {e}")
+
+                version = schema_version(conn)
+                for table in dict.fromkeys(tables):
+                    if table in snap.rows:
+                        continue
+                    try:
+                        snap.rows[table] = fetch_latest_row_with_merge(
+                            conn, table, merge_counts.get(table, 1), version
+                        )
+                    except sqlite3.OperationalError as e:
+                        snap.errors[table] = str(e)
+
+                try:
+                    row = conn.execute(
+                        "SELECT MAX(Parsed_at) FROM _Parsing_history_"
+                    ).fetchone()
+                    snap.last_parsed = row[0] if row else None
+                except sqlite3.OperationalError as e:
+                    snap.errors["_Parsing_history_"] = str(e)
+            finally:
+                conn.rollback()
+    except Exception as e:
+        snap.error = str(e)
+
+    return snap
+
+
+# ----------------------------------------------------------------------
+# 통신 상태 (마지막 파싱 시각 기준)
+# ----------------------------------------------------------------------
+def is_link_alive(last_parsed, now=None, timeout_sec: float = LINK_TIMEOUT_SEC) -> bool:
+    """
+    last_parsed: _Parsing_history_ 의 Parsed_at (timezone 없는 UTC 문자열)
+    최근 timeout_sec 안에 파싱된 데이터가 있으면 True
+    """
+    if not last_parsed:
+        return False
+    try:
+        # DB 값은 timezone 정보 없이 저장되어 있으므로 UTC timezone 부여
+        last_dt = datetime.fromisoformat(str(last_parsed)).replace(tzinfo=UTC)
+    except ValueError:
+        return False
+
+    now = now or datetime.now(UTC)
+    return (now - last_dt).total_seconds() < timeout_sec
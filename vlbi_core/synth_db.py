@@ -0,0 +1,366 @@
+import argparse
+import json
+import os
+import time
+from datetime import datetime, timedelta, UTC
+
+import numpy as np
+
+import db_manager
+from db_manager import quote_ident, LOG_TABLES
+from vlbi_core.device_map import (
+    DEVICE_TABLE_MAP, ROW_MERGE_COUNT, TABLE_MAP, THRESHOLD_TABLE_COLUMNS,
+)
+from vlbi_core.rollup_manager import rollup_path
+
+
+# 모니터링(DEVICE_TABLE_MAP) 테이블 이름이 대시보드 / 임계값 창과 다른 장비 → 같은 컬럼 사용
+SAME_COLUMNS_AS = {
+    "SXDownConverter": "SXDown",
+    "KDownConverter": "KDown",
+    "QDownConverter": "QDown",
+}
+
+DEFAULT_DAYS = 1.0
+DEFAULT_STEP_SEC = 10.0
+
+# 파서가 로그 파일 하나를 처리하는 주기 (_Parsing_history_ 한 줄)
+PARSE_INTERVAL_SEC = 60.0
+
+# 한 번에 만들어 INSERT 하는 샘플 수 (메모리 사용량 제한)
+BATCH_SAMPLES = 20_000
+
+# 주입한 이상값 구간 길이 (샘플 수, 1 ~ 이 값)
+MAX_EXCURSION_SAMPLES = 30
+MAX_NULL_RUN_SAMPLES = 360
+
+
+def table_columns() -> dict:
+    """
+    TABLE_MAP / THRESHOLD_TABLE_COLUMNS / DEVICE_TABLE_MAP 에 나오는 모든 테이블 → 컬럼 목록.
+    같은 테이블이 여러 곳에 나오면 컬럼을 합친다 (중복 제거, 처음 나온 순서).
+    """
+    tables = {}
+
+    def add(table, cols):
+        if not table:
+            return
+        merged = tables.setdefault(table, [])
+        for c in cols:
+            if c not in merged:
+                merged.append(c)
+
+    for table, cols in THRESHOLD_TABLE_COLUMNS.items():
+        add(table, cols)
+    for info in TABLE_MAP.values():
+        add(info["table"], info["columns"].values())
+    for table in DEVICE_TABLE_MAP.values():
+        add(table, tables.get(SAME_COLUMNS_AS.get(table), []))
+    return tables
+
+
+def device_names() -> dict:
+    """테이블 → Event 메시지에 쓸 장비 이름"""
+    names = {t: t for t in table_columns()}
+    for menu, info in TABLE_MAP.items():
+        if info["table"]:
+            names[info["table"]] = menu
+    for device, table in DEVICE_TABLE_MAP.items():
+        if table:
+            names[table] = device
+    return names
+
+
+# ----------------------------------------------------------------------
+# 컬럼별 값 모델
+# ----------------------------------------------------------------------
+def _column_model(rng, limits):
+    """
+    limits: thresholds.json 의 컬럼 항목 (없으면 None)
+    반환: (기준값, 잡음 크기, 이상값 (side, level, bound, 값) 목록)
+    """
+    limits = limits or {}
+    lo = limits.get("lower_yellow")
+    hi = limits.get("upper_yellow")
+
+    if lo is not None and hi is not None and hi > lo:
+        base, span = (lo + hi) / 2, hi - lo
+    elif hi is not None:
+        span = abs(hi) * 0.2 or 1.0
+        base = hi - span
+    elif lo is not None:
+        span = abs(lo) * 0.2 or 1.0
+        base = lo + span
+    else:
+        base = float(rng.uniform(1.0, 100.0))
+        span = base * 0.2
+
+    # 임계값이 있으면 red (없으면 yellow) 바깥으로, 없으면 기준값의 ±50%
+    spikes = []
+    for side, sign in (("upper", 1), ("lower", -1)):
+        for level in ("red", "yellow"):
+            bound = limits.get(f"{side}_{level}")
+            if bound is not None:
+                spikes.append((side, level, bound, bound + sign * span * 0.1))
+                break
+    if not spikes:
+        spikes = [("upper", None, None, base * 1.5), ("lower", None, None, base * 0.5)]
+
+    return base, span * 0.05, spikes
+
+
+def _runs(rng, n_samples, n_runs, n_cols, max_len):
+    """[(시작 샘플, 길이, 컬럼 번호)] 를 시작 순으로"""
+    if n_samples <= 0 or n_runs <= 0 or n_cols <= 0:
+        return []
+    starts = rng.integers(0, n_samples, n_runs)
+    lengths = rng.integers(1, max_len + 1, n_runs)
+    cols = rng.integers(0, n_cols, n_runs)
+    order = np.argsort(starts)
+    return list(zip(starts[order].tolist(), lengths[order].tolist(), cols[order].tolist()))
+
+
+def _time_strings(ms) -> list:
+    """epoch ms → 'YYYY-MM-DD HH:MM:SS[.fff]' (UTC, 파서와 같은 형식)"""
+    arr = np.asarray(ms, dtype=np.int64).view("datetime64[ms]")
+    if not len(arr):
+        return []
+    unit = "s" if not np.any(arr.astype(np.int64) % 1000) else "ms"
+    return np.char.replace(np.datetime_as_string(arr, unit=unit), "T", " ").tolist()
+
+
+def _insert_sql(table, cols) -> str:
+    names = ", ".join(quote_ident(c) for c in ["datetime", *cols])
+    marks = ", ".join("?" * (len(cols) + 1))
+    return f"INSERT INTO {quote_ident(table)} ({names}) VALUES ({marks})"
+
+
+# ----------------------------------------------------------------------
+# 장비 테이블 한 개
+# ----------------------------------------------------------------------
+def _fill_table(conn, rng, table, cols, start_ms, step_ms, n_samples, merge_count,
+                limits, null_ratio, null_runs, excursions, device, events) -> int:
+    """
+    샘플 하나를 merge_count 줄에 나눠 쓴다 (줄마다 일부 컬럼만 값, 나머지 NULL).
+    같은 샘플의 줄은 step 안에서 시간이 조금씩 뒤로 밀린다 (배치 안에서는 줄 번호별로 INSERT).
+    주입한 이상값 구간의 시작 / 끝은 events 에 (시각 ms, 메시지) 로 추가.
+    """
+    n_cols = len(cols)
+    models = [_column_model(rng, limits.get(c)) for c in cols]
+    base = np.array([m[0] for m in models])
+    noise = np.array([m[1] for m in models])
+    phase = rng.uniform(0, 2 * np.pi, n_cols)
+
+    spikes = _runs(rng, n_samples, excursions, n_cols, MAX_EXCURSION_SAMPLES)
+    spike_kind = rng.integers(0, 2, len(spikes))
+    gaps = _runs(rng, n_samples, null_runs, n_cols, MAX_NULL_RUN_SAMPLES)
+
+    # 줄 번호 → 그 줄에 값이 있는 컬럼 / 샘플 시작 기준 시간 오프셋
+    groups = np.array_split(np.arange(n_cols), merge_count)
+    offsets = np.array([step_ms * j // merge_count for j in range(merge_count)], dtype=np.int64)
+
+    sqls = [_insert_sql(table, [cols[i] for i in g]) for g in groups]
+    written = 0
+
+    for first in range(0, n_samples, BATCH_SAMPLES):
+        last = min(first + BATCH_SAMPLES, n_samples)
+        idx = np.arange(first, last, dtype=np.int64)
+        t_ms = start_ms + idx * step_ms
+
+        # 기준값 + 하루 주기 변동 + 잡음
+        day = 2 * np.pi * (t_ms[:, None] / 86_400_000.0)
+        values = (base + 3 * noise * np.sin(day + phase)
+                  + rng.standard_normal((len(idx), n_cols)) * noise)
+
+        for (s, length, c), k in zip(spikes, spike_kind):
+            a, b = max(s, first), min(s + length, last)
+            if a < b:
+                values[a - first:b - first, c] = models[c][2][k % len(models[c][2])][3]
+
+        if null_ratio > 0:
+            values[rng.random(values.shape) < null_ratio] = np.nan
+        for s, length, c in gaps:
+            a, b = max(s, first), min(s + length, last)
+            if a < b:
+                values[a - first:b - first, c] = np.nan
+
+        # 줄마다 값이 있는 컬럼만 INSERT (나머지는 NULL 기본값, 바인딩 수 1/merge_count)
+        for j, g in enumerate(groups):
+            cells = np.round(values[:, g], 3).astype(object)
+            cells[np.isnan(values[:, g])] = None
+            times = np.array(_time_strings(t_ms + offsets[j]), dtype=object)[:, None]
+            conn.executemany(sqls[j], np.concatenate((times, cells), axis=1).tolist())
+        written += len(t_ms) * merge_count
+
+    for (s, length, c), k in zip(spikes, spike_kind):
+        side, level, bound, value = models[c][2][k % len(models[c][2])]
+        name = f"{device} - {cols[c]}: {round(value, 3)}"
+        if level is None:
+            msg = f"[EXCURSION] {name}"
+        else:
+            op = "<=" if side == "lower" else ">="
+            msg = f"[{level.upper()}] {name} ({side} {op} {bound})"
+        events.append((start_ms + s * step_ms, msg))
+        end = min(s + length, n_samples - 1)
+        events.append((start_ms + end * step_ms,
+                       f"[CLEAR] {device} - {cols[c]}: {round(float(base[c]), 3)}"))
+
+    return written
+
+
+# ----------------------------------------------------------------------
+# DB 전체
+# ----------------------------------------------------------------------
+def _prepare_target(path, overwrite):
+    if db_manager.is_memory_db(path):
+        return
+    files = [path, path + "-wal", path + "-shm", rollup_path(path)]
+    if os.path.exists(path):
+        if not overwrite:
+            raise FileExistsError(f"이미 있는 DB: {path} (덮어쓰려면 overwrite)")
+        for f in files:
+            if os.path.exists(f):
+                os.remove(f)
+
+
+def generate(path, days=DEFAULT_DAYS, step_sec=DEFAULT_STEP_SEC, start=None,
+             null_ratio=0.0, null_runs_per_day=0.0, excursions_per_day=0.0,
+             thresholds=None, parse_interval_sec=PARSE_INTERVAL_SEC,
+             seed=None, overwrite=False, verbose=True) -> dict:
+    """
+    합성 관측소 DB 생성 → {테이블: 행 수}. 끝나면 db_manager 가 이 DB 를 가리킨다.
+
+        path:                DB 파일 경로 또는 ":memory:" (같은 프로세스의 커넥션이 공유)
+        days / step_sec:     기간(일) / 샘플 간격(초). 장비 테이블 행 수 = 샘플 수 × ROW_MERGE_COUNT
+        start:               첫 샘플 시각 (UTC datetime, 기본: 지금 - days)
+        null_ratio:          값 하나가 NULL 일 확률
+        null_runs_per_day:   테이블마다 하루 평균 컬럼 하나가 연속 NULL 인 구간 수 (센서 끊김)
+        excursions_per_day:  테이블마다 하루 평균 이상값 구간 수 (thresholds 가 있으면 red 바깥)
+        thresholds:          thresholds.json 형식 dict (기준값 / 이상값 크기 결정)
+    """
+    rng = np.random.default_rng(seed)
+    thresholds = thresholds or {}
+
+    step_ms = int(round(step_sec * 1000))
+    if step_ms <= 0:
+        raise ValueError("step_sec must be positive")
+    n_samples = int(days * 86_400_000 // step_ms)
+
+    if start is None:
+        start = datetime.now(UTC).replace(microsecond=0, tzinfo=None) - timedelta(days=days)
+    start_ms = int(np.datetime64(start.replace(tzinfo=None), "ms").astype(np.int64))
+
+    _prepare_target(path, overwrite)
+    db_manager.set_db_path(path)
+    conn = db_manager.get_connection()
+    tables = table_columns()
+    names = device_names()
+    counts = {}
+
+    try:
+        # 대량 INSERT: 저널 / fsync 끔 (도중에 실패하면 DB 를 다시 만들면 됨)
+        conn.execute("PRAGMA journal_mode=OFF;")
+        conn.execute("PRAGMA synchronous=OFF;")
+        conn.execute("PRAGMA cache_size=-65536;")
+        conn.execute("PRAGMA temp_store=MEMORY;")
+
+        for table in [*tables, *(t for t, _, _ in LOG_TABLES.values())]:
+            conn.execute(f"DROP TABLE IF EXISTS {quote_ident(table)}")
+        for table, cols in tables.items():
+            defs = ", ".join(f"{quote_ident(c)} REAL" for c in cols)
+            conn.execute(f"CREATE TABLE {quote_ident(table)} (datetime TEXT, {defs})")
+        conn.execute("CREATE TABLE _Parsing_history_ (Log_name TEXT, Parsed_at TEXT)")
+        conn.execute("CREATE TABLE Event (datetime TEXT, message TEXT)")
+
+        events = []
+        per_day = max(days, 0.0)
+        for table, cols in tables.items():
+            t0 = time.perf_counter()
+            limits = thresholds.get(table) or thresholds.get(SAME_COLUMNS_AS.get(table)) or {}
+            conn.execute("BEGIN")
+            counts[table] = _fill_table(
+                conn, rng, table, cols, start_ms, step_ms, n_samples,
+                ROW_MERGE_COUNT.get(table, 1), limits, null_ratio,
+                int(rng.poisson(null_runs_per_day * per_day)),
+                int(rng.poisson(excursions_per_day * per_day)),
+                names[table], events,
+            )
+            conn.commit()
+            if verbose:
+                print(f"[synth_db] {table}: {counts[table]:,} rows "
+                      f"({time.perf_counter() - t0:.1f}s)")
+
+        # 파싱 이력: 주기마다 로그 파일 하나 (마지막 파싱 = 마지막 샘플 시각 → 통신 정상)
+        parse_ms = int(round(parse_interval_sec * 1000))
+        last_ms = start_ms + max(n_samples - 1, 0) * step_ms
+        parsed = last_ms - np.arange(0, max(n_samples, 1) * step_ms, parse_ms, dtype=np.int64)[::-1]
+        at = _time_strings(parsed)
+        logs = [f"VLBI_{s[:10].replace('-', '')}_{s[11:19].replace(':', '')}.log" for s in at]
+        conn.execute("BEGIN")
+        conn.executemany("INSERT INTO _Parsing_history_ (Log_name, Parsed_at) VALUES (?, ?)",
+                         zip(logs, at))
+        events.sort()
+        conn.executemany("INSERT INTO Event (datetime, message) VALUES (?, ?)",
+                         zip(_time_strings([e[0] for e in events]), [e[1] for e in events]))
+        conn.commit()
+        counts["_Parsing_history_"] = len(at)
+        counts["Event"] = len(events)
+
+        # 시간 인덱스는 다 넣은 뒤 한 번에 (ensure_datetime_index 와 같은 이름)
+        t0 = time.perf_counter()
+        for table, time_col in [*((t, "datetime") for t in tables),
+                                *((t, c) for t, c, _ in LOG_TABLES.values())]:
+            conn.execute(
+                f"CREATE INDEX {quote_ident(f'idx_{table}_{time_col}')} "
+                f"ON {quote_ident(table)}({quote_ident(time_col)})"
+            )
+        conn.execute("PRAGMA analysis_limit=400;")
+        conn.execute("ANALYZE;")
+        if verbose:
+            print(f"[synth_db] 인덱스 ({time.perf_counter() - t0:.1f}s)")
+
+        conn.execute("PRAGMA synchronous=NORMAL;")
+        conn.execute("PRAGMA journal_mode=WAL;")
+    finally:
+        conn.close()
+
+    return counts
+
+
+# ----------------------------------------------------------------------
+# 실행: python -m vlbi_core.synth_db 경로 [--days 365] [--step 10] ...
+#   이후 python -m vlbi_core.rollup_manager 경로 로 집계 테이블 생성
+# ----------------------------------------------------------------------
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="부하 / 규모 테스트용 합성 VLBI 관측소 DB 생성")
+    parser.add_argument("path", help='DB 경로 (":memory:" 면 크기 / 속도만 측정)')
+    parser.add_argument("--days", type=float, default=DEFAULT_DAYS, help="기간 (일)")
+    parser.add_argument("--step", type=float, default=DEFAULT_STEP_SEC, help="샘플 간격 (초)")
+    parser.add_argument("--start", type=datetime.fromisoformat,
+                        help="첫 샘플 시각 (UTC, 기본: 지금 - 기간)")
+    parser.add_argument("--null-ratio", type=float, default=0.0, help="값 하나가 NULL 일 확률")
+    parser.add_argument("--null-runs", type=float, default=0.0,
+                        help="테이블마다 하루 평균 연속 NULL 구간 수")
+    parser.add_argument("--excursions", type=float, default=0.0,
+                        help="테이블마다 하루 평균 이상값 구간 수")
+    parser.add_argument("--thresholds", help="thresholds.json 경로 (이상값을 red 바깥으로)")
+    parser.add_argument("--parse-interval", type=float, default=PARSE_INTERVAL_SEC,
+                        help="_Parsing_history_ 간격 (초)")
+    parser.add_argument("--seed", type=int, help="난수 시드 (같은 값이면 같은 DB)")
+    parser.add_argument("--overwrite", action="store_true", help="기존 DB 파일 삭제 후 생성")
+    args = parser.parse_args()
+
+    limits = None
+    if args.thresholds:
+        with open(args.thresholds, "r", encoding="utf-8") as f:
+            limits = json.load(f)
+
+    t_start = time.perf_counter()
+    result = generate(
+        args.path, days=args.days, step_sec=args.step, start=args.start,
+        null_ratio=args.null_ratio, null_runs_per_day=args.null_runs,
+        excursions_per_day=args.excursions, thresholds=limits,
+        parse_interval_sec=args.parse_interval, seed=args.seed, overwrite=args.overwrite,
+    )
+    total = sum(result.values())
+    print(f"[synth_db] 합계 {total:,} rows, {time.perf_counter() - t_start:.1f}s")
@@ -0,0 +1,171 @@
+from typing import NamedTuple
+
+import numpy as np
+
+from vlbi_core.series_store import to_float_array
+
+
+# 단계 코드 (배열 결과) ↔ 이름
+LEVEL_NONE = 0
+LEVEL_YELLOW = 1
+LEVEL_RED = 2
+LEVEL_NAMES = {LEVEL_YELLOW: "yellow", LEVEL_RED: "red"}
+
+# 방향 코드
+SIDE_NONE = 0
+SIDE_LOWER = -1
+SIDE_UPPER = 1
+SIDE_NAMES = {SIDE_LOWER: "lower", SIDE_UPPER: "upper"}
+
+
+class Violation(NamedTuple):
+    column: str
+    value: float
+    level: str      # "yellow" / "red"
+    side: str       # "lower" / "upper"
+    bound: float
+
+
+def _bound(th: dict, key: str, legacy: str = None):
+    val = th.get(key)
+    if val is None and legacy:
+        val = th.get(legacy)
+    return np.nan if val is None else float(val)
+
+
+# ----------------------------------------------------------------------
+# 테이블 하나의 컬럼 순서에 맞춘 임계값 배열
+# ----------------------------------------------------------------------
+class CompiledBounds:
+    """
+    임계값이 있는 컬럼만 모은 하한/상한 배열 (값 없음 = NaN → 비교 결과 항상 False).
+    index 는 각 배열 위치가 원래 columns 에서 몇 번째인지.
+
+    판정 규칙 (패널/요약 공통):
+      - 하한: value <= lower_red → red, value <= lower_yellow → yellow
+      - 상한: value >= upper_red → red, value >= upper_yellow → yellow
+      - 둘 다 걸리면 더 높은 단계, 같은 단계면 하한을 우선
+    """
+
+    __slots__ = ("columns", "index", "lower_red", "lower_yellow", "upper_yellow", "upper_red")
+
+    def __init__(self, columns, table_thresholds: dict):
+        self.columns = list(columns)
+
+        index, bounds = [], []
+        for i, col in enumerate(self.columns):
+            th = table_thresholds.get(col)
+            if not th:
+                continue
+            b = (_bound(th, "lower_red"), _bound(th, "lower_yellow"),
+                 _bound(th, "upper_yellow", "yellow"), _bound(th, "upper_red", "red"))
+            if all(np.isnan(b)):
+                continue
+            index.append(i)
+            bounds.append(b)
+
+        self.index = np.array(index, dtype=np.intp)
+        arr = np.array(bounds, dtype=np.float64).reshape(-1, 4)
+        self.lower_red, self.lower_yellow, self.upper_yellow, self.upper_red = arr.T.copy()
+
+    def __len__(self):
+        return len(self.index)
+
+    def classify(self, values: np.ndarray):
+        """
+        values: (..., len(self)) float 배열 — 임계값 컬럼만, self.index 순서 (NaN = 값 없음)
+        반환: (levels int8, sides int8) — values 와 같은 shape
+        """
+        with np.errstate(invalid="ignore"):
+            lower = np.where(values <= self.lower_red, LEVEL_RED,
+                             np.where(values <= self.lower_yellow, LEVEL_YELLOW, LEVEL_NONE))
+            upper = np.where(values >= self.upper_red, LEVEL_RED,
+                             np.where(values >= self.upper_yellow, LEVEL_YELLOW, LEVEL_NONE))
+
+        levels = np.maximum(lower, upper).astype(np.int8)
+        sides = np.where(levels == LEVEL_NONE, SIDE_NONE,
+                         np.where(lower >= upper, SIDE_LOWER, SIDE_UPPER)).astype(np.int8)
+        return levels, sides
+
+    def bound_for(self, k: int, level: int, side: int) -> float:
+        if side == SIDE_LOWER:
+            arr = self.lower_red if level == LEVEL_RED else self.lower_yellow
+        else:
+            arr = self.upper_red if level == LEVEL_RED else self.upper_yellow
+        return float(arr[k])
+
+
+# ----------------------------------------------------------------------
+# thresholds.json 전체 → 테이블별 CompiledBounds 캐시
+# ----------------------------------------------------------------------
+class ThresholdEngine:
+    """
+    Qt 에 의존하지 않는 임계값 판정기. Monitering_Ui / DashBoard_Ui 공용.
+
+        engine = ThresholdEngine(thresholds_dict)
+        violations = engine.classify_row(table, col_names, row)
+        levels, sides = engine.classify_block(table, col_names, values_2d)
+    """
+
+    def __init__(self, thresholds: dict = None):
+        self.thresholds = {}
+        self._compiled = {}
+        self.load(thresholds or {})
+
+    def load(self, thresholds: dict):
+        """임계값이 바뀌면 다시 호출 (컴파일 캐시 초기화)"""
+        self.thresholds = thresholds
+        self._compiled.clear()
+
+    def compile(self, table: str, columns) -> CompiledBounds:
+        key = (table, tuple(columns))
+        bounds = self._compiled.get(key)
+        if bounds is None:
+            bounds = CompiledBounds(columns, self.thresholds.get(table, {}))
+            self._compiled[key] = bounds
+        return bounds
+
+    # ---------------------------------------------------------
+    def classify_row(self, table: str, columns, row) -> list:
+        """row 하나 판정 → 위반 컬럼의 Violation 목록 (컬럼 순서)"""
+        bounds = self.compile(table, columns)
+        if row is None or not len(bounds):
+            return []
+
+        # 임계값이 있는 컬럼만 float 변환
+        values = to_float_array([row[i] for i in bounds.index])
+        levels, sides = bounds.classify(values)
+
+        violations = []
+        for k in np.flatnonzero(levels):
+            level, side = int(levels[k]), int(sides[k])
+            violations.append(Violation(
+                bounds.columns[bounds.index[k]], float(values[k]),
+                LEVEL_NAMES[level], SIDE_NAMES[side],
+                bounds.bound_for(k, level, side),
+            ))
+        return violations
+
+    def classify_block(self, table: str, columns, values):
+        """
+        히스토리 블록 판정.
+        values: (n_rows, len(columns)) float 배열 또는 {컬럼: 1차원 배열}
+        반환: (levels, sides) int8 (n_rows, len(columns)) — 임계값 없는 컬럼은 0
+        """
+        bounds = self.compile(table, columns)
+
+        if isinstance(values, dict):
+            n = len(next(iter(values.values()))) if values else 0
+            block = np.column_stack(
+                [np.asarray(values[bounds.columns[i]], dtype=np.float64) for i in bounds.index]
+            ) if len(bounds) else np.empty((n, 0))
+        else:
+            values = np.asarray(values, dtype=np.float64)
+            n = len(values)
+            block = values[:, bounds.index]
+
+        levels = np.zeros((n, len(columns)), dtype=np.int8)
+        sides = np.zeros((n, len(columns)), dtype=np.int8)
+        if len(bounds):
+            levels[:, bounds.index], sides[:, bounds.index] = bounds.classify(block)
+        return levels, sides